@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from gh_project_automation import cli
+from gh_project_automation.fake_server import FakeGitHub, FakeGitHubConfig, synthetic_fields
+from gh_project_automation.project_fields import CANONICAL_FIELDS, fields_to_json
+
+# Drives `cli.main --execute` end to end against the local fake GitHub API and reports
+# throughput and per-call latency. No network or token needed.
+
+
+def write_issues(path: Path, n: int, options_per_field: int) -> None:
+    with path.open("w", encoding="utf-8") as fh:
+        for i in range(n):
+            row = {"title": f"Synthetic issue {i}", "description": f"Body {i}\n" * 4}
+            for issue_key, canonical in CANONICAL_FIELDS.items():
+                row[issue_key] = f"{canonical} {(i * 7 + len(issue_key)) % options_per_field}"
+            fh.write(json.dumps(row) + "\n")
+
+
+def run_once(args: argparse.Namespace, concurrency: int, tmp: Path) -> None:
+    config = FakeGitHubConfig(
+        latency_s=args.latency_ms / 1000,
+        jitter_s=args.jitter_ms / 1000,
+        error_rate=args.error_rate,
+        errors_on_creates=False,
+        max_in_flight=args.server_max_in_flight,
+        latency_per_in_flight_s=args.latency_per_in_flight_ms / 1000,
+        seed=1,
+    )
+    fields = synthetic_fields(args.options)
+    fields_path = tmp / "fields.json"
+    fields_path.write_text(json.dumps(fields_to_json(fields)), encoding="utf-8")
+    metrics_path = tmp / f"metrics-{concurrency}.json"
+
+    with FakeGitHub(config, fields=fields) as server:
+        os.environ.update(
+            {
+                "GITHUB_TOKEN": "bench",
+                "GITHUB_OWNER": "bench",
+                "GITHUB_REPO": "bench",
+                "GITHUB_PROJECT_ID": server.project_id,
+                "GITHUB_API_BASE": server.url,
+            }
+        )
+        argv = [
+            "--issues", str(tmp / "issues.jsonl"),
+            "--fields", str(fields_path),
+            "--execute",
+            "--concurrency", str(concurrency),
+            "--batch-size", str(args.batch_size),
+            "--max-creates-per-minute", "0",
+            "--output", "jsonl",
+            "--metrics-json", str(metrics_path),
+        ]  # fmt: skip
+        if args.stream:
+            argv.append("--stream")
+        if args.adaptive:
+            # the fake server has no cost limit; mutations would trip GitHub's long before
+            argv += ["--adaptive", "--max-graphql-cost-per-minute", "0"]
+        t0 = time.perf_counter()
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            cli.main(argv)
+        dt = time.perf_counter() - t0
+        server_calls = sum(n for op, n in server.calls.items() if op != "error_502")
+        throttled = server.calls["secondary_limited"]
+
+    summary = json.loads(metrics_path.read_text())
+    ops = summary["operations"]
+    client_calls = sum(m.get("count", 0) for m in ops.values())
+    retries = sum(m["retries"] for m in ops.values())
+    print(
+        f"concurrency {concurrency:>3}: {args.issues} issues in {dt:7.2f}s  "
+        f"{args.issues / dt:8.1f} issues/s  {client_calls} API calls "
+        f"({server_calls} served, {throttled} throttled, {retries} retries)"
+    )
+    adaptive = summary.get("adaptive")
+    if adaptive:
+        print(
+            f"    adaptive: settled at {adaptive['concurrency']} "
+            f"(peak {adaptive['peak_concurrency']}), {adaptive['increases']} up / "
+            f"{adaptive['decreases']} down"
+        )
+    for op, m in ops.items():
+        print(
+            f"    {op:<14} {m['count']:>7} calls  p50 {m['p50_s'] * 1000:7.1f} ms  "
+            f"p99 {m['p99_s'] * 1000:7.1f} ms  max {m['max_s'] * 1000:7.1f} ms"
+        )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(description="Benchmark the full import pipeline offline")
+    p.add_argument("--issues", type=int, default=2000, help="Synthetic issues to import")
+    p.add_argument(
+        "--concurrency",
+        default="1,4,16",
+        help="Comma-separated --concurrency values to compare",
+    )
+    p.add_argument("--latency-ms", type=float, default=20.0, help="Fake server latency per call")
+    p.add_argument("--jitter-ms", type=float, default=10.0, help="Extra random latency per call")
+    p.add_argument(
+        "--error-rate", type=float, default=0.0, help="Fraction of injected 502s (not on creates)"
+    )
+    p.add_argument(
+        "--server-max-in-flight",
+        type=int,
+        default=0,
+        help="Fake secondary limit: concurrent requests above this get a 403 (0 = none)",
+    )
+    p.add_argument(
+        "--latency-per-in-flight-ms",
+        type=float,
+        default=0.0,
+        help="Fake queueing: extra latency per concurrent request",
+    )
+    p.add_argument(
+        "--adaptive", action="store_true", help="Pass --adaptive (concurrency is the ceiling)"
+    )
+    p.add_argument("--batch-size", type=int, default=50, help="Passed to --batch-size")
+    p.add_argument("--options", type=int, default=5, help="Options per single-select field")
+    p.add_argument("--stream", action="store_true", help="Pass --stream to the CLI")
+    return p
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp = Path(tmp_dir)
+        write_issues(tmp / "issues.jsonl", args.issues, args.options)
+        for concurrency in (int(c) for c in args.concurrency.split(",")):
+            run_once(args, concurrency, tmp)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
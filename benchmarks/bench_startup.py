@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from bench_validation import synthetic_fields, synthetic_rows
+
+from gh_project_automation.project_fields import fields_to_json
+
+# Wall-clock time of `validate` as a fresh process (interpreter start included), which is what a
+# pre-commit hook pays on every commit. Fails if a heavy client module sneaks into its imports.
+
+HEAVY_MODULES = ("requests", "urllib3", "rich", "dotenv")
+_PROBE = (
+    "import sys\n"
+    "from gh_project_automation import cli\n"
+    "code = cli.main(sys.argv[1:])\n"
+    f"loaded = [m for m in {HEAVY_MODULES!r} if m in sys.modules]\n"
+    "print('HEAVY', ','.join(loaded), file=sys.stderr)\n"
+    "raise SystemExit(code)\n"
+)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(description="Benchmark `validate` startup time")
+    p.add_argument("--runs", type=int, default=10, help="Process launches to time")
+    p.add_argument("--rows", type=int, default=50, help="Rows in the synthetic issues file")
+    p.add_argument(
+        "--budget-ms", type=float, default=None, help="Exit 1 if the median exceeds this"
+    )
+    return p
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    with tempfile.TemporaryDirectory() as tmp:
+        fields = Path(tmp) / "fields.json"
+        fields.write_text(json.dumps(fields_to_json(synthetic_fields(20))), encoding="utf-8")
+        issues = Path(tmp) / "issues.jsonl"
+        with issues.open("w", encoding="utf-8") as fh:
+            for r in synthetic_rows(args.rows, 20):
+                fh.write(json.dumps(r, ensure_ascii=False) + "\n")
+        cmd = [sys.executable, "-c", _PROBE, "validate", "-q", "--fields", str(fields), str(issues)]
+        bare = [sys.executable, "-c", "pass"]
+
+        def _median_ms(argv: list[str]) -> tuple[float, subprocess.CompletedProcess[str]]:
+            times = []
+            for _ in range(args.runs):
+                t0 = time.perf_counter()
+                proc = subprocess.run(argv, capture_output=True, text=True)
+                times.append((time.perf_counter() - t0) * 1000)
+            return statistics.median(times), proc
+
+        interpreter_ms, _ = _median_ms(bare)
+        validate_ms, proc = _median_ms(cmd)
+
+    if proc.returncode != 0:
+        print(proc.stdout + proc.stderr)
+        return 1
+    heavy = next(
+        (line.split(" ", 1)[1] for line in proc.stderr.splitlines() if line.startswith("HEAVY ")),
+        "",
+    )
+    print(f"python -c pass:   {interpreter_ms:7.1f} ms (median of {args.runs})")
+    print(f"validate:         {validate_ms:7.1f} ms (+{validate_ms - interpreter_ms:.1f} ms)")
+    print(f"heavy modules:    {heavy or 'none'}")
+    if heavy:
+        return 1
+    if args.budget_ms is not None and validate_ms > args.budget_ms:
+        print(f"over budget: {validate_ms:.1f} ms > {args.budget_ms:.1f} ms")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
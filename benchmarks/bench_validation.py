@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+from gh_project_automation.project_fields import CANONICAL_FIELDS, FieldMeta
+from gh_project_automation.validator import ValidationPlan, iter_issues
+
+# Benchmarks ValidationPlan on a synthetic input (default 100k rows), both from memory and
+# streamed from a JSON Lines file. No network or token needed.
+
+
+def synthetic_fields(options_per_field: int) -> dict[str, FieldMeta]:
+    return {
+        canonical: FieldMeta(
+            id=f"FIELD_{canonical}",
+            options={
+                f"{canonical} option {i}": f"OPT_{canonical}_{i}" for i in range(options_per_field)
+            },
+        )
+        for canonical in CANONICAL_FIELDS.values()
+    }
+
+
+def synthetic_rows(n: int, options_per_field: int) -> list[dict[str, Any]]:
+    rows = []
+    for i in range(n):
+        row: dict[str, Any] = {"title": f"Synthetic issue {i}", "description": f"Body {i}\n" * 4}
+        for issue_key, canonical in CANONICAL_FIELDS.items():
+            row[issue_key] = f"{canonical} option {(i * 7 + len(issue_key)) % options_per_field}"
+        rows.append(row)
+    return rows
+
+
+def _time(label: str, n: int, fn: Callable[[], int]) -> None:
+    t0 = time.perf_counter()
+    result = fn()
+    dt = time.perf_counter() - t0
+    print(f"{label:<26} {n:>8} rows  {dt:7.3f}s  {n / dt:>12,.0f} rows/s  -> {result}")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(description="Benchmark issue validation throughput")
+    p.add_argument("--rows", type=int, default=100_000, help="Synthetic rows to validate")
+    p.add_argument("--options", type=int, default=20, help="Options per single-select field")
+    return p
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    fields_meta = synthetic_fields(args.options)
+    rows = synthetic_rows(args.rows, args.options)
+
+    t0 = time.perf_counter()
+    ValidationPlan(fields_meta)
+    print(f"compile plan: {(time.perf_counter() - t0) * 1000:.2f} ms")
+
+    plan = ValidationPlan(fields_meta)
+    loose = ValidationPlan(fields_meta, loose=True)
+    _time("validate_all (exact)", args.rows, lambda: len(plan.validate_all(rows).issues))
+    _time("validate_all (loose)", args.rows, lambda: len(loose.validate_all(rows).issues))
+
+    bad = [dict(r, status="nope") if i % 100 == 0 else r for i, r in enumerate(rows)]
+    _time("validate_all (1% errors)", args.rows, lambda: len(plan.validate_all(bad).errors))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "issues.jsonl"
+        with path.open("w", encoding="utf-8") as fh:
+            for r in rows:
+                fh.write(json.dumps(r, ensure_ascii=False) + "\n")
+        _time(
+            "stream jsonl + validate",
+            args.rows,
+            lambda: sum(1 for _ in plan.iter_validated(iter_issues(path))),
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+from typing import Any, Callable
+
+# Ceiling used when --adaptive is given without a --concurrency above one.
+DEFAULT_MAX_CONCURRENCY = 16
+# Successful calls observed before the controller re-evaluates its limits.
+DEFAULT_WINDOW = 20
+# A window whose per-operation p95 exceeds the best p95 seen by this factor counts as congested.
+DEFAULT_LATENCY_TOLERANCE = 2.0
+# Multiplicative decrease on slow or failing windows; a 403/429 throttle halves instead.
+CONGESTION_BACKOFF = 0.75
+THROTTLE_BACKOFF = 0.5
+# The best p95 drifts up this much per window, so a permanently slower API is re-learned.
+BASELINE_DRIFT = 1.05
+# No increases this long after a throttle that came without a Retry-After.
+DEFAULT_COOLDOWN_S = 5.0
+# GitHub's secondary limit for GraphQL is 2,000 points a minute.
+DEFAULT_COST_PER_MINUTE = 2000.0
+# Clean windows required before probing again at a concurrency that was throttled before;
+# doubled every time the probe is throttled again at the same level.
+PROBE_AFTER_WINDOWS = 10
+# Added to the batch size after a clean window (multiplied by two during slow start).
+BATCH_STEP = 5
+MAX_DECISIONS_KEPT = 100
+THROTTLE_STATUSES = frozenset({403, 429})
+# Operations that carry aliased field-update documents (what --batch-size sizes).
+BATCHED_OPS = frozenset({"update_field"})
+
+
+@dataclass(frozen=True)
+class AdaptiveDecision:
+    at_s: float  # since the controller was created
+    concurrency: int
+    batch_size: int
+    reason: str
+
+
+def _p95(values: list[float]) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, math.ceil(0.95 * len(ordered)) - 1)]
+
+
+class AdaptiveController:
+    """AIMD controller for issues in flight and field updates per mutation document.
+
+    Registered as a ``Metrics`` hook, it sees every API call. Starting from one, concurrency
+    doubles after each clean window of ``window`` calls (slow start) until the first sign of
+    congestion, then grows by one per clean window. A 403/429 throttle halves both limits at
+    once and holds growth for ``Retry-After`` (or ``DEFAULT_COOLDOWN_S``); a window with
+    errors, a p95 ``latency_tolerance`` times the best seen for an operation, or GraphQL cost
+    (mutations at their estimated cost) above ``cost_per_minute`` (0: not checked) shrinks
+    concurrency by a quarter. Batch size starts at its maximum, shrinks when update documents
+    fail or throttle, and grows back additively.
+    Time spent pacing for the rate budget holds growth: more concurrency cannot help there.
+    Safe to share across threads; the run loops read ``concurrency`` and ``batch_size``.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_concurrency: int,
+        max_batch_size: int,
+        min_concurrency: int = 1,
+        initial_concurrency: int | None = None,
+        window: int = DEFAULT_WINDOW,
+        latency_tolerance: float = DEFAULT_LATENCY_TOLERANCE,
+        cost_per_minute: float = DEFAULT_COST_PER_MINUTE,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not 1 <= min_concurrency <= max_concurrency:
+            raise ValueError("need 1 <= min_concurrency <= max_concurrency")
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be >= 1")
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.max_batch_size = max_batch_size
+        self.window = max(1, window)
+        self.latency_tolerance = latency_tolerance
+        self.cost_per_minute = cost_per_minute
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._started = clock()
+        start = initial_concurrency if initial_concurrency is not None else min_concurrency
+        self.concurrency = max(min_concurrency, min(max_concurrency, start))
+        self.batch_size = max_batch_size
+        self._slow_start = True
+        self._cooldown_until = 0.0
+        self._episode_until = 0.0
+        self._ceiling: int | None = None  # highest concurrency known not to be throttled
+        self._clean_windows = 0
+        self._probe_after = PROBE_AFTER_WINDOWS
+        self._best_p95: dict[str, float] = {}
+        self._peak = self.concurrency
+        self._counts: dict[str, int] = defaultdict(int)
+        self.decisions: list[AdaptiveDecision] = []
+        self._reset_window_locked(self._started)
+
+    def _reset_window_locked(self, now: float) -> None:
+        self._window_started = now
+        self._latency: dict[str, list[float]] = defaultdict(list)
+        self._calls = 0
+        self._errors = 0
+        self._batch_errors = 0
+        self._cost = 0
+        self._rate_wait_s = 0.0
+
+    # ---- Metrics hook ----
+
+    def observe(self, event: str, data: dict[str, Any]) -> None:
+        """``Metrics`` hook: feed it every observation (``metrics.add_hook(ctl.observe)``)."""
+        with self._lock:
+            now = self._clock()
+            if event == "call":
+                self._observe_call_locked(now, data)
+            elif event == "rate_wait":
+                self._rate_wait_s += float(data.get("seconds") or 0.0)
+            elif event == "graphql_cost":
+                self._cost += int(data.get("cost") or 0)
+
+    def _observe_call_locked(self, now: float, data: dict[str, Any]) -> None:
+        status = data.get("status")
+        op = str(data.get("op") or "")
+        if status in THROTTLE_STATUSES:
+            self._throttled_locked(now, op, data.get("retry_after_s"))
+            return
+        if status == "error" or (isinstance(status, int) and status >= 500):
+            self._errors += 1
+            if op in BATCHED_OPS:
+                self._batch_errors += 1
+            return
+        self._latency[op].append(float(data.get("seconds") or 0.0))
+        self._calls += 1
+        if self._calls >= self.window:
+            self._evaluate_locked(now)
+
+    def _throttled_locked(self, now: float, op: str, retry_after_s: Any) -> None:
+        self._counts["throttled"] += 1
+        hold = float(retry_after_s) if retry_after_s is not None else DEFAULT_COOLDOWN_S
+        if now < self._episode_until:
+            # The rest of a burst rejected together, or requests held back by the pause all
+            # hitting the limit at once when it ends: one decrease per episode.
+            self._cooldown_until = max(self._cooldown_until, now + hold)
+            return
+        self._cooldown_until = now + hold
+        self._episode_until = now + 2 * hold
+        if self._ceiling is not None and self.concurrency > self._ceiling:
+            self._probe_after *= 2  # probing past the known-good level failed again
+        self._ceiling = max(self.min_concurrency, self.concurrency - 1)
+        batch = self.batch_size
+        if op in BATCHED_OPS:
+            batch = max(1, int(batch * THROTTLE_BACKOFF))
+        self._decrease_locked(now, THROTTLE_BACKOFF, batch, f"throttled ({op or 'request'})")
+        self._reset_window_locked(now)
+
+    def _evaluate_locked(self, now: float) -> None:
+        elapsed = max(now - self._window_started, 1e-9)
+        slowest = 0.0
+        for op, values in self._latency.items():
+            if len(values) < 3:
+                continue
+            p95 = _p95(values)
+            best = self._best_p95.get(op)
+            if best is not None and best > 0:
+                slowest = max(slowest, p95 / best)
+            self._best_p95[op] = p95 if best is None else min(p95, best * BASELINE_DRIFT)
+        cost_rate = self._cost * 60.0 / elapsed
+
+        if self._errors:
+            batch = self.batch_size
+            if self._batch_errors:
+                batch = max(1, int(batch * THROTTLE_BACKOFF))
+            self._decrease_locked(now, CONGESTION_BACKOFF, batch, f"{self._errors} error(s)")
+        elif slowest > self.latency_tolerance:
+            self._decrease_locked(
+                now, CONGESTION_BACKOFF, self.batch_size, f"p95 {slowest:.1f}x best"
+            )
+        elif self.cost_per_minute and cost_rate > self.cost_per_minute:
+            self._decrease_locked(
+                now, CONGESTION_BACKOFF, self.batch_size, f"GraphQL cost {cost_rate:.0f}/min"
+            )
+        elif now >= self._cooldown_until and self._rate_wait_s < elapsed / 2:
+            self._clean_windows += 1
+            self._increase_locked(now)
+        self._reset_window_locked(now)
+
+    def _increase_locked(self, now: float) -> None:
+        if self._slow_start:
+            concurrency = self.concurrency * 2
+            batch = self.batch_size + 2 * BATCH_STEP
+        else:
+            concurrency = self.concurrency + 1
+            batch = self.batch_size + BATCH_STEP
+            if self._ceiling is not None and concurrency > self._ceiling:
+                # at or past the last throttled level: stay a while before probing further
+                if self._clean_windows < self._probe_after:
+                    concurrency = self.concurrency
+                else:
+                    self._ceiling = self.concurrency
+        concurrency = min(self.max_concurrency, concurrency)
+        batch = min(self.max_batch_size, batch)
+        if (concurrency, batch) != (self.concurrency, self.batch_size):
+            self._counts["increases"] += 1
+            reason = "slow start" if self._slow_start else "clean window"
+            self._set_locked(now, concurrency, batch, reason)
+
+    def _decrease_locked(self, now: float, factor: float, batch: int, reason: str) -> None:
+        self._slow_start = False
+        concurrency = max(self.min_concurrency, int(self.concurrency * factor))
+        if (concurrency, batch) != (self.concurrency, self.batch_size):
+            self._counts["decreases"] += 1
+            self._set_locked(now, concurrency, batch, reason)
+
+    def _set_locked(self, now: float, concurrency: int, batch: int, reason: str) -> None:
+        if concurrency != self.concurrency:
+            self._clean_windows = 0
+        self.concurrency = concurrency
+        self.batch_size = batch
+        self._peak = max(self._peak, concurrency)
+        self.decisions.append(
+            AdaptiveDecision(round(now - self._started, 3), concurrency, batch, reason)
+        )
+        del self.decisions[:-MAX_DECISIONS_KEPT]
+
+    def summary(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "concurrency": self.concurrency,
+                "peak_concurrency": self._peak,
+                "max_concurrency": self.max_concurrency,
+                "batch_size": self.batch_size,
+                "increases": self._counts["increases"],
+                "decreases": self._counts["decreases"],
+                "throttled": self._counts["throttled"],
+                "decisions": [asdict(d) for d in self.decisions],
+            }
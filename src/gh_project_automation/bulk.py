@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Iterable, Sequence
+
+from .project_fields import FieldMeta
+from .project_item_manager import (
+    DEFAULT_ITEMS_PAGE_SIZE,
+    FieldUpdate,
+    FieldUpdateResult,
+    ProjectItem,
+    ProjectItemManager,
+)
+from .reporter import Reporter, RichReporter
+from .utils import ValidationError
+from .validator import ResolvedField, find_field, resolve_field_value
+
+if TYPE_CHECKING:
+    from .adaptive import AdaptiveController
+
+# Separates alternatives in a --where value: "Status=Backlog|Todo".
+ANY_OF_SEPARATOR = "|"
+# Dry runs list this many matching items; the rest are only counted.
+DRY_RUN_LISTED = 20
+
+
+@dataclass(frozen=True)
+class ItemFilter:
+    field_id: str
+    field_name: str
+    values: frozenset[str | float | None]  # None matches items where the field is unset
+
+    def matches(self, item: ProjectItem) -> bool:
+        return item.field_values.get(self.field_id) in self.values
+
+
+def _split_spec(spec: str) -> tuple[str, str]:
+    name, sep, value = spec.partition("=")
+    if not sep or not name.strip():
+        raise ValidationError(f"Expected FIELD=VALUE, got '{spec}'")
+    return name, value
+
+
+def parse_filter(
+    spec: str, fields_meta: dict[str, FieldMeta], *, loose: bool = False
+) -> ItemFilter:
+    """``Field=Value`` (or ``Field=A|B``, or ``Field=`` for unset) into an item filter."""
+    name, raw = _split_spec(spec)
+    field_name, meta = find_field(fields_meta, name)
+    values: set[str | float | None] = set()
+    for alt in raw.split(ANY_OF_SEPARATOR):
+        if not alt.strip():
+            values.add(None)
+        else:
+            values.add(resolve_field_value(fields_meta, field_name, alt, loose=loose).value)
+    return ItemFilter(field_id=meta.id, field_name=field_name, values=frozenset(values))
+
+
+def parse_change(
+    spec: str, fields_meta: dict[str, FieldMeta], *, loose: bool = False
+) -> ResolvedField:
+    name, value = _split_spec(spec)
+    return resolve_field_value(fields_meta, name, value, loose=loose)
+
+
+def plan_item_updates(item: ProjectItem, changes: Sequence[ResolvedField]) -> list[FieldUpdate]:
+    """Updates needed to apply ``changes`` to ``item``; values already in place are skipped."""
+    return [
+        FieldUpdate(
+            item_id=item.id,
+            field_id=rf.field_id,
+            value=rf.value,
+            field_name=rf.field_name,
+            data_type=rf.data_type,
+        )
+        for rf in changes
+        if item.field_values.get(rf.field_id) != rf.value
+    ]
+
+
+class UpdateBatcher:
+    """Packs field updates from consecutive items into full aliased mutation documents.
+
+    Up to ``concurrency`` documents are in flight at once, so callers can keep reading item
+    pages while earlier updates are applied. Use as a context manager: leaving the block sends
+    what is still buffered (unless an exception is propagating) and waits for every document.
+    """
+
+    def __init__(
+        self,
+        pim: ProjectItemManager,
+        *,
+        concurrency: int = 1,
+        reporter: Reporter,
+        controller: AdaptiveController | None = None,
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+        self.pim = pim
+        self.concurrency = concurrency
+        self.controller = controller
+        self.reporter = reporter
+        self.updates_ok = 0
+        self.failed: list[FieldUpdateResult] = []
+        self._buffer: list[FieldUpdate] = []
+        self._pending: set[Future[list[FieldUpdateResult]]] = set()
+        self._executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="bulk")
+
+    def __enter__(self) -> UpdateBatcher:
+        return self
+
+    def __exit__(self, exc_type: object, *exc: object) -> None:
+        try:
+            if exc_type is None and self._buffer:
+                self._submit(self._buffer)
+                self._buffer = []
+        finally:
+            # Also reached when paging fails: let mutations already sent finish and count them.
+            done, _ = wait(self._pending)
+            try:
+                self._collect(done)  # re-raises a document that failed as a whole
+            finally:
+                self._executor.shutdown()
+
+    def _limit(self) -> int:
+        if self.controller is None:
+            return self.concurrency
+        return min(self.concurrency, self.controller.concurrency)
+
+    def add(self, updates: Iterable[FieldUpdate]) -> None:
+        if self.controller is not None:
+            self.pim.max_batch_size = self.controller.batch_size
+        self._buffer.extend(updates)
+        if len(self._buffer) >= self.pim.max_batch_size:
+            self._submit(self._buffer)
+            self._buffer = []
+
+    def _collect(self, done: Iterable[Future[list[FieldUpdateResult]]]) -> None:
+        for fut in done:
+            results = fut.result()
+            failed = [r for r in results if not r.ok]
+            self.updates_ok += len(results) - len(failed)
+            self.failed.extend(failed)
+            for r in failed:
+                self.reporter.event(
+                    "update_failed",
+                    item_id=r.update.item_id,
+                    field=r.update.field_name,
+                    error=r.error,
+                )
+            self.reporter.event("batch_done", updates=len(results), failed=len(failed))
+
+    def _submit(self, batch: list[FieldUpdate]) -> None:
+        while len(self._pending) >= self._limit():
+            done, _ = wait(self._pending, return_when=FIRST_COMPLETED)
+            self._pending.difference_update(done)
+            self._collect(done)
+        self._pending.add(self._executor.submit(self.pim.set_fields_batch, batch, execute=True))
+
+
+@dataclass
+class BulkUpdateResult:
+    scanned: int = 0
+    matched: int = 0
+    unchanged: int = 0  # matched, but every requested value was already set
+    updated_items: int = 0
+    updates_ok: int = 0
+    failed: list[FieldUpdateResult] = field(default_factory=list)
+
+
+def run_bulk_update(
+    pim: ProjectItemManager,
+    *,
+    filters: Iterable[ItemFilter],
+    changes: Sequence[ResolvedField],
+    execute: bool,
+    concurrency: int = 1,
+    page_size: int = DEFAULT_ITEMS_PAGE_SIZE,
+    limit: int | None = None,
+    reporter: Reporter | None = None,
+    controller: AdaptiveController | None = None,
+) -> BulkUpdateResult:
+    """Page through the project's items and apply ``changes`` to those matching every filter.
+
+    Updates from consecutive items are packed into full aliased mutation documents, and up to
+    ``concurrency`` documents are in flight while the next item pages are still being read.
+    """
+    filters = list(filters)
+    reporter = reporter or RichReporter()
+    result = BulkUpdateResult()
+    labels = {rf.field_id: rf.label for rf in changes}
+
+    with UpdateBatcher(
+        pim, concurrency=concurrency, reporter=reporter, controller=controller
+    ) as batcher:
+        for item in pim.iter_items(page_size=page_size):
+            result.scanned += 1
+            if not all(f.matches(item) for f in filters):
+                continue
+            result.matched += 1
+            updates = plan_item_updates(item, changes)
+            if not updates:
+                result.unchanged += 1
+                continue
+            if limit is not None and result.updated_items >= limit:
+                break
+            result.updated_items += 1
+            if not execute:
+                if result.updated_items <= DRY_RUN_LISTED:
+                    label = item.url or item.title or item.id
+                    changed = ", ".join(
+                        f"{u.field_name} -> {labels[u.field_id]}" for u in updates
+                    )
+                    reporter.log(f"[yellow]DRY-RUN[/yellow] would update {label}: {changed}")
+                continue
+            batcher.add(updates)
+    result.updates_ok = batcher.updates_ok
+    result.failed = batcher.failed
+    if not execute and result.updated_items > DRY_RUN_LISTED:
+        reporter.log(f"... and {result.updated_items - DRY_RUN_LISTED} more item(s)")
+    return result
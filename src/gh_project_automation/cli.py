@@ -2,79 +2,1182 @@ from __future__ import annotations
 
 import argparse
 import sys
+from contextlib import contextmanager
+from dataclasses import dataclass
+from itertools import islice
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator
 
-from .config import load_config
-from .github_rest import GitHubREST
-from .graphql_client import GraphQLClient
-from .issue_creator import IssueCreator
-from .project_fields import load_fields_json, get_canonical_field_name
-from .project_item_manager import ProjectItemManager
-from .utils import ApiError, ValidationError, console
-from .validator import load_issues, validate_issues, print_dry_run_preview
+from .metrics import Metrics
+from .ratelimit import DEFAULT_CREATES_PER_MINUTE, TokenPool
+from .reporter import DEFAULT_PREVIEW_ROWS, OUTPUT_MODES, Reporter, make_reporter
+from .utils import ApiError, ValidationError
+from .validator import ValidatedIssue, iter_issues
+
+# Client modules (requests, dotenv, ...) are imported inside the commands that use them, so
+# offline commands such as `validate` start without loading them.
+if TYPE_CHECKING:
+    from .adaptive import AdaptiveController
+    from .config import Config
+    from .github_rest import GitHubREST
+    from .graphql_client import GraphQLClient
+    from .http_cache import HttpCache
+    from .project_fields import FieldsCache
+    from .repo_index import RepoIndex
+    from .transport import HttpTransport
+
+PROG = "gh_project_automation"
+
+
+def _add_common_args(
+    p: argparse.ArgumentParser, *, mutates: bool = True, fields: bool = True
+) -> None:
+    """Flags shared by every command: metadata cache, safety, connection and output."""
+    from .http_cache import DEFAULT_MAX_BYTES
+    from .project_item_manager import DEFAULT_MAX_BATCH_SIZE
+    from .retry_policy import DEFAULT_FAILURE_THRESHOLD
+    from .transport import DEFAULT_POOL_MAXSIZE
+
+    if fields:
+        p.add_argument("--fields", required=True, help="Path to fields metadata JSON (cache)")
+    if mutates:
+        p.add_argument("--dry-run", action="store_true", help="Do not mutate (default)")
+        p.add_argument("--execute", action="store_true", help="Perform real API mutations")
+        p.add_argument(
+            "--batch-size",
+            type=int,
+            default=DEFAULT_MAX_BATCH_SIZE,
+            help="Max field updates per GraphQL mutation document",
+        )
+    p.add_argument(
+        "--pool-size",
+        type=int,
+        default=DEFAULT_POOL_MAXSIZE,
+        help="Max keep-alive connections kept open to the GitHub API",
+    )
+    p.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Requests in flight at once (for imports: issues processed in parallel)",
+    )
+    p.add_argument(
+        "--circuit-threshold",
+        type=int,
+        default=DEFAULT_FAILURE_THRESHOLD,
+        help="Pause the run after this many consecutive 5xx/connection failures, give up if "
+        "the API stays down (0 disables)",
+    )
+    p.add_argument(
+        "--loose-match",
+        action="store_true",
+        help="Match field values ignoring case and repeated whitespace",
+    )
+    p.add_argument(
+        "--fields-ttl",
+        type=float,
+        default=None,
+        help="Refetch --fields metadata from the project when older than this many seconds",
+    )
+    p.add_argument(
+        "--no-refresh-fields",
+        dest="refresh_fields",
+        action="store_false",
+        help="Never refetch --fields metadata (by default: once per run on an unknown value)",
+    )
+    p.add_argument(
+        "--http-cache",
+        default=None,
+        metavar="DIR",
+        help="Cache REST GET responses here and revalidate them with ETags on later runs",
+    )
+    p.add_argument(
+        "--http-cache-mb",
+        type=float,
+        default=DEFAULT_MAX_BYTES / 2**20,
+        help="Size limit of --http-cache; least recently used entries are evicted",
+    )
+    p.add_argument(
+        "--output",
+        choices=OUTPUT_MODES,
+        default="rich",
+        help="rich: per-step log; jsonl: buffered JSON events on stdout; progress: one bar",
+    )
+    p.add_argument(
+        "--metrics-json",
+        default=None,
+        help="Write per-operation latency/retry/bytes/cost metrics as JSON at the end of the run",
+    )
+    p.add_argument(
+        "--metrics-prom",
+        default=None,
+        help="Write the same metrics as a Prometheus textfile (node_exporter textfile collector)",
+    )
+
+
+def _add_adaptive_arg(p: argparse.ArgumentParser) -> None:
+    p.add_argument(
+        "--adaptive",
+        action="store_true",
+        help="Tune concurrency and batch size during the run from observed latency, errors and "
+        "throttling; --concurrency/--batch-size become ceilings",
+    )
+    p.add_argument(
+        "--max-graphql-cost-per-minute",
+        type=float,
+        default=None,
+        help="With --adaptive, shrink concurrency when GraphQL cost goes above this many points "
+        "a minute (default: GitHub's secondary limit, 2000; 0 to not check)",
+    )
+
+
+def _add_repo_index_arg(p: argparse.ArgumentParser) -> None:
+    p.add_argument(
+        "--repo-index",
+        default=None,
+        metavar="PATH",
+        help="Cache the repository's labels, milestones and assignable users here (fetched "
+        "once, when an issue first names one; follows --fields-ttl/--no-refresh-fields)",
+    )
 
 
 def build_parser() -> argparse.ArgumentParser:
+    from .dedupe import DUPLICATE_MODES
+    from .issue_creator import CREATE_MODES
+
+    others = [c for c in [*COMMANDS, *OFFLINE_COMMANDS] if c != "import"]
     p = argparse.ArgumentParser(
-        prog="gh_project_automation",
-        description="Create GitHub issues and set GitHub Project v2 fields from JSON.",
+        prog=PROG,
+        description="Create GitHub issues and set GitHub Project v2 fields from JSON. "
+        f"Other commands: {', '.join(others)} "
+        f"(see `{PROG} <command> --help`).",
     )
-    p.add_argument("--issues", required=True, help="Path to issues JSON file")
-    p.add_argument("--fields", required=True, help="Path to fields metadata JSON")
+    p.add_argument("--issues", required=True, help="Path to issues JSON or JSON Lines file")
     p.add_argument("--limit", type=int, default=None, help="Process only N issues")
-    p.add_argument("--dry-run", action="store_true", help="Do not mutate (default)")
-    p.add_argument("--execute", action="store_true", help="Perform real API mutations")
+    p.add_argument(
+        "--max-creates-per-minute",
+        type=int,
+        default=DEFAULT_CREATES_PER_MINUTE,
+        help="Pace issue creation below GitHub's secondary limit (0 disables)",
+    )
+    p.add_argument(
+        "--journal",
+        default=None,
+        help="Append per-issue progress to this JSONL file (enables --resume after a crash)",
+    )
+    p.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip work already recorded in --journal and continue partially done issues",
+    )
+    p.add_argument(
+        "--dedupe-index",
+        default=None,
+        help="Cache of existing repo issues (by title/body hash); refreshed incrementally each run",
+    )
+    p.add_argument(
+        "--on-duplicate",
+        choices=DUPLICATE_MODES,
+        default="skip",
+        help="With --dedupe-index: skip duplicates, or link them (add existing issue to project)",
+    )
+    p.add_argument(
+        "--create-via",
+        choices=CREATE_MODES,
+        default="rest",
+        help="graphql: create each issue and add it to the project in one request "
+        "(falls back to rest when unavailable); rest: POST /issues, then add it",
+    )
+    p.add_argument(
+        "--stream",
+        action="store_true",
+        help="Validate lazily and start executing before the whole file is read (no preview)",
+    )
+    p.add_argument(
+        "--preview-rows",
+        type=int,
+        default=DEFAULT_PREVIEW_ROWS,
+        help="Rows shown in the dry-run preview table; the rest are summarized (0 = all)",
+    )
+    _add_repo_index_arg(p)
+    _add_adaptive_arg(p)
+    _add_common_args(p)
     return p
 
 
-def main(argv: list[str] | None = None) -> int:
-    args = build_parser().parse_args(argv)
+def build_bulk_update_parser() -> argparse.ArgumentParser:
+    from .project_item_manager import DEFAULT_ITEMS_PAGE_SIZE
+
+    p = argparse.ArgumentParser(
+        prog=f"{PROG} bulk-update",
+        description="Set field values on existing project items selected by their field values.",
+    )
+    p.add_argument(
+        "--where",
+        action="append",
+        default=[],
+        metavar="FIELD=VALUE",
+        help="Select items whose FIELD has VALUE (A|B for any of, empty for unset); repeatable, "
+        "all must match. Without --where every item is selected",
+    )
+    p.add_argument(
+        "--set",
+        dest="changes",
+        action="append",
+        required=True,
+        metavar="FIELD=VALUE",
+        help="Value to set on every selected item; repeatable",
+    )
+    p.add_argument("--limit", type=int, default=None, help="Update at most N items")
+    p.add_argument(
+        "--page-size",
+        type=int,
+        default=DEFAULT_ITEMS_PAGE_SIZE,
+        help="Project items fetched per request (max 100)",
+    )
+    _add_adaptive_arg(p)
+    _add_common_args(p)
+    return p
+
+
+def build_reconcile_parser() -> argparse.ArgumentParser:
+    from .project_item_manager import DEFAULT_ITEMS_PAGE_SIZE
+
+    p = argparse.ArgumentParser(
+        prog=f"{PROG} reconcile",
+        description="Make the field values of existing project items match an issues file, "
+        "updating only the values that differ. Items are matched to issues by title.",
+    )
+    p.add_argument("--issues", required=True, help="Path to issues JSON or JSON Lines file")
+    p.add_argument(
+        "--page-size",
+        type=int,
+        default=DEFAULT_ITEMS_PAGE_SIZE,
+        help="Project items fetched per request (max 100)",
+    )
+    _add_adaptive_arg(p)
+    _add_common_args(p)
+    return p
+
+
+def build_export_parser() -> argparse.ArgumentParser:
+    from .project_item_manager import DEFAULT_ITEMS_PAGE_SIZE
+
+    p = argparse.ArgumentParser(
+        prog=f"{PROG} export",
+        description="Export every project item and its field values to a JSONL snapshot. "
+        "Re-running against an existing snapshot fetches only items changed since then.",
+    )
+    p.add_argument("--out", required=True, help="Snapshot file (JSON Lines, one item per line)")
+    p.add_argument(
+        "--table",
+        default=None,
+        help="Also write the snapshot as a flat table, one column per field (.csv or .parquet)",
+    )
+    p.add_argument(
+        "--full",
+        action="store_true",
+        help="Refetch every item instead of merging changes into the existing snapshot",
+    )
+    p.add_argument(
+        "--page-size",
+        type=int,
+        default=DEFAULT_ITEMS_PAGE_SIZE,
+        help="Project items fetched per request (max 100)",
+    )
+    _add_common_args(p, mutates=False)
+    return p
+
+
+def build_load_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(
+        prog=f"{PROG} load",
+        description="Validate an issues file and add it to a work queue that any number of "
+        "`work` processes drain together. Issues already in the queue are not added again.",
+    )
+    p.add_argument("--issues", required=True, help="Path to issues JSON or JSON Lines file")
+    p.add_argument("--queue", required=True, help="Work queue database (SQLite file)")
+    p.add_argument("--limit", type=int, default=None, help="Queue only the first N issues")
+    _add_repo_index_arg(p)
+    _add_common_args(p, mutates=False)
+    return p
+
+
+def build_work_parser() -> argparse.ArgumentParser:
+    from .issue_creator import CREATE_MODES
+    from .work_queue import DEFAULT_CLAIM_SIZE, DEFAULT_LEASE_S, DEFAULT_MAX_ATTEMPTS
+
+    p = argparse.ArgumentParser(
+        prog=f"{PROG} work",
+        description="Process issues from a work queue filled by `load`, alongside any other "
+        "workers on the same queue. Exits when nothing is left to claim.",
+    )
+    p.add_argument("--queue", required=True, help="Work queue database (SQLite file)")
+    p.add_argument(
+        "--claim-size",
+        type=int,
+        default=DEFAULT_CLAIM_SIZE,
+        help="Issues claimed from the queue at a time",
+    )
+    p.add_argument(
+        "--lease-s",
+        type=float,
+        default=DEFAULT_LEASE_S,
+        help="Seconds without recorded progress after which other workers may take an issue",
+    )
+    p.add_argument(
+        "--max-attempts",
+        type=int,
+        default=DEFAULT_MAX_ATTEMPTS,
+        help="Times a failed issue is claimed again before it is left alone",
+    )
+    p.add_argument(
+        "--worker-id",
+        default="",
+        help="Name of this worker in the queue (default: host:pid)",
+    )
+    p.add_argument(
+        "--max-creates-per-minute",
+        type=int,
+        default=DEFAULT_CREATES_PER_MINUTE,
+        help="Pace issue creation below GitHub's secondary limit (0 disables); per worker",
+    )
+    p.add_argument(
+        "--create-via",
+        choices=CREATE_MODES,
+        default="rest",
+        help="graphql: create each issue and add it to the project in one request "
+        "(falls back to rest when unavailable); rest: POST /issues, then add it",
+    )
+    _add_adaptive_arg(p)
+    _add_common_args(p)
+    return p
+
+
+def build_serve_parser() -> argparse.ArgumentParser:
+    from .issue_creator import CREATE_MODES
+    from .service import DEFAULT_POLL_S
+
+    p = argparse.ArgumentParser(
+        prog=f"{PROG} serve",
+        description="Keep clients, connections and field metadata warm and import issue batches "
+        "as they arrive: files dropped into a spool directory and/or POST /batches on a local "
+        "HTTP endpoint (results stream back as JSON lines).",
+    )
+    p.add_argument("--spool", default=None, metavar="DIR", help="Watch DIR for batch files")
+    p.add_argument(
+        "--listen",
+        default=None,
+        metavar="[HOST:]PORT",
+        help="Serve POST /batches, GET /health and GET /metrics here (host: 127.0.0.1)",
+    )
+    p.add_argument(
+        "--poll-s", type=float, default=DEFAULT_POLL_S, help="Seconds between spool scans"
+    )
+    p.add_argument(
+        "--once",
+        action="store_true",
+        help="Work through the spool once and exit (for cron or CI)",
+    )
+    p.add_argument(
+        "--max-creates-per-minute",
+        type=int,
+        default=DEFAULT_CREATES_PER_MINUTE,
+        help="Pace issue creation below GitHub's secondary limit (0 disables)",
+    )
+    p.add_argument(
+        "--create-via",
+        choices=CREATE_MODES,
+        default="rest",
+        help="graphql: create each issue and add it to the project in one request "
+        "(falls back to rest when unavailable); rest: POST /issues, then add it",
+    )
+    _add_repo_index_arg(p)
+    _add_adaptive_arg(p)
+    _add_common_args(p)
+    return p
+
+
+def build_manifest_parser() -> argparse.ArgumentParser:
+    from .dedupe import DUPLICATE_MODES
+    from .issue_creator import CREATE_MODES
+    from .manifest import DEFAULT_PARALLEL_TARGETS
+
+    p = argparse.ArgumentParser(
+        prog=f"{PROG} manifest",
+        description="Import issues into many repos/projects in one run, as listed in a manifest "
+        "(JSON: {\"defaults\": {...}, \"targets\": [{\"repo\", \"project_id\", \"issues\", "
+        "\"fields\", optional \"name\", \"journal\", \"dedupe_index\"}, ...]}). "
+        "Only GITHUB_TOKEN is read from the environment.",
+    )
+    p.add_argument("--manifest", required=True, help="Path to the manifest JSON file")
+    p.add_argument(
+        "--parallel-targets",
+        type=int,
+        default=DEFAULT_PARALLEL_TARGETS,
+        help="Targets processed at the same time",
+    )
+    p.add_argument(
+        "--max-in-flight",
+        type=int,
+        default=None,
+        help="Cap on API requests in flight across all targets (default: --concurrency)",
+    )
+    p.add_argument(
+        "--max-creates-per-minute",
+        type=int,
+        default=DEFAULT_CREATES_PER_MINUTE,
+        help="Pace issue creation per token (0 disables); shared by all targets",
+    )
+    p.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue targets from their journals (see the 'journal' manifest key)",
+    )
+    p.add_argument(
+        "--on-duplicate",
+        choices=DUPLICATE_MODES,
+        default="skip",
+        help="For targets with a dedupe index: skip duplicates, or link them",
+    )
+    p.add_argument(
+        "--create-via",
+        choices=CREATE_MODES,
+        default="rest",
+        help="graphql: create each issue and add it to the project in one request "
+        "(falls back to rest when unavailable); rest: POST /issues, then add it",
+    )
+    p.add_argument(
+        "--preview-rows",
+        type=int,
+        default=DEFAULT_PREVIEW_ROWS,
+        help="Rows shown in each target's dry-run preview table (0 = all)",
+    )
+    _add_common_args(p, fields=False)
+    return p
+
+
+@dataclass(frozen=True)
+class _Session:
+    cfg: Config
+    transport: HttpTransport
+    rest: GitHubREST
+    gql: GraphQLClient
+    fields_cache: FieldsCache
+    repo_index: RepoIndex
 
+
+def _execute_requested(args: argparse.Namespace, reporter: Reporter) -> bool:
     # Safety: default to dry-run unless --execute
     execute = bool(args.execute) and not bool(args.dry_run)
     if not execute:
-        console.print("[yellow]Running in DRY-RUN mode (no mutations). Use --execute to apply changes.[/yellow]")
+        reporter.message(
+            "[yellow]Running in DRY-RUN mode (no mutations). "
+            "Use --execute to apply changes.[/yellow]"
+        )
+    return execute
+
+
+def _http_cache(args: argparse.Namespace) -> HttpCache | None:
+    from .http_cache import HttpCache
+
+    if not args.http_cache:
+        return None
+    return HttpCache(args.http_cache, max_bytes=int(args.http_cache_mb * 2**20))
+
+
+def _adaptive(args: argparse.Namespace, metrics: Metrics) -> AdaptiveController | None:
+    """With ``--adaptive``, a controller fed by ``metrics`` and reported in its summary."""
+    from .adaptive import DEFAULT_COST_PER_MINUTE, DEFAULT_MAX_CONCURRENCY, AdaptiveController
+
+    if not args.adaptive:
+        return None
+    if args.concurrency == 1:
+        args.concurrency = DEFAULT_MAX_CONCURRENCY
+    cost = args.max_graphql_cost_per_minute
+    controller = AdaptiveController(
+        max_concurrency=args.concurrency,
+        max_batch_size=args.batch_size,
+        cost_per_minute=DEFAULT_COST_PER_MINUTE if cost is None else cost,
+    )
+    metrics.add_hook(controller.observe)
+    metrics.add_section("adaptive", controller.summary)
+    return controller
+
+
+@contextmanager
+def _open_session(
+    args: argparse.Namespace,
+    reporter: Reporter,
+    metrics: Metrics,
+    *,
+    creates_per_minute: int = DEFAULT_CREATES_PER_MINUTE,
+) -> Iterator[_Session]:
+    from .config import load_config
+    from .github_rest import GitHubREST
+    from .graphql_client import GraphQLClient
+    from .project_fields import FieldsCache
+    from .repo_index import RepoIndex
+    from .retry_policy import CircuitBreaker
+    from .transport import HttpTransport
 
     cfg = load_config()
 
-    fields_meta = load_fields_json(args.fields)
-    issues_raw = load_issues(args.issues)
-    if args.limit:
-        issues_raw = issues_raw[: args.limit]
+    # every in-flight request needs its own keep-alive connection
+    pool_size = max(args.pool_size, args.concurrency)
+    tokens = TokenPool(cfg.all_tokens, creates_per_minute=creates_per_minute)
+    with HttpTransport(
+        api_base=cfg.api_base,
+        pool_maxsize=pool_size,
+        metrics=metrics,
+        tokens=tokens,
+        cache=_http_cache(args),
+        breaker=CircuitBreaker(failure_threshold=args.circuit_threshold),
+    ) as transport:
+        gql = GraphQLClient(transport)
+        fields_cache = FieldsCache(
+            args.fields,
+            gql=gql if args.refresh_fields else None,
+            project_id=cfg.project_id,
+            ttl_s=args.fields_ttl,
+        )
+        if fields_cache.ensure_fresh():
+            reporter.message(f"Fetched fields metadata into {args.fields}")
+        # commands without --repo-index keep it for the run; it is only fetched when needed
+        repo_index = RepoIndex(
+            getattr(args, "repo_index", None),
+            owner=cfg.owner,
+            repo=cfg.repo,
+            gql=gql if args.refresh_fields else None,
+            ttl_s=args.fields_ttl,
+        )
+        if repo_index.ensure_fresh():
+            reporter.message(f"Fetched repository index into {args.repo_index}")
+
+        yield _Session(
+            cfg=cfg,
+            transport=transport,
+            rest=GitHubREST(transport),
+            gql=gql,
+            fields_cache=fields_cache,
+            repo_index=repo_index,
+        )
+        if fields_cache.refreshed:
+            reporter.message(f"[dim]Fields metadata refreshed ({fields_cache.fingerprint})[/dim]")
+        if repo_index.refreshed and not repo_index.refresh_error:
+            reporter.message(f"[dim]Repository index fetched ({len(repo_index)} names)[/dim]")
+
+    _report_budget(tokens, reporter)
+
+
+def _report_budget(tokens: TokenPool, reporter: Reporter) -> None:
+    for i, budget in enumerate(tokens.budgets):
+        who = f" ({tokens.label(i)})" if len(tokens) > 1 else ""
+        for snap in budget.snapshots():
+            if snap.remaining is not None:
+                reporter.message(
+                    f"[dim]Rate budget {snap.resource}{who}: "
+                    f"{snap.remaining}/{snap.limit} left[/dim]"
+                )
+
+
+def _validate_file(
+    args: argparse.Namespace,
+    issues_raw: Iterable[dict],
+    fields_cache: FieldsCache,
+    reporter: Reporter,
+    repo_index: RepoIndex | None = None,
+) -> list[ValidatedIssue]:
+    from .validator import validate_with_cache
+
+    _, report = validate_with_cache(
+        list(issues_raw), fields_cache, loose=args.loose_match, repo_index=repo_index
+    )
+    refresh_error = fields_cache.refresh_error
+    if refresh_error:
+        reporter.message(f"[yellow]Fields refresh failed[/yellow]: {refresh_error}")
+    if repo_index is not None and repo_index.refresh_error:
+        reporter.message(
+            f"[yellow]Repository index refresh failed[/yellow]: {repo_index.refresh_error}"
+        )
+    if not report.ok:
+        for err in report.errors:
+            reporter.message(f"[red]Invalid[/red] {err}")
+        raise ValidationError(f"{len(report.errors)} validation error(s) in {args.issues}")
+    return report.issues
+
+
+def _run_import(args: argparse.Namespace, reporter: Reporter, metrics: Metrics) -> int:
+    from .dedupe import DedupeIndex
+    from .engine import IssuePipeline, run_pipeline
+    from .issue_creator import IssueCreator
+    from .journal import open_journal
+    from .project_item_manager import ProjectItemManager
+    from .validator import iter_validated_with_cache
+
+    if args.resume and not args.journal:
+        raise ValidationError("--resume requires --journal")
+    execute = _execute_requested(args, reporter)
+    controller = _adaptive(args, metrics)
+
+    with _open_session(
+        args, reporter, metrics, creates_per_minute=args.max_creates_per_minute
+    ) as session:
+        cfg, rest, gql, fields_cache = session.cfg, session.rest, session.gql, session.fields_cache
+
+        # --limit stops reading the file once N records have been taken
+        issues_raw = islice(iter_issues(args.issues), args.limit or None)
+
+        validated: Iterable[ValidatedIssue]
+        total: int | None
+        if args.stream:
+            validated = iter_validated_with_cache(
+                issues_raw, fields_cache, loose=args.loose_match, repo_index=session.repo_index
+            )
+            total = args.limit
+        else:
+            validated = _validate_file(
+                args, issues_raw, fields_cache, reporter, repo_index=session.repo_index
+            )
+            total = len(validated)
+            reporter.preview(validated, limit=args.limit)
+
+        dedupe = None
+        if args.dedupe_index:
+            dedupe = DedupeIndex(args.dedupe_index, owner=cfg.owner, repo=cfg.repo)
+            fetched = dedupe.refresh(rest)
+            dedupe.save()
+            reporter.message(f"Dedupe index: {len(dedupe)} issue(s), {fetched} refreshed")
+
+        quiet = args.concurrency > 1
+        creator = IssueCreator(
+            rest,
+            owner=cfg.owner,
+            repo=cfg.repo,
+            quiet=quiet,
+            dedupe=dedupe,
+            reporter=reporter,
+            gql=gql,
+            project_id=cfg.project_id,
+            via=args.create_via,
+        )
+        pim = ProjectItemManager(
+            gql,
+            project_id=cfg.project_id,
+            max_batch_size=args.batch_size,
+            quiet=quiet,
+            reporter=reporter,
+        )
+        journal = open_journal(args.journal, resume=args.resume) if args.journal else None
+        if journal is not None and args.resume:
+            reporter.message(f"Resuming from {args.journal} ({len(journal)} issue(s) recorded)")
+        pipeline = IssuePipeline(
+            creator=creator,
+            pim=pim,
+            execute=execute,
+            journal=journal,
+            on_duplicate=args.on_duplicate,
+        )
+        try:
+            run_pipeline(
+                pipeline,
+                validated,
+                concurrency=args.concurrency,
+                total=total,
+                reporter=reporter,
+                controller=controller,
+            )
+        finally:
+            if journal is not None:
+                journal.close()
+            if dedupe is not None:
+                dedupe.save()
+
+    reporter.message("[green]All done.[/green]")
+    return 0
+
+
+def _run_load(args: argparse.Namespace, reporter: Reporter, metrics: Metrics) -> int:
+    from .work_queue import WorkQueue, summarize
+
+    with _open_session(args, reporter, metrics) as session:
+        issues_raw = islice(iter_issues(args.issues), args.limit or None)
+        validated = _validate_file(
+            args, issues_raw, session.fields_cache, reporter, repo_index=session.repo_index
+        )
+        cfg = session.cfg
+    with WorkQueue(args.queue) as queue:
+        queue.bind(owner=cfg.owner, repo=cfg.repo, project_id=cfg.project_id)
+        added = queue.load(validated)
+        reporter.message(
+            f"Queued {added} new issue(s) in {args.queue} "
+            f"({len(validated) - added} already queued); {summarize(queue.stats())}"
+        )
+    return 0
+
+
+def _run_work(args: argparse.Namespace, reporter: Reporter, metrics: Metrics) -> int:
+    from .engine import run_pipeline
+    from .issue_creator import IssueCreator
+    from .project_item_manager import ProjectItemManager
+    from .work_queue import QueuePipeline, WorkQueue, summarize
+
+    if args.claim_size < 1:
+        raise ValidationError("--claim-size must be >= 1")
+    execute = _execute_requested(args, reporter)
+    controller = _adaptive(args, metrics)
+    with WorkQueue(args.queue, worker_id=args.worker_id, lease_s=args.lease_s) as queue:
+        if not execute:
+            # claiming would lease issues away from real workers
+            reporter.message(f"{args.queue}: {summarize(queue.stats())}")
+            return 0
+        with _open_session(
+            args, reporter, metrics, creates_per_minute=args.max_creates_per_minute
+        ) as session:
+            cfg = session.cfg
+            queue.bind(owner=cfg.owner, repo=cfg.repo, project_id=cfg.project_id)
+            quiet = args.concurrency > 1
+            pipeline = QueuePipeline(
+                queue=queue,
+                creator=IssueCreator(
+                    session.rest,
+                    owner=cfg.owner,
+                    repo=cfg.repo,
+                    quiet=quiet,
+                    reporter=reporter,
+                    gql=session.gql,
+                    project_id=cfg.project_id,
+                    via=args.create_via,
+                ),
+                pim=ProjectItemManager(
+                    session.gql,
+                    project_id=cfg.project_id,
+                    max_batch_size=args.batch_size,
+                    quiet=quiet,
+                    reporter=reporter,
+                ),
+                execute=True,
+            )
+            pipeline.attach(session.transport)
+            reporter.message(f"Worker {queue.worker_id} on {args.queue}")
+            try:
+                run_pipeline(
+                    pipeline,
+                    pipeline.claimed(args.claim_size, max_attempts=args.max_attempts),
+                    concurrency=args.concurrency,
+                    reporter=reporter,
+                    controller=controller,
+                )
+            finally:
+                # claimed but never started (the run stopped early): let other workers have them
+                released = queue.release()
+                if released:
+                    reporter.message(f"Released {released} unstarted issue(s) back to the queue")
+        stats = queue.stats()
+        reporter.message(f"{args.queue}: {summarize(stats)}")
+        for title, error in queue.failures():
+            reporter.message(f"[red]Failed[/red] {title}: {error}")
+    return 0
+
+
+def _listen_address(value: str) -> tuple[str, int]:
+    from .service import DEFAULT_HOST
+
+    host, _, port = value.rpartition(":")
+    try:
+        return host or DEFAULT_HOST, int(port)
+    except ValueError:
+        raise ValidationError(f"--listen expects [HOST:]PORT, got {value!r}") from None
+
+
+def _run_serve(args: argparse.Namespace, reporter: Reporter, metrics: Metrics) -> int:
+    import signal
+    import threading
 
-    validated = validate_issues(issues_raw, fields_meta=fields_meta)
-    print_dry_run_preview(validated, limit=args.limit)
+    from .service import IssueService, Spool, make_http_server, serve
 
-    rest = GitHubREST(token=cfg.token, api_base=cfg.api_base)
-    gql = GraphQLClient(token=cfg.token, api_base=cfg.api_base)
+    if not args.spool and not args.listen:
+        raise ValidationError("serve needs --spool DIR and/or --listen [HOST:]PORT")
+    if args.once and args.listen:
+        raise ValidationError("--once works through --spool only; drop --listen")
+    address = _listen_address(args.listen) if args.listen else None
+    execute = _execute_requested(args, reporter)
+    controller = _adaptive(args, metrics)
+    stop = threading.Event()
+    if threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGTERM, lambda *_: stop.set())
 
-    creator = IssueCreator(rest, owner=cfg.owner, repo=cfg.repo)
-    pim = ProjectItemManager(gql, project_id=cfg.project_id)
+    with _open_session(
+        args, reporter, metrics, creates_per_minute=args.max_creates_per_minute
+    ) as session:
+        cfg = session.cfg
+        service = IssueService(
+            rest=session.rest,
+            gql=session.gql,
+            fields_cache=session.fields_cache,
+            repo_index=session.repo_index,
+            owner=cfg.owner,
+            repo=cfg.repo,
+            project_id=cfg.project_id,
+            execute=execute,
+            concurrency=args.concurrency,
+            max_batch_size=args.batch_size,
+            create_via=args.create_via,
+            loose=args.loose_match,
+            controller=controller,
+            metrics=metrics,
+            reporter=reporter,
+        )
+        spool = Spool(args.spool) if args.spool else None
+        server = make_http_server(service, *address) if address is not None else None
+        if spool is not None:
+            reporter.message(f"Watching {spool.directory} for batches")
+        if server is not None:
+            host, port = server.server_address[:2]
+            reporter.message(f"Listening on http://{host}:{port} (POST /batches)")
+        try:
+            serve(
+                service, spool=spool, server=server, stop=stop, poll_s=args.poll_s, once=args.once
+            )
+        except KeyboardInterrupt:
+            reporter.message("Stopping")
+        reporter.message(f"Served {service.batches} batch(es)")
+    return 0
+
+
+def _with_refresh(cache: FieldsCache, parse: Callable[[], list]) -> list:
+    """Run ``parse`` against the cached metadata; on a miss, refresh once and try again."""
+    try:
+        return parse()
+    except ValidationError:
+        if not cache.can_refresh:
+            raise
+        cache.try_refresh()
+        return parse()
 
-    # execution loop
-    for idx, issue in enumerate(validated, start=1):
-        console.rule(f"Issue {idx}/{len(validated)}")
-        created = creator.create(title=issue.title, body=issue.description, execute=execute)
 
-        added = pim.add_issue_to_project(issue_node_id=created.node_id, execute=execute)
+def _run_bulk_update(args: argparse.Namespace, reporter: Reporter, metrics: Metrics) -> int:
+    from .bulk import parse_change, parse_filter, run_bulk_update
+    from .project_item_manager import ProjectItemManager
+
+    execute = _execute_requested(args, reporter)
+    controller = _adaptive(args, metrics)
+    with _open_session(args, reporter, metrics) as session:
+        cache = session.fields_cache
+        loose = args.loose_match
+        filters = _with_refresh(
+            cache, lambda: [parse_filter(w, cache.fields, loose=loose) for w in args.where]
+        )
+        changes = _with_refresh(
+            cache, lambda: [parse_change(c, cache.fields, loose=loose) for c in args.changes]
+        )
+        pim = ProjectItemManager(
+            session.gql,
+            project_id=session.cfg.project_id,
+            max_batch_size=args.batch_size,
+            reporter=reporter,
+        )
+        result = run_bulk_update(
+            pim,
+            filters=filters,
+            changes=changes,
+            execute=execute,
+            concurrency=args.concurrency,
+            page_size=args.page_size,
+            limit=args.limit,
+            reporter=reporter,
+            controller=controller,
+        )
+        reporter.event(
+            "bulk_update_finished",
+            scanned=result.scanned,
+            matched=result.matched,
+            unchanged=result.unchanged,
+            updated_items=result.updated_items,
+            updates_ok=result.updates_ok,
+            failed=len(result.failed),
+        )
+        verb = "updated" if execute else "would update"
+        reporter.message(
+            f"Scanned {result.scanned} item(s): {result.matched} matched, "
+            f"{result.unchanged} already up to date, {verb} {result.updated_items}"
+        )
+        if result.failed:
+            for r in result.failed[:20]:
+                reporter.message(
+                    f"[red]Failed[/red] {r.update.item_id} {r.update.field_name}: {r.error}"
+                )
+            raise ApiError(f"{len(result.failed)} field update(s) failed")
+
+    reporter.message("[green]All done.[/green]")
+    return 0
 
-        # set each field in a stable order
-        for issue_key in ["release", "phase", "area", "priority", "risk", "type", "effort", "status"]:
-            canonical = get_canonical_field_name(issue_key)
-            meta = fields_meta[canonical]
-            human_value = issue.fields[issue_key]
-            option_id = meta.options[human_value]
 
-            console.print(f"Setting [bold]{canonical}[/bold] = {human_value}")
-            pim.set_single_select(item_id=added.item_id, field=meta, option_id=option_id, execute=execute)
+def _run_reconcile(args: argparse.Namespace, reporter: Reporter, metrics: Metrics) -> int:
+    from .project_item_manager import ProjectItemManager
+    from .reconcile import run_reconcile
 
-        if execute:
-            console.print(f"[green]Done[/green] {created.html_url}")
+    execute = _execute_requested(args, reporter)
+    controller = _adaptive(args, metrics)
+    with _open_session(args, reporter, metrics) as session:
+        cfg = session.cfg
+        validated = _validate_file(args, iter_issues(args.issues), session.fields_cache, reporter)
+        pim = ProjectItemManager(
+            session.gql,
+            project_id=cfg.project_id,
+            max_batch_size=args.batch_size,
+            reporter=reporter,
+        )
+        result = run_reconcile(
+            pim,
+            validated,
+            repository=f"{cfg.owner}/{cfg.repo}",
+            execute=execute,
+            concurrency=args.concurrency,
+            page_size=args.page_size,
+            reporter=reporter,
+            controller=controller,
+        )
+        reporter.event(
+            "reconcile_finished",
+            scanned=result.scanned,
+            matched=result.matched,
+            unchanged=result.unchanged,
+            updated_items=result.updated_items,
+            updates_ok=result.updates_ok,
+            failed=len(result.failed),
+            missing=len(result.missing),
+            ambiguous=len(result.ambiguous),
+            duplicate_items=result.duplicate_items,
+        )
+        verb = "updated" if execute else "would update"
+        reporter.message(
+            f"{len(validated)} issue(s) in file: {result.matched} on the board, "
+            f"{result.unchanged} already up to date, {verb} {result.updated_items}"
+        )
+        if result.missing:
+            reporter.message(
+                f"[yellow]{len(result.missing)} issue(s) not on the board[/yellow] "
+                f"(use import to create them), e.g. {result.missing[0]!r}"
+            )
+        if result.ambiguous:
+            reporter.message(
+                f"[yellow]Skipped {len(result.ambiguous)} title(s) listed more than once[/yellow], "
+                f"e.g. {result.ambiguous[0]!r}"
+            )
+        if result.failed:
+            for r in result.failed[:20]:
+                reporter.message(
+                    f"[red]Failed[/red] {r.update.item_id} {r.update.field_name}: {r.error}"
+                )
+            raise ApiError(f"{len(result.failed)} field update(s) failed")
+
+    reporter.message("[green]All done.[/green]")
+    return 0
+
+
+def _run_manifest(args: argparse.Namespace, reporter: Reporter, metrics: Metrics) -> int:
+    from .config import load_config
+    from .manifest import load_manifest, run_manifest
+    from .retry_policy import CircuitBreaker
+    from .transport import HttpTransport
+
+    if args.parallel_targets < 1:
+        raise ValidationError("--parallel-targets must be >= 1")
+    targets = load_manifest(args.manifest)
+    execute = _execute_requested(args, reporter)
+    cfg = load_config(require_target=False)
+    max_in_flight = args.max_in_flight or args.concurrency
+    tokens = TokenPool(cfg.all_tokens, creates_per_minute=args.max_creates_per_minute)
+    with HttpTransport(
+        api_base=cfg.api_base,
+        pool_maxsize=max(args.pool_size, max_in_flight),
+        metrics=metrics,
+        max_in_flight=max_in_flight,
+        tokens=tokens,
+        cache=_http_cache(args),
+        breaker=CircuitBreaker(failure_threshold=args.circuit_threshold),
+    ) as transport:
+        results = run_manifest(
+            targets,
+            transport=transport,
+            execute=execute,
+            create_via=args.create_via,
+            concurrency=args.concurrency,
+            parallel_targets=args.parallel_targets,
+            max_batch_size=args.batch_size,
+            on_duplicate=args.on_duplicate,
+            resume=args.resume,
+            loose=args.loose_match,
+            fields_ttl=args.fields_ttl,
+            refresh_fields=args.refresh_fields,
+            reporter=reporter,
+        )
+    _report_budget(tokens, reporter)
+
+    for r in results:
+        summary = ", ".join(f"{k} {v}" for k, v in sorted(r.counts.items())) or "nothing done"
+        status = f"[red]failed[/red] ({r.error})" if r.error else "[green]ok[/green]"
+        reporter.message(f"{r.name}: {status}, {summary}")
+    failed = [r.name for r in results if r.error]
+    if failed:
+        raise ApiError(f"{len(failed)} of {len(results)} target(s) failed: {', '.join(failed)}")
+    reporter.message("[green]All done.[/green]")
+    return 0
+
+
+def _run_export(args: argparse.Namespace, reporter: Reporter, metrics: Metrics) -> int:
+    from .export import export_snapshot, write_table
+    from .project_item_manager import ProjectItemManager
+
+    with _open_session(args, reporter, metrics) as session:
+        pim = ProjectItemManager(session.gql, project_id=session.cfg.project_id, reporter=reporter)
+        fields_meta = session.fields_cache.fields
+        result = export_snapshot(
+            pim,
+            args.out,
+            fields_meta=fields_meta,
+            full=args.full,
+            page_size=args.page_size,
+            concurrency=args.concurrency,
+        )
+        reporter.event("export_finished", path=args.out, **result.__dict__)
+        if result.full:
+            reporter.message(f"Exported {result.items} item(s) to {args.out}")
         else:
-            console.print("[yellow]DRY-RUN complete for this issue[/yellow]")
+            reporter.message(
+                f"Updated {args.out}: {result.items} item(s), {result.added} added, "
+                f"{result.updated} changed, {result.removed} removed, "
+                f"{result.unchanged} unchanged"
+            )
+        if args.table:
+            rows = write_table(args.out, args.table, fields_meta=fields_meta)
+            reporter.message(f"Wrote {rows} row(s) to {args.table}")
 
-    console.print("[green]All done.[/green]")
+    reporter.message("[green]All done.[/green]")
     return 0
 
 
+def build_validate_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(
+        prog=f"{PROG} validate",
+        description="Check issues files against cached fields metadata and print a pass/fail "
+        "summary. Needs no token and no network, so it suits pre-commit hooks and CI.",
+    )
+    p.add_argument("issues", nargs="+", help="Issues JSON or JSON Lines file(s)")
+    p.add_argument("--fields", required=True, help="Path to fields metadata JSON (cache)")
+    p.add_argument(
+        "--repo-index",
+        default=None,
+        metavar="PATH",
+        help="Also check labels, milestones and assignees against this repository index (as "
+        "written by import --repo-index); without it they are not checked",
+    )
+    p.add_argument(
+        "--loose-match",
+        action="store_true",
+        help="Also accept option values that differ only in case or whitespace",
+    )
+    p.add_argument(
+        "--max-errors", type=int, default=5, help="Errors listed per failing file (0 = all)"
+    )
+    p.add_argument("-q", "--quiet", action="store_true", help="Only print failing files")
+    return p
+
+
+def _run_validate(args: argparse.Namespace) -> int:
+    # Deliberately plain: no reporter, no rich, no client modules, so the command starts fast.
+    from pathlib import Path
+
+    from .project_fields import load_fields_json
+    from .repo_index import read_repo_index
+    from .utils import ConfigError
+    from .validator import ValidationPlan
+
+    try:
+        fields_meta = load_fields_json(args.fields)
+    except FileNotFoundError as e:
+        raise ConfigError(f"Fields metadata not found: {args.fields}") from e
+    repo_index: RepoIndex | None = None
+    if args.repo_index:
+        if not Path(args.repo_index).exists():
+            raise ConfigError(f"Repository index not found: {args.repo_index}")
+        repo_index = read_repo_index(args.repo_index)
+    plan = ValidationPlan(fields_meta, loose=args.loose_match, repo_index=repo_index)
+
+    failed = 0
+    for path in args.issues:
+        try:
+            report = plan.validate_all(iter_issues(path))
+            errors, count = report.errors, len(report.issues)
+        except (OSError, ValidationError) as e:
+            errors, count = [str(e)], 0
+        if not errors:
+            if not args.quiet:
+                print(f"ok   {path} ({count} issue(s))")
+            continue
+        failed += 1
+        print(f"FAIL {path}: {len(errors)} error(s)")
+        listed = errors[: args.max_errors] if args.max_errors > 0 else errors
+        for err in listed:
+            print(f"  - {err}")
+        if len(listed) < len(errors):
+            print(f"  ... and {len(errors) - len(listed)} more")
+    print(f"{len(args.issues)} file(s) checked, {failed} failed")
+    return 1 if failed else 0
+
+
+Runner = Callable[[argparse.Namespace, Reporter, Metrics], int]
+OfflineRunner = Callable[[argparse.Namespace], int]
+
+COMMANDS: dict[str, tuple[Callable[[], argparse.ArgumentParser], Runner]] = {
+    "import": (build_parser, _run_import),
+    "bulk-update": (build_bulk_update_parser, _run_bulk_update),
+    "reconcile": (build_reconcile_parser, _run_reconcile),
+    "export": (build_export_parser, _run_export),
+    "manifest": (build_manifest_parser, _run_manifest),
+    "load": (build_load_parser, _run_load),
+    "work": (build_work_parser, _run_work),
+    "serve": (build_serve_parser, _run_serve),
+}
+# Commands that never talk to GitHub: no reporter, metrics or client setup.
+OFFLINE_COMMANDS: dict[str, tuple[Callable[[], argparse.ArgumentParser], OfflineRunner]] = {
+    "validate": (build_validate_parser, _run_validate),
+}
+
+
+def main(argv: list[str] | None = None) -> int:
+    argv = list(sys.argv[1:] if argv is None else argv)
+    if argv and argv[0] in OFFLINE_COMMANDS:
+        make_offline_parser, run_offline = OFFLINE_COMMANDS[argv[0]]
+        return run_offline(make_offline_parser().parse_args(argv[1:]))
+    # `import` is the default command, so existing invocations keep working unchanged
+    command = argv.pop(0) if argv and argv[0] in COMMANDS else "import"
+    make_parser, run = COMMANDS[command]
+    args = make_parser().parse_args(argv)
+    if args.concurrency < 1:
+        raise ValidationError("--concurrency must be >= 1")
+
+    reporter = make_reporter(
+        args.output, preview_rows=getattr(args, "preview_rows", DEFAULT_PREVIEW_ROWS)
+    )
+    metrics = Metrics()
+    try:
+        return run(args, reporter, metrics)
+    finally:
+        # also on failure: a run that died is exactly the one worth looking at
+        _export_metrics(args, metrics, reporter)
+        reporter.close()
+
+
+def _export_metrics(args: argparse.Namespace, metrics: Metrics, reporter: Reporter) -> None:
+    summary = metrics.summary()
+    if summary["operations"]:
+        reporter.event("metrics", **summary)
+    if args.metrics_json:
+        metrics.write_json(args.metrics_json)
+    if args.metrics_prom:
+        metrics.write_prometheus(args.metrics_prom)
+
+
 if __name__ == "__main__":
     raise SystemExit(main())
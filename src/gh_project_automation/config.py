@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
 from os import getenv
 
@@ -15,26 +16,44 @@ class Config:
     repo: str
     project_id: str
     api_base: str = "https://api.github.com"
+    tokens: tuple[str, ...] = ()  # every token to spread requests over (GITHUB_TOKENS)
 
+    @property
+    def all_tokens(self) -> tuple[str, ...]:
+        return self.tokens or (self.token,)
 
-def load_config(*, dotenv_path: str | None = None) -> Config:
-    """Load config from environment variables (optionally reading .env)."""
+
+def load_config(*, dotenv_path: str | None = None, require_target: bool = True) -> Config:
+    """Load config from environment variables (optionally reading .env).
+
+    With ``require_target=False`` only the token is required; owner, repo and project id may
+    be empty (manifest runs name their targets themselves).
+    """
     load_dotenv(dotenv_path=dotenv_path)
 
-    token = getenv("GITHUB_TOKEN", "").strip()
+    # GITHUB_TOKENS: extra tokens (comma or whitespace separated) used alongside GITHUB_TOKEN
+    pool = [t for t in re.split(r"[,\s]+", getenv("GITHUB_TOKENS", "")) if t]
+    token = getenv("GITHUB_TOKEN", "").strip() or (pool[0] if pool else "")
     owner = getenv("GITHUB_OWNER", "").strip()
     repo = getenv("GITHUB_REPO", "").strip()
     project_id = getenv("GITHUB_PROJECT_ID", "").strip()
     api_base = getenv("GITHUB_API_BASE", "https://api.github.com").strip()
 
-    missing = [k for k, v in {
-        "GITHUB_TOKEN": token,
-        "GITHUB_OWNER": owner,
-        "GITHUB_REPO": repo,
-        "GITHUB_PROJECT_ID": project_id,
-    }.items() if not v]
+    required = {"GITHUB_TOKEN": token}
+    if require_target:
+        required.update(
+            {"GITHUB_OWNER": owner, "GITHUB_REPO": repo, "GITHUB_PROJECT_ID": project_id}
+        )
+    missing = [k for k, v in required.items() if not v]
 
     if missing:
         raise ConfigError(f"Missing required config: {', '.join(missing)}")
 
-    return Config(token=token, owner=owner, repo=repo, project_id=project_id, api_base=api_base)
+    return Config(
+        token=token,
+        owner=owner,
+        repo=repo,
+        project_id=project_id,
+        api_base=api_base,
+        tokens=tuple(dict.fromkeys([token, *pool])),
+    )
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import json
+import threading
+from pathlib import Path
+from typing import Any
+
+from .github_rest import GitHubREST
+from .issue_creator import CreatedIssue
+from .utils import content_hash
+
+INDEX_VERSION = 1
+# What to do when an input issue already exists: drop it, or reuse it for project/field steps.
+DUPLICATE_MODES = ("skip", "link")
+
+
+class DedupeIndex:
+    """Local index of a repository's issues keyed by normalized title/body hash.
+
+    Built by paging the repository's issue list once; later ``refresh`` calls only fetch
+    issues updated since the last sync. Lookups are a dict hit, so checking an input issue
+    never costs an API search.
+    """
+
+    def __init__(self, path: str | Path | None, *, owner: str, repo: str) -> None:
+        self.path = Path(path) if path else None
+        self.owner = owner
+        self.repo = repo
+        self.synced_at: str | None = None  # max GitHub `updated_at` seen
+        self._by_number: dict[int, dict[str, Any]] = {}
+        self._by_hash: dict[str, int] = {}
+        self._lock = threading.Lock()
+        if self.path is not None and self.path.exists():
+            self._load()
+
+    def __len__(self) -> int:
+        return len(self._by_number)
+
+    def _load(self) -> None:
+        assert self.path is not None
+        raw = json.loads(self.path.read_text(encoding="utf-8"))
+        if raw.get("version") != INDEX_VERSION or raw.get("repo") != f"{self.owner}/{self.repo}":
+            # Different repo or format: start over rather than match against the wrong issues.
+            return
+        self.synced_at = raw.get("synced_at")
+        for number, rec in raw.get("issues", {}).items():
+            self._put(int(number), rec)
+
+    def _put(self, number: int, rec: dict[str, Any]) -> None:
+        old = self._by_number.get(number)
+        if old is not None and self._by_hash.get(old["hash"]) == number:
+            del self._by_hash[old["hash"]]
+        self._by_number[number] = rec
+        # Oldest issue wins when the same content exists more than once.
+        current = self._by_hash.get(rec["hash"])
+        if current is None or number < current:
+            self._by_hash[rec["hash"]] = number
+
+    def refresh(self, rest: GitHubREST) -> int:
+        """Fetch issues updated since the last sync. Returns how many were (re)indexed."""
+        count = 0
+        for item in rest.list_issues(owner=self.owner, repo=self.repo, since=self.synced_at):
+            rec = {
+                "hash": content_hash(str(item.get("title") or ""), str(item.get("body") or "")),
+                "node_id": str(item["node_id"]),
+                "html_url": str(item["html_url"]),
+            }
+            with self._lock:
+                self._put(int(item["number"]), rec)
+                updated = item.get("updated_at")
+                if updated and (self.synced_at is None or updated > self.synced_at):
+                    self.synced_at = updated
+            count += 1
+        return count
+
+    def lookup(self, title: str, body: str) -> CreatedIssue | None:
+        with self._lock:
+            number = self._by_hash.get(content_hash(title, body))
+            if number is None:
+                return None
+            rec = self._by_number[number]
+        return CreatedIssue(
+            number=number,
+            node_id=rec["node_id"],
+            html_url=rec["html_url"],
+            existing=True,
+        )
+
+    def add(self, title: str, body: str, created: CreatedIssue) -> None:
+        rec = {
+            "hash": content_hash(title, body),
+            "node_id": created.node_id,
+            "html_url": created.html_url,
+        }
+        with self._lock:
+            self._put(created.number, rec)
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        with self._lock:
+            raw = {
+                "version": INDEX_VERSION,
+                "repo": f"{self.owner}/{self.repo}",
+                "synced_at": self.synced_at,
+                "issues": {str(n): rec for n, rec in sorted(self._by_number.items())},
+            }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp.write_text(json.dumps(raw, ensure_ascii=False), encoding="utf-8")
+        tmp.replace(self.path)
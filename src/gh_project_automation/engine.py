@@ -0,0 +1,356 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Iterable
+
+from .issue_creator import IssueCreator
+from .journal import RunJournal
+from .project_item_manager import FieldUpdate, ProjectItemManager
+from .reporter import Reporter, RichReporter
+from .utils import ApiError, content_hash
+from .validator import ValidatedIssue
+
+if TYPE_CHECKING:
+    from .adaptive import AdaptiveController
+    from .work_queue import WorkQueue
+
+Log = Callable[[str], None]
+
+
+@dataclass(frozen=True)
+class IssueResult:
+    index: int
+    title: str
+    html_url: str
+    status: str = "created"  # created | linked | duplicate | already_done | dry_run
+
+
+class IssuePipeline:
+    """Per-issue create -> add to project -> set fields sequence.
+
+    The steps for one issue always run in order on one thread; concurrency only ever happens
+    across issues (see ``run_concurrent``).
+    """
+
+    # The run loops stop at the first failed issue unless a subclass records failures itself.
+    stop_on_failure = True
+
+    def __init__(
+        self,
+        *,
+        creator: IssueCreator,
+        pim: ProjectItemManager,
+        execute: bool,
+        journal: RunJournal | WorkQueue | None = None,
+        on_duplicate: str = "skip",
+    ) -> None:
+        self.creator = creator
+        self.pim = pim
+        self.execute = execute
+        self.journal = journal
+        self.on_duplicate = on_duplicate  # see dedupe.DUPLICATE_MODES
+        self._seen: dict[str, int] = {}
+        self.counts: Counter[str] = Counter()  # per-status tally, updated by the run loops
+
+    def key_for(self, issue: ValidatedIssue) -> str:
+        """Journal key: content hash plus occurrence count, so identical rows stay distinct.
+
+        Must be called in input order (the run loops do this before dispatching work).
+        """
+        h = content_hash(issue.title, issue.description)
+        n = self._seen.get(h, 0)
+        self._seen[h] = n + 1
+        return f"{h}:{n}"
+
+    def run_one(
+        self, index: int, issue: ValidatedIssue, log: Log, *, key: str = ""
+    ) -> IssueResult:
+        execute = self.execute
+        # Only real runs are journaled; dry-run IDs are placeholders.
+        journal = self.journal if execute else None
+        entry = self.journal.get(key) if self.journal is not None and key else None
+        if entry is not None and entry.done:
+            url = entry.created.html_url if entry.created else ""
+            log(f"[dim]Already done in journal, skipping[/dim] {url}")
+            return IssueResult(index=index, title=issue.title, html_url=url, status="already_done")
+
+        if entry is not None and entry.created is not None:
+            created = entry.created
+            log(f"[dim]Resuming[/dim] {created.html_url}")
+        else:
+            created = self.creator.create(
+                title=issue.title,
+                body=issue.description,
+                execute=execute,
+                labels=issue.labels,
+                milestone=issue.milestone,
+                assignees=issue.assignees,
+            )
+            if journal is not None:
+                journal.record_created(key, created)
+            if created.existing and self.on_duplicate == "skip":
+                log(f"[yellow]Skipping duplicate[/yellow] of {created.html_url}")
+                if journal is not None:
+                    journal.record_done(key)
+                return IssueResult(
+                    index=index, title=issue.title, html_url=created.html_url, status="duplicate"
+                )
+
+        if entry is not None and entry.item_id is not None:
+            item_id = entry.item_id
+        elif created.item_id is not None:
+            # created straight into the project (GraphQL createIssue), no separate add
+            item_id = created.item_id
+            if journal is not None:
+                journal.record_added(key, item_id)
+        else:
+            item_id = self.pim.add_issue_to_project(
+                issue_node_id=created.node_id, execute=execute
+            ).item_id
+            if journal is not None:
+                journal.record_added(key, item_id)
+
+        # set every field in a stable order, batched into one mutation document; IDs were
+        # resolved at validation time, so no metadata lookups happen here
+        applied = entry.fields_applied if entry is not None else set()
+        updates: list[FieldUpdate] = []
+        for rf in issue.resolved:
+            if rf.field_id in applied:
+                continue
+            updates.append(
+                FieldUpdate(
+                    item_id=item_id,
+                    field_id=rf.field_id,
+                    value=rf.value,
+                    field_name=rf.field_name,
+                    data_type=rf.data_type,
+                )
+            )
+            log(f"Setting [bold]{rf.field_name}[/bold] = {rf.label}")
+
+        results = self.pim.set_fields_batch(updates, execute=execute) if updates else []
+        if journal is not None:
+            journal.record_fields(key, (r.update.field_id for r in results if r.ok))
+        failed = [r for r in results if not r.ok]
+        for r in failed:
+            log(f"[red]Failed[/red] {r.update.field_name}: {r.error}")
+        if failed:
+            raise ApiError(
+                f"Failed to set {len(failed)} field(s) on '{issue.title}': "
+                + ", ".join(r.update.field_name for r in failed)
+            )
+
+        if journal is not None:
+            journal.record_done(key)
+        if execute:
+            log(f"[green]Done[/green] {created.html_url}")
+            status = "linked" if created.existing else "created"
+        else:
+            log("[yellow]DRY-RUN complete for this issue[/yellow]")
+            status = "dry_run"
+        return IssueResult(index=index, title=issue.title, html_url=created.html_url, status=status)
+
+
+def _noop(_: str) -> None:
+    pass
+
+
+def _header(index: int, total: int | None) -> str:
+    return f"Issue {index}/{total}" if total is not None else f"Issue {index}"
+
+
+def _report_done(pipeline: IssuePipeline, reporter: Reporter, result: IssueResult) -> None:
+    pipeline.counts[result.status] += 1
+    reporter.event(
+        "issue_done",
+        index=result.index,
+        title=result.title,
+        url=result.html_url,
+        status=result.status,
+    )
+
+
+def _report_failed(
+    pipeline: IssuePipeline,
+    reporter: Reporter,
+    index: int,
+    issue: ValidatedIssue,
+    exc: BaseException,
+) -> None:
+    pipeline.counts["failed"] += 1
+    reporter.event("issue_failed", index=index, title=issue.title, status="failed", error=str(exc))
+
+
+def run_serial(
+    pipeline: IssuePipeline,
+    issues: Iterable[ValidatedIssue],
+    *,
+    total: int | None = None,
+    reporter: Reporter | None = None,
+) -> list[IssueResult]:
+    reporter = reporter or RichReporter()
+    log = reporter.log if reporter.verbose else _noop
+    results: list[IssueResult] = []
+    for idx, issue in enumerate(issues, start=1):
+        key = pipeline.key_for(issue)
+        if reporter.verbose:
+            reporter.rule(_header(idx, total))
+        try:
+            result = pipeline.run_one(idx, issue, log, key=key)
+        except Exception as e:
+            _report_failed(pipeline, reporter, idx, issue, e)
+            if pipeline.stop_on_failure:
+                raise
+            continue
+        _report_done(pipeline, reporter, result)
+        results.append(result)
+    return results
+
+
+async def _run_concurrent(
+    pipeline: IssuePipeline,
+    issues: Iterable[ValidatedIssue],
+    *,
+    concurrency: int,
+    total: int | None,
+    reporter: Reporter,
+    controller: AdaptiveController | None = None,
+) -> list[IssueResult]:
+    loop = asyncio.get_running_loop()
+    # `concurrency` sizes the thread pool; with a controller the live limit moves below it.
+    slots = asyncio.Condition()
+    in_flight = 0
+    results: list[IssueResult] = []
+    errors: list[BaseException] = []
+    tasks: set[asyncio.Task[None]] = set()
+    verbose = reporter.verbose
+
+    def _has_slot() -> bool:
+        if controller is None:
+            return in_flight < concurrency
+        return in_flight < min(concurrency, controller.concurrency)
+
+    def _work(
+        idx: int, issue: ValidatedIssue, key: str
+    ) -> tuple[IssueResult | None, list[str], BaseException | None]:
+        lines: list[str] = []
+        log = lines.append if verbose else _noop
+        try:
+            return pipeline.run_one(idx, issue, log, key=key), lines, None
+        except Exception as e:  # surfaced after in-flight issues drain
+            return None, lines, e
+
+    async def _one(idx: int, issue: ValidatedIssue, key: str, executor: ThreadPoolExecutor) -> None:
+        nonlocal in_flight
+        try:
+            result, lines, exc = await loop.run_in_executor(executor, _work, idx, issue, key)
+        finally:
+            async with slots:
+                in_flight -= 1
+                slots.notify_all()
+        # Print each issue's log as one block so concurrent issues do not interleave.
+        if verbose:
+            reporter.rule(_header(idx, total))
+            for line in lines:
+                reporter.log(line)
+        if exc is not None:
+            _report_failed(pipeline, reporter, idx, issue, exc)
+            if pipeline.stop_on_failure:
+                errors.append(exc)
+        elif result is not None:
+            _report_done(pipeline, reporter, result)
+            results.append(result)
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="issue") as executor:
+        try:
+            # Take a slot before pulling the next issue so no more than the limit are in flight and
+            # the input iterable (possibly a lazily validated stream) is consumed on demand.
+            for idx, issue in enumerate(issues, start=1):
+                async with slots:
+                    await slots.wait_for(_has_slot)
+                    if errors:
+                        break
+                    in_flight += 1
+                if controller is not None:
+                    pipeline.pim.max_batch_size = controller.batch_size
+                task = asyncio.create_task(_one(idx, issue, pipeline.key_for(issue), executor))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+        finally:
+            # Also reached when the input stream raises (e.g. a bad record): drain in-flight work.
+            if tasks:
+                await asyncio.gather(*tasks)
+
+    if errors:
+        raise errors[0]
+    results.sort(key=lambda r: r.index)
+    return results
+
+
+def run_concurrent(
+    pipeline: IssuePipeline,
+    issues: Iterable[ValidatedIssue],
+    *,
+    concurrency: int,
+    total: int | None = None,
+    reporter: Reporter | None = None,
+    controller: AdaptiveController | None = None,
+) -> list[IssueResult]:
+    """Run the pipeline for up to ``concurrency`` issues at once.
+
+    Work runs on a bounded thread pool over the shared pooled session; the asyncio loop only
+    schedules. On the first failure no new issues are started, in-flight ones finish, and the
+    error is re-raised (unless the pipeline's ``stop_on_failure`` is off). With a
+    ``controller``, its current limits (capped at ``concurrency``) decide how many issues start
+    and how many field updates go into one mutation document.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be >= 1")
+    return asyncio.run(
+        _run_concurrent(
+            pipeline,
+            issues,
+            concurrency=concurrency,
+            total=total,
+            reporter=reporter or RichReporter(),
+            controller=controller,
+        )
+    )
+
+
+def run_pipeline(
+    pipeline: IssuePipeline,
+    issues: Iterable[ValidatedIssue],
+    *,
+    concurrency: int = 1,
+    total: int | None = None,
+    reporter: Reporter | None = None,
+    controller: AdaptiveController | None = None,
+) -> list[IssueResult]:
+    """Run every issue, bracketed by ``run_started``/``run_finished`` reporter events.
+
+    With a ``controller``, ``concurrency`` is the ceiling it adapts under.
+    """
+    reporter = reporter or RichReporter()
+    reporter.event("run_started", total=total, execute=pipeline.execute, concurrency=concurrency)
+    started = time.monotonic()
+    try:
+        if concurrency <= 1:
+            return run_serial(pipeline, issues, total=total, reporter=reporter)
+        return run_concurrent(
+            pipeline,
+            issues,
+            concurrency=concurrency,
+            total=total,
+            reporter=reporter,
+            controller=controller,
+        )
+    finally:
+        reporter.event(
+            "run_finished",
+            counts=dict(pipeline.counts),
+            elapsed_s=round(time.monotonic() - started, 3),
+        )
@@ -0,0 +1,297 @@
+from __future__ import annotations
+
+import csv
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Any, Iterable, Iterator
+
+from .project_fields import NUMBER, OPTION_DATA_TYPES, FieldMeta, fields_fingerprint
+from .project_item_manager import DEFAULT_ITEMS_PAGE_SIZE, ProjectItem, ProjectItemManager
+from .utils import ConfigError, ValidationError
+
+SNAPSHOT_VERSION = 1
+# Item columns of the flat table, before one column per project field.
+TABLE_COLUMNS = (
+    "id", "content_type", "number", "title", "url", "state", "repository", "updated_at"
+)  # fmt: skip
+TABLE_FORMATS = (".csv", ".parquet")
+# When more than this share of the board changed, a full export is cheaper than the
+# stamps pass plus by-id fetches, and avoids holding the changed rows in memory.
+FULL_EXPORT_RATIO = 0.5
+PARQUET_ROW_GROUP = 10_000
+
+
+@dataclass(frozen=True)
+class SnapshotState:
+    project_id: str
+    fields_fingerprint: str
+    exported_at: float
+    version: int = SNAPSHOT_VERSION
+
+
+@dataclass
+class ExportResult:
+    full: bool
+    items: int = 0
+    added: int = 0
+    updated: int = 0
+    removed: int = 0
+    unchanged: int = 0
+
+
+def state_path(snapshot: Path) -> Path:
+    return snapshot.with_name(snapshot.name + ".state.json")
+
+
+def load_state(snapshot: Path) -> SnapshotState | None:
+    p = state_path(snapshot)
+    if not snapshot.exists() or not p.exists():
+        return None
+    try:
+        raw = json.loads(p.read_text(encoding="utf-8"))
+        return SnapshotState(
+            project_id=str(raw["project_id"]),
+            fields_fingerprint=str(raw["fields_fingerprint"]),
+            exported_at=float(raw["exported_at"]),
+            version=int(raw.get("version", 0)),
+        )
+    except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+        return None  # unreadable state: start over with a full export
+
+
+def _save_state(snapshot: Path, state: SnapshotState) -> None:
+    p = state_path(snapshot)
+    tmp = p.with_name(p.name + ".tmp")
+    tmp.write_text(json.dumps(state.__dict__, indent=2) + "\n", encoding="utf-8")
+    tmp.replace(p)
+
+
+class _Labeler:
+    """Turns stored field values (option/iteration ids) back into labels by field name."""
+
+    def __init__(self, fields_meta: dict[str, FieldMeta]) -> None:
+        self.names = {meta.id: name for name, meta in fields_meta.items()}
+        self.labels = {
+            meta.id: {oid: label for label, oid in meta.options.items()}
+            for meta in fields_meta.values()
+            if meta.data_type in OPTION_DATA_TYPES
+        }
+
+    def row(self, item: ProjectItem) -> dict[str, Any]:
+        fields: dict[str, str | float] = {}
+        for field_id, value in item.field_values.items():
+            name = self.names.get(field_id)
+            if name is None:
+                continue  # field deleted from the project or not in fields.json
+            labels = self.labels.get(field_id)
+            # an option unknown to fields.json keeps its id rather than being dropped
+            fields[name] = labels.get(str(value), value) if labels is not None else value
+        return {
+            "id": item.id,
+            "content_type": item.content_type,
+            "content_id": item.content_id,
+            "number": item.number,
+            "title": item.title,
+            "url": item.url,
+            "state": item.state,
+            "repository": item.repository,
+            "updated_at": item.updated_at,
+            "fields": fields,
+        }
+
+
+def iter_snapshot(path: str | Path) -> Iterator[dict[str, Any]]:
+    """Stream the rows of a JSONL snapshot; a truncated final line is ignored."""
+    with Path(path).open(encoding="utf-8") as fh:
+        for line in fh:
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                continue
+
+
+def _write_row(fh: IO[str], row: dict[str, Any]) -> None:
+    fh.write(json.dumps(row, ensure_ascii=False) + "\n")
+
+
+def _chunks(ids: list[str], size: int) -> Iterator[list[str]]:
+    for start in range(0, len(ids), size):
+        yield ids[start : start + size]
+
+
+def export_snapshot(
+    pim: ProjectItemManager,
+    path: str | Path,
+    *,
+    fields_meta: dict[str, FieldMeta],
+    full: bool = False,
+    page_size: int = DEFAULT_ITEMS_PAGE_SIZE,
+    concurrency: int = 1,
+) -> ExportResult:
+    """Write every project item to a JSONL snapshot at ``path``, one item per line.
+
+    When a snapshot of the same project and field layout already exists, only item ids and
+    update times are listed; items that are new or changed are then fetched by id and merged
+    into the existing file, and items no longer on the board are dropped. The file is replaced
+    atomically, so an interrupted export leaves the previous snapshot intact.
+    """
+    snapshot = Path(path)
+    labeler = _Labeler(fields_meta)
+    fingerprint = fields_fingerprint(fields_meta)
+    state = load_state(snapshot)
+    incremental = (
+        not full
+        and state is not None
+        and state.version == SNAPSHOT_VERSION
+        and state.project_id == pim.project_id
+        and state.fields_fingerprint == fingerprint
+    )
+    started = time.time()
+    snapshot.parent.mkdir(parents=True, exist_ok=True)
+    tmp = snapshot.with_name(snapshot.name + ".tmp")
+
+    result: ExportResult | None = None
+    if incremental:
+        result = _export_incremental(
+            pim, snapshot, tmp, labeler, page_size=page_size, concurrency=concurrency
+        )
+    if result is None:
+        result = ExportResult(full=True)
+        with tmp.open("w", encoding="utf-8") as fh:
+            for item in pim.iter_items(page_size=page_size):
+                _write_row(fh, labeler.row(item))
+                result.items += 1
+        result.added = result.items
+    tmp.replace(snapshot)
+    # stamped with the start time: anything edited during the export is picked up next run
+    state = SnapshotState(
+        project_id=pim.project_id, fields_fingerprint=fingerprint, exported_at=started
+    )
+    _save_state(snapshot, state)
+    return result
+
+
+def _export_incremental(
+    pim: ProjectItemManager,
+    snapshot: Path,
+    tmp: Path,
+    labeler: _Labeler,
+    *,
+    page_size: int,
+    concurrency: int,
+) -> ExportResult | None:
+    """Merge changed items into ``snapshot``; returns None when a full export is the better deal."""
+    stored = {str(row["id"]): str(row.get("updated_at") or "") for row in iter_snapshot(snapshot)}
+    current = dict(pim.iter_item_stamps(page_size=page_size))
+    changed = [item_id for item_id, ts in current.items() if stored.get(item_id) != ts]
+    if len(changed) > FULL_EXPORT_RATIO * max(len(current), 1):
+        return None
+
+    fetched: dict[str, dict[str, Any]] = {}
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="export") as executor:
+        for items in executor.map(pim.get_items, _chunks(changed, DEFAULT_ITEMS_PAGE_SIZE)):
+            for item in items:
+                fetched[item.id] = labeler.row(item)
+
+    result = ExportResult(full=False)
+    with tmp.open("w", encoding="utf-8") as fh:
+        for row in iter_snapshot(snapshot):
+            item_id = str(row["id"])
+            if item_id not in current:
+                result.removed += 1
+                continue
+            new_row = fetched.pop(item_id, None)
+            if new_row is None:
+                # unchanged (or removed between the stamps pass and the fetch: keep the old row)
+                result.unchanged += 1
+                _write_row(fh, row)
+            else:
+                result.updated += 1
+                _write_row(fh, new_row)
+            result.items += 1
+        for row in fetched.values():
+            _write_row(fh, row)
+            result.added += 1
+            result.items += 1
+    return result
+
+
+def _table_record(row: dict[str, Any], field_names: list[str]) -> dict[str, Any]:
+    values = row.get("fields") or {}
+    record = {col: row.get(col) for col in TABLE_COLUMNS}
+    record.update({name: values.get(name) for name in field_names})
+    return record
+
+
+def write_table(
+    snapshot: str | Path, out: str | Path, *, fields_meta: dict[str, FieldMeta]
+) -> int:
+    """Flatten a JSONL snapshot into ``out`` (``.csv`` or ``.parquet``), one column per field.
+
+    Rows are streamed from the snapshot; nothing beyond one Parquet row group is held in memory.
+    Returns the number of rows written.
+    """
+    out_path = Path(out)
+    suffix = out_path.suffix.lower()
+    if suffix not in TABLE_FORMATS:
+        raise ValidationError(f"Unsupported table format '{suffix}'. Use one of: {TABLE_FORMATS}")
+    field_names = [n for n in fields_meta if n not in TABLE_COLUMNS]
+    rows = (_table_record(row, field_names) for row in iter_snapshot(snapshot))
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = out_path.with_name(out_path.name + ".tmp")
+    if suffix == ".csv":
+        n = _write_csv(tmp, rows, [*TABLE_COLUMNS, *field_names])
+    else:
+        n = _write_parquet(tmp, rows, field_names, fields_meta)
+    tmp.replace(out_path)
+    return n
+
+
+def _write_csv(path: Path, rows: Iterable[dict[str, Any]], columns: list[str]) -> int:
+    n = 0
+    with path.open("w", encoding="utf-8", newline="") as fh:
+        writer = csv.DictWriter(fh, fieldnames=columns)
+        writer.writeheader()
+        for record in rows:
+            writer.writerow(record)
+            n += 1
+    return n
+
+
+def _write_parquet(
+    path: Path,
+    rows: Iterable[dict[str, Any]],
+    field_names: list[str],
+    fields_meta: dict[str, FieldMeta],
+) -> int:
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ConfigError(
+            "Parquet output needs pyarrow: pip install 'github-project-automation[parquet]'"
+        ) from e
+
+    schema = pa.schema(
+        [(col, pa.int64() if col == "number" else pa.string()) for col in TABLE_COLUMNS]
+        + [
+            (name, pa.float64() if fields_meta[name].data_type == NUMBER else pa.string())
+            for name in field_names
+        ]
+    )
+    n = 0
+    batch: list[dict[str, Any]] = []
+    with pq.ParquetWriter(path, schema) as writer:
+        for record in rows:
+            batch.append(record)
+            if len(batch) >= PARQUET_ROW_GROUP:
+                writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+                n += len(batch)
+                batch = []
+        if batch or n == 0:
+            writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+            n += len(batch)
+    return n
@@ -0,0 +1,632 @@
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable
+from urllib.parse import parse_qs, urlsplit
+
+from .project_fields import (
+    CANONICAL_FIELDS,
+    DATE,
+    ITERATION,
+    NUMBER,
+    SINGLE_SELECT,
+    TEXT,
+    FieldMeta,
+)
+
+# A local stand-in for the parts of the GitHub REST and GraphQL APIs this tool calls, for
+# end-to-end tests and offline benchmarks. Point GITHUB_API_BASE at ``FakeGitHub.url``.
+
+_ISSUES_PATH_RE = re.compile(r"^/repos/([^/]+)/([^/]+)/issues$")
+_OPERATION_RE = re.compile(r"^\s*(?:query|mutation)\s+(\w+)")
+
+DEFAULT_LABELS = ("bug", "enhancement", "documentation")
+DEFAULT_MILESTONES = ("v1.0", "v2.0")
+DEFAULT_COLLABORATORS = ("octocat", "hubot")
+
+_VALUE_KEYS_BY_TYPE = {
+    SINGLE_SELECT: "optionId",
+    ITERATION: "iterationId",
+    NUMBER: "number",
+    TEXT: "text",
+    DATE: "date",
+}
+
+GraphQLHandler = Callable[[dict[str, Any]], tuple[dict[str, Any], list[dict[str, Any]]]]
+
+
+@dataclass(frozen=True)
+class FakeGitHubConfig:
+    latency_s: float = 0.0  # added to every response
+    jitter_s: float = 0.0  # plus uniform random [0, jitter_s)
+    error_rate: float = 0.0  # fraction of requests answered with 502 before doing anything
+    # Creates are never retried after a 5xx (they may have gone through), so a benchmark that
+    # wants a run to survive injected errors spares them.
+    errors_on_creates: bool = True
+    rate_limit: int = 5000  # requests per window, per resource (core / graphql)
+    rate_window_s: float = 3600.0
+    # Secondary limit on concurrent requests: extras get a 403 with Retry-After (0: no limit).
+    max_in_flight: int = 0
+    retry_after_s: int = 1
+    # Queueing: added latency per other request being served at the same time.
+    latency_per_in_flight_s: float = 0.0
+    seed: int | None = None
+
+
+def synthetic_fields(options_per_field: int = 5) -> dict[str, FieldMeta]:
+    """Single-select metadata for every canonical field; option names are ``"<field> <i>"``."""
+    return {
+        canonical: FieldMeta(
+            id=f"PVTSSF_{i}",
+            options={f"{canonical} {n}": f"OPT_{i}_{n}" for n in range(options_per_field)},
+        )
+        for i, canonical in enumerate(CANONICAL_FIELDS.values())
+    }
+
+
+def _etag(data: Any, link: str) -> str:
+    blob = json.dumps(data, sort_keys=True) + link
+    return f'W/"{hashlib.sha256(blob.encode()).hexdigest()[:20]}"'
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+class _Window:
+    def __init__(self, limit: int, window_s: float) -> None:
+        self.limit = limit
+        self.window_s = window_s
+        self.reset_at = time.time() + window_s
+        self.used = 0
+
+    def take(self) -> bool:
+        now = time.time()
+        if now >= self.reset_at:
+            self.reset_at = now + self.window_s
+            self.used = 0
+        if self.used >= self.limit:
+            return False
+        self.used += 1
+        return True
+
+    def headers(self, resource: str) -> dict[str, str]:
+        return {
+            "X-RateLimit-Limit": str(self.limit),
+            "X-RateLimit-Remaining": str(max(0, self.limit - self.used)),
+            "X-RateLimit-Reset": str(int(self.reset_at)),
+            "X-RateLimit-Used": str(self.used),
+            "X-RateLimit-Resource": resource,
+        }
+
+
+class FakeGitHub:
+    """In-memory GitHub serving one repository and one Project v2 over local HTTP.
+
+    State (``issues``, ``items``) and per-operation call counts (``calls``) are plain
+    attributes so tests can assert on them. GraphQL documents are dispatched on their
+    operation name; ``graphql_handlers`` can be extended for new operations.
+    """
+
+    def __init__(
+        self,
+        config: FakeGitHubConfig | None = None,
+        *,
+        fields: dict[str, FieldMeta] | None = None,
+        project_id: str = "PVT_fake",
+        labels: tuple[str, ...] = DEFAULT_LABELS,
+        milestones: tuple[str, ...] = DEFAULT_MILESTONES,
+        collaborators: tuple[str, ...] = DEFAULT_COLLABORATORS,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        self.config = config or FakeGitHubConfig()
+        self.fields = fields if fields is not None else synthetic_fields()
+        self.project_id = project_id
+        # name -> node id; milestones are numbered from 1 in order
+        self.labels = {name: f"LA_{i}" for i, name in enumerate(labels)}
+        self.milestones = {title: f"MI_{n}" for n, title in enumerate(milestones, start=1)}
+        self.collaborators = {login: f"U_{login}" for login in collaborators}
+        self.issues: dict[int, dict[str, Any]] = {}
+        self.items: dict[str, dict[str, Any]] = {}  # item id -> {content_id, fields}
+        self.calls: Counter[str] = Counter()
+        self.graphql_handlers: dict[str, GraphQLHandler] = {
+            "ProjectFields": self._gql_project_fields,
+            "AddProjectV2Item": self._gql_add_item,
+            "UpdateProjectV2ItemFieldValue": self._gql_update_field,
+            "BatchUpdateProjectV2ItemFieldValues": self._gql_batch_update,
+            "ProjectItems": self._gql_project_items,
+            "ProjectItemStamps": self._gql_project_item_stamps,
+            "ProjectItemsByIds": self._gql_items_by_ids,
+            "RepositoryId": self._gql_repository_id,
+            "CreateIssue": self._gql_create_issue,
+            "RepoIndex": self._gql_repo_index,
+        }
+        self._lock = threading.Lock()
+        self._rng = random.Random(self.config.seed)
+        self._windows = {
+            r: _Window(self.config.rate_limit, self.config.rate_window_s)
+            for r in ("core", "graphql")
+        }
+        self._item_by_content: dict[str, str] = {}
+        self._item_seq = 0
+        self._in_flight = 0
+        self._issue_by_node: dict[str, int] = {}
+        self._fields_by_id = {m.id: m for m in self.fields.values()}
+        self._server = ThreadingHTTPServer((host, port), _make_handler(self))
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> FakeGitHub:
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """Serve on the calling thread (for ``python -m``); ``start`` serves in the background."""
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> FakeGitHub:
+        return self.start()
+
+    def __exit__(self, *exc: object) -> None:
+        self.stop()
+
+    # ---- request plumbing (called from handler threads) ----
+
+    def _delay_and_maybe_fail(self, others: int) -> bool:
+        cfg = self.config
+        with self._lock:
+            jitter = self._rng.random() * cfg.jitter_s if cfg.jitter_s else 0.0
+            fail = cfg.error_rate > 0 and self._rng.random() < cfg.error_rate
+        delay = cfg.latency_s + jitter + cfg.latency_per_in_flight_s * others
+        if delay:
+            time.sleep(delay)
+        return fail
+
+    def handle(
+        self,
+        method: str,
+        target: str,
+        body: bytes,
+        host: str,
+        if_none_match: str | None = None,
+    ) -> tuple[int, dict[str, str], Any]:
+        with self._lock:
+            others = self._in_flight
+            self._in_flight += 1
+        try:
+            limit = self.config.max_in_flight
+            if limit and others >= limit:
+                with self._lock:
+                    self.calls["secondary_limited"] += 1
+                return (
+                    403,
+                    {"Retry-After": str(self.config.retry_after_s)},
+                    {"message": "You have exceeded a secondary rate limit."},
+                )
+            return self._handle(method, target, body, host, if_none_match, others)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    def _handle(
+        self,
+        method: str,
+        target: str,
+        body: bytes,
+        host: str,
+        if_none_match: str | None,
+        others: int,
+    ) -> tuple[int, dict[str, str], Any]:
+        parts = urlsplit(target)
+        resource = "graphql" if parts.path == "/graphql" else "core"
+        creates = (method == "POST" and parts.path.endswith("/issues")) or (
+            b"mutation CreateIssue" in body
+        )
+        failed = self._delay_and_maybe_fail(others)
+        if failed and (self.config.errors_on_creates or not creates):
+            with self._lock:
+                self.calls["error_502"] += 1
+            return 502, {}, {"message": "Server Error (injected)"}
+        with self._lock:
+            window = self._windows[resource]
+            allowed = window.take()
+            headers = window.headers(resource)
+        if not allowed:
+            return 403, headers, {"message": "API rate limit exceeded"}
+
+        if parts.path == "/graphql" and method == "POST":
+            payload = json.loads(body or b"{}")
+            return 200, headers, self._graphql(payload)
+        m = _ISSUES_PATH_RE.match(parts.path)
+        if m and method == "POST":
+            with self._lock:
+                self.calls["create_issue"] += 1
+            return 201, headers, self._create_issue(json.loads(body or b"{}"), m.group(1, 2))
+        if m and method == "GET":
+            status, extra, data = self._list_issues(parse_qs(parts.query), parts.path, host)
+            etag = _etag(data, extra.get("Link", ""))
+            if if_none_match == etag:
+                # like GitHub, a 304 does not count against the rate limit
+                with self._lock:
+                    self.calls["not_modified"] += 1
+                    window.used -= 1
+                    headers = window.headers(resource)
+                return 304, {**headers, "ETag": etag}, None
+            return status, {**headers, **extra, "ETag": etag}, data
+        return 404, headers, {"message": "Not Found"}
+
+    # ---- REST ----
+
+    def _create_issue(self, data: dict[str, Any], owner_repo: tuple[str, str]) -> dict[str, Any]:
+        with self._lock:
+            number = len(self.issues) + 1
+            issue = {
+                "number": number,
+                "node_id": f"I_{number}",
+                "html_url": f"https://github.com/{owner_repo[0]}/{owner_repo[1]}/issues/{number}",
+                "title": str(data.get("title", "")),
+                "body": str(data.get("body") or ""),
+                "labels": [{"name": str(n)} for n in data.get("labels") or []],
+                "milestone": self._milestone_node(data.get("milestone")),
+                "assignees": [{"login": str(u)} for u in data.get("assignees") or []],
+                "state": "open",
+                "updated_at": _now_iso(),
+            }
+            self.issues[number] = issue
+            self._issue_by_node[issue["node_id"]] = number
+        return issue
+
+    def _milestone_node(self, number: Any) -> dict[str, Any] | None:
+        if number is None:
+            return None
+        title = next(t for n, t in enumerate(self.milestones, start=1) if n == int(number))
+        return {"number": int(number), "title": title}
+
+    def _list_issues(
+        self, query: dict[str, list[str]], path: str, host: str
+    ) -> tuple[int, dict[str, str], Any]:
+        per_page = min(100, int(query.get("per_page", ["30"])[0]))
+        page = int(query.get("page", ["1"])[0])
+        since = query.get("since", [None])[0]
+        with self._lock:
+            self.calls["list_issues"] += 1
+            rows = sorted(self.issues.values(), key=lambda i: (i["updated_at"], i["number"]))
+        if since:
+            rows = [r for r in rows if r["updated_at"] >= since]
+        chunk = rows[(page - 1) * per_page : page * per_page]
+        headers: dict[str, str] = {}
+        if page * per_page < len(rows):
+            params = f"per_page={per_page}&page={page + 1}" + (f"&since={since}" if since else "")
+            headers["Link"] = f'<http://{host}{path}?{params}>; rel="next"'
+        return 200, headers, chunk
+
+    # ---- GraphQL ----
+
+    def _graphql(self, payload: dict[str, Any]) -> dict[str, Any]:
+        m = _OPERATION_RE.match(str(payload.get("query", "")))
+        name = m.group(1) if m else ""
+        with self._lock:
+            self.calls[name or "graphql"] += 1
+        handler = self.graphql_handlers.get(name)
+        if handler is None:
+            return {"data": None, "errors": [{"message": f"Unsupported operation {name!r}"}]}
+        data, errors = handler(payload.get("variables") or {})
+        return {"data": data, "errors": errors} if errors else {"data": data}
+
+    def _rate_limit_node(self) -> dict[str, Any]:
+        window = self._windows["graphql"]
+        reset = datetime.fromtimestamp(window.reset_at, timezone.utc)
+        return {
+            "cost": 1,
+            "remaining": window.limit - window.used,
+            "resetAt": reset.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        }
+
+    def _gql_project_fields(self, variables: dict[str, Any]) -> tuple[dict[str, Any], list]:
+        if variables.get("projectId") != self.project_id:
+            return {"node": None, "rateLimit": self._rate_limit_node()}, []
+        start = int(variables.get("after") or 0)
+        names = list(self.fields)
+        nodes = []
+        for name in names[start : start + 100]:
+            meta = self.fields[name]
+            node: dict[str, Any] = {"id": meta.id, "name": name, "dataType": meta.data_type}
+            if meta.data_type == SINGLE_SELECT:
+                node["options"] = [{"id": oid, "name": on} for on, oid in meta.options.items()]
+            nodes.append(node)
+        end = start + len(nodes)
+        page_info = {"hasNextPage": end < len(names), "endCursor": str(end)}
+        fields = {"pageInfo": page_info, "nodes": nodes}
+        return {"node": {"fields": fields}, "rateLimit": self._rate_limit_node()}, []
+
+    def _items_page(
+        self, variables: dict[str, Any], render: Callable[[str], dict[str, Any]]
+    ) -> tuple[dict[str, Any], list]:
+        if variables.get("projectId") != self.project_id:
+            return {"node": None}, []
+        first = min(100, int(variables.get("first") or 100))
+        start = int(variables.get("after") or 0)
+        with self._lock:
+            ids = list(self.items)[start : start + first]
+            nodes = [render(item_id) for item_id in ids]
+            has_next = start + len(ids) < len(self.items)
+        page_info = {"hasNextPage": has_next, "endCursor": str(start + len(ids))}
+        return {"node": {"items": {"pageInfo": page_info, "nodes": nodes}}}, []
+
+    def _gql_project_items(self, variables: dict[str, Any]) -> tuple[dict[str, Any], list]:
+        return self._items_page(variables, self._item_node)
+
+    def _gql_project_item_stamps(
+        self, variables: dict[str, Any]
+    ) -> tuple[dict[str, Any], list]:
+        def _stamp(item_id: str) -> dict[str, Any]:
+            node = self._item_node(item_id)
+            return {
+                "id": item_id,
+                "updatedAt": node["updatedAt"],
+                "content": {"updatedAt": node["content"]["updatedAt"]},
+            }
+
+        return self._items_page(variables, _stamp)
+
+    def _gql_items_by_ids(self, variables: dict[str, Any]) -> tuple[dict[str, Any], list]:
+        ids = [str(i) for i in variables.get("ids") or []]
+        with self._lock:
+            nodes = [self._item_node(i) if i in self.items else None for i in ids]
+        return {"nodes": nodes}, []
+
+    def _item_node(self, item_id: str) -> dict[str, Any]:
+        item = self.items[item_id]
+        issue = self.issues[self._issue_by_node[item["content_id"]]]
+        owner_repo = "/".join(issue["html_url"].split("/")[3:5])
+        values = []
+        for field_id, value in item["fields"].items():
+            meta = self._fields_by_id[field_id]
+            key = _VALUE_KEYS_BY_TYPE[meta.data_type]
+            values.append({key: value, "field": {"id": field_id}})
+        return {
+            "id": item_id,
+            "updatedAt": item["updated_at"],
+            "content": {
+                "__typename": "Issue",
+                "id": issue["node_id"],
+                "number": issue["number"],
+                "title": issue["title"],
+                "url": issue["html_url"],
+                "state": issue["state"].upper(),
+                "updatedAt": issue["updated_at"],
+                "repository": {"nameWithOwner": owner_repo},
+            },
+            "fieldValues": {"nodes": values},
+        }
+
+    def _gql_repository_id(self, variables: dict[str, Any]) -> tuple[dict[str, Any], list]:
+        # any owner/name exists; the id encodes it so createIssue knows where to create
+        owner, name = str(variables.get("owner", "")), str(variables.get("name", ""))
+        return {"repository": {"id": f"R_{owner}/{name}"}}, []
+
+    def _gql_repo_index(self, variables: dict[str, Any]) -> tuple[dict[str, Any], list]:
+        def _page(flag: str, after: str, nodes: list[dict[str, Any]]) -> dict[str, Any] | None:
+            if not variables.get(flag):
+                return None
+            start = int(variables.get(after) or 0)
+            end = min(start + 100, len(nodes))
+            page_info = {"hasNextPage": end < len(nodes), "endCursor": str(end)}
+            return {"pageInfo": page_info, "nodes": nodes[start:end]}
+
+        milestones = [
+            {"id": mid, "number": n, "title": title}
+            for n, (title, mid) in enumerate(self.milestones.items(), start=1)
+        ]
+        repo = {
+            "labels": _page(
+                "withLabels",
+                "labelsAfter",
+                [{"id": lid, "name": name} for name, lid in self.labels.items()],
+            ),
+            "milestones": _page("withMilestones", "milestonesAfter", milestones),
+            "assignableUsers": _page(
+                "withUsers",
+                "usersAfter",
+                [{"id": uid, "login": login} for login, uid in self.collaborators.items()],
+            ),
+        }
+        return {"repository": {k: v for k, v in repo.items() if v is not None}}, []
+
+    def _gql_create_issue(self, variables: dict[str, Any]) -> tuple[dict[str, Any], list]:
+        repo_id = str(variables.get("repositoryId", ""))
+        owner, sep, name = repo_id.removeprefix("R_").partition("/")
+        if not repo_id.startswith("R_") or not sep:
+            message = f"Could not resolve to a Repository with the global id of '{repo_id}'"
+            return {"createIssue": None}, [{"message": message}]
+        # node ids -> the names/number REST takes
+        names = {v: k for k, v in (*self.labels.items(), *self.collaborators.items())}
+        numbers = {mid: n for n, mid in enumerate(self.milestones.values(), start=1)}
+        data = {
+            "title": variables.get("title"),
+            "body": variables.get("body"),
+            "labels": [names[i] for i in variables.get("labelIds") or []],
+            "milestone": numbers.get(str(variables.get("milestoneId"))),
+            "assignees": [names[i] for i in variables.get("assigneeIds") or []],
+        }
+        issue = self._create_issue(data, (owner, name))
+        nodes = []
+        with self._lock:
+            for project_id in variables.get("projectIds") or []:
+                if project_id == self.project_id:
+                    item_id = self._add_item_locked(issue["node_id"])
+                    nodes.append({"id": item_id, "project": {"id": project_id}})
+        created = {
+            "number": issue["number"],
+            "id": issue["node_id"],
+            "url": issue["html_url"],
+            "projectItems": {"nodes": nodes},
+        }
+        return {"createIssue": {"issue": created}}, []
+
+    def _gql_add_item(self, variables: dict[str, Any]) -> tuple[dict[str, Any], list]:
+        content_id = str(variables.get("contentId", ""))
+        with self._lock:
+            if content_id not in self._issue_by_node:
+                message = f"Could not resolve to a node with the global id of '{content_id}'"
+                return {"addProjectV2ItemById": None}, [{"message": message}]
+            # adding the same content twice returns the existing item, like GitHub does
+            item_id = self._add_item_locked(content_id)
+        return {"addProjectV2ItemById": {"item": {"id": item_id}}}, []
+
+    def _add_item_locked(self, content_id: str) -> str:
+        item_id = self._item_by_content.get(content_id)
+        if item_id is None:
+            self._item_seq += 1
+            item_id = f"PVTI_{self._item_seq}"
+            self.items[item_id] = {"content_id": content_id, "fields": {}, "updated_at": _now_iso()}
+            self._item_by_content[content_id] = item_id
+        return item_id
+
+    def seed_item(self, title: str, values: dict[str, Any] | None = None, body: str = "") -> str:
+        """Create an issue already on the board; ``values`` maps field name -> option label."""
+        issue = self._create_issue({"title": title, "body": body}, ("octo", "demo"))
+        with self._lock:
+            item_id = self._add_item_locked(issue["node_id"])
+        for name, label in (values or {}).items():
+            meta = self.fields[name]
+            value = meta.options.get(label, label) if meta.options else label
+            self._set_value(item_id, meta.id, value)
+        return item_id
+
+    def remove_item(self, item_id: str) -> None:
+        """Take an item off the board (the issue itself stays)."""
+        with self._lock:
+            item = self.items.pop(item_id)
+            self._item_by_content.pop(item["content_id"], None)
+
+    def _set_value(self, item_id: str, field_id: str, value: Any) -> str | None:
+        """Apply one field value; returns an error message instead of raising."""
+        meta = self._fields_by_id.get(field_id)
+        if meta is None:
+            return f"Could not resolve to a ProjectV2Field with the global id of '{field_id}'"
+        if meta.data_type == SINGLE_SELECT and value not in meta.options.values():
+            return f"The single select option Id does not belong to the field: {value}"
+        with self._lock:
+            item = self.items.get(item_id)
+            if item is None:
+                return f"Could not resolve to a ProjectV2Item with the global id of '{item_id}'"
+            item["fields"][field_id] = value
+            item["updated_at"] = _now_iso()
+        return None
+
+    def _gql_update_field(self, variables: dict[str, Any]) -> tuple[dict[str, Any], list]:
+        item_id = str(variables.get("itemId", ""))
+        error = self._set_value(item_id, str(variables.get("fieldId")), variables.get("optionId"))
+        if error:
+            return {"updateProjectV2ItemFieldValue": None}, [{"message": error}]
+        return {"updateProjectV2ItemFieldValue": {"projectV2Item": {"id": item_id}}}, []
+
+    def _gql_batch_update(self, variables: dict[str, Any]) -> tuple[dict[str, Any], list]:
+        data: dict[str, Any] = {}
+        errors: list[dict[str, Any]] = []
+        i = 0
+        while f"item{i}" in variables:
+            alias, item_id = f"f{i}", str(variables[f"item{i}"])
+            error = self._set_value(item_id, str(variables[f"field{i}"]), variables[f"value{i}"])
+            if error:
+                data[alias] = None
+                errors.append({"path": [alias], "message": error})
+            else:
+                data[alias] = {"projectV2Item": {"id": item_id}}
+            i += 1
+        return data, errors
+
+
+def _make_handler(app: FakeGitHub) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive, so client connection pooling is realistic
+        disable_nagle_algorithm = True  # headers and body go out in separate writes
+
+        def _serve(self, method: str) -> None:
+            length = int(self.headers.get("Content-Length") or 0)
+            body = self.rfile.read(length) if length else b""
+            host = self.headers.get("Host") or "127.0.0.1"
+            status, headers, data = app.handle(
+                method, self.path, body, host, if_none_match=self.headers.get("If-None-Match")
+            )
+            raw = b"" if status == 304 else json.dumps(data).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(raw)))
+            for k, v in headers.items():
+                self.send_header(k, v)
+            self.end_headers()
+            self.wfile.write(raw)
+
+        def do_GET(self) -> None:  # noqa: N802
+            self._serve("GET")
+
+        def do_POST(self) -> None:  # noqa: N802
+            self._serve("POST")
+
+        def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+            pass
+
+    return Handler
+
+
+def build_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(description="Run a local fake GitHub API for offline testing")
+    p.add_argument("--port", type=int, default=8765)
+    p.add_argument("--latency-ms", type=float, default=0.0)
+    p.add_argument("--jitter-ms", type=float, default=0.0)
+    p.add_argument("--error-rate", type=float, default=0.0)
+    p.add_argument("--rate-limit", type=int, default=5000)
+    p.add_argument("--max-in-flight", type=int, default=0)
+    p.add_argument("--latency-per-in-flight-ms", type=float, default=0.0)
+    return p
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    config = FakeGitHubConfig(
+        latency_s=args.latency_ms / 1000,
+        jitter_s=args.jitter_ms / 1000,
+        error_rate=args.error_rate,
+        rate_limit=args.rate_limit,
+        max_in_flight=args.max_in_flight,
+        latency_per_in_flight_s=args.latency_per_in_flight_ms / 1000,
+    )
+    server = FakeGitHub(config, port=args.port)
+    print(f"Fake GitHub API on {server.url} (project id {server.project_id}); Ctrl-C to stop")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
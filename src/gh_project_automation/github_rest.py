@@ -1,31 +1,86 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Iterator, Sequence
 
 import requests
 
-from .utils import ApiError, retry
+from .retry_policy import http_error
+from .transport import HttpTransport
 
 
 @dataclass(frozen=True)
 class GitHubREST:
-    token: str
-    api_base: str = "https://api.github.com"
+    transport: HttpTransport
 
-    def _headers(self) -> dict[str, str]:
-        return {
-            "Authorization": f"Bearer {self.token}",
-            "Accept": "application/vnd.github+json",
-        }
+    @property
+    def api_base(self) -> str:
+        return self.transport.api_base
 
-    def create_issue(self, *, owner: str, repo: str, title: str, body: str) -> dict[str, Any]:
-        url = f"{self.api_base}/repos/{owner}/{repo}/issues"
+    def create_issue(
+        self,
+        *,
+        owner: str,
+        repo: str,
+        title: str,
+        body: str,
+        labels: Sequence[str] = (),
+        milestone: int | None = None,
+        assignees: Sequence[str] = (),
+    ) -> dict[str, Any]:
+        url = self.transport.url(f"repos/{owner}/{repo}/issues")
+        payload: dict[str, Any] = {"title": title, "body": body}
+        if labels:
+            payload["labels"] = list(labels)
+        if milestone is not None:
+            payload["milestone"] = milestone
+        if assignees:
+            payload["assignees"] = list(assignees)
 
         def _do() -> dict[str, Any]:
-            resp = requests.post(url, json={"title": title, "body": body}, headers=self._headers(), timeout=30)
+            resp = self.transport.post(
+                url, json=payload, creates_content=True, op="create_issue"
+            )
             if resp.status_code >= 400:
-                raise ApiError(f"REST HTTP {resp.status_code}: {resp.text}")
+                raise http_error("REST", resp)
             return resp.json()
 
-        return retry(_do, retry_on=(requests.RequestException, ApiError))
+        return self.transport.with_retries(_do, op="create_issue", idempotent=False)
+
+    def _get_page(self, url: str, params: dict[str, Any] | None, op: str) -> requests.Response:
+        def _do() -> requests.Response:
+            resp = self.transport.get(url, params=params, op=op)
+            if resp.status_code >= 400:
+                raise http_error("REST", resp)
+            return resp
+
+        return self.transport.with_retries(_do, op=op)
+
+    def paginate(
+        self, path: str, *, params: dict[str, Any] | None = None, op: str = "rest_list"
+    ) -> Iterator[Any]:
+        """Yield every element of a list endpoint, following ``Link: rel="next"`` headers."""
+        url: str | None = self.transport.url(path)
+        page_params: dict[str, Any] | None = {"per_page": 100, **(params or {})}
+        while url:
+            resp = self._get_page(url, page_params, op)
+            yield from resp.json()
+            url = resp.links.get("next", {}).get("url")
+            page_params = None  # the next link already carries the query string
+
+    def list_issues(
+        self,
+        *,
+        owner: str,
+        repo: str,
+        since: str | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """All issues (open and closed, pull requests excluded), oldest update first."""
+        params: dict[str, Any] = {"state": "all", "sort": "updated", "direction": "asc"}
+        if since:
+            params["since"] = since
+        for item in self.paginate(
+            f"repos/{owner}/{repo}/issues", params=params, op="list_issues"
+        ):
+            if "pull_request" not in item:
+                yield item
@@ -1,38 +1,118 @@
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
-import requests
+from .retry_policy import http_error
+from .transport import HttpTransport
+from .utils import GraphQLError
 
-from .utils import ApiError, retry
+# Metric names for this tool's documents; other operations are reported under their own name.
+OPERATION_METRIC_NAMES = {
+    "AddProjectV2Item": "add_item",
+    "UpdateProjectV2ItemFieldValue": "update_field",
+    "BatchUpdateProjectV2ItemFieldValues": "update_field",
+    "ProjectFields": "fetch_fields",
+    "ProjectItems": "list_items",
+    "ProjectItemStamps": "list_item_stamps",
+    "ProjectItemsByIds": "get_items",
+    "RepositoryId": "get_repository",
+    "CreateIssue": "create_issue",
+}
+
+# GitHub's secondary limit charges 5 points for a request with mutations. A mutation cannot
+# select `rateLimit`, so its cost is recorded as this estimate (and flagged as one in metrics).
+MUTATION_COST_ESTIMATE = 5
+
+_OPERATION_NAME_RE = re.compile(r"^\s*(?:query|mutation)\s+(\w+)")
+
+
+@lru_cache(maxsize=256)
+def operation_metric_name(document: str) -> str:
+    m = _OPERATION_NAME_RE.match(document)
+    if m is None:
+        return "graphql"
+    return OPERATION_METRIC_NAMES.get(m.group(1), m.group(1))
 
 
 @dataclass(frozen=True)
 class GraphQLClient:
-    token: str
-    api_base: str = "https://api.github.com"
+    transport: HttpTransport
 
     @property
     def endpoint(self) -> str:
-        return f"{self.api_base}/graphql"
+        return self.transport.url("graphql")
 
-    def query(self, query: str, variables: dict[str, Any] | None = None) -> dict[str, Any]:
-        def _do() -> dict[str, Any]:
-            resp = requests.post(
-                self.endpoint,
-                json={"query": query, "variables": variables or {}},
-                headers={
-                    "Authorization": f"Bearer {self.token}",
-                    "Accept": "application/vnd.github+json",
-                },
-                timeout=30,
+    def _post(
+        self,
+        query: str,
+        variables: dict[str, Any] | None,
+        op: str,
+        *,
+        creates_content: bool = False,
+    ) -> dict[str, Any]:
+        resp = self.transport.post(
+            self.endpoint,
+            json={"query": query, "variables": variables or {}},
+            creates_content=creates_content,
+            op=op,
+        )
+        if resp.status_code >= 400:
+            raise http_error("GraphQL", resp)
+        payload = resp.json()
+        # Queries that select `rateLimit { cost remaining resetAt }` feed the shared budget.
+        rate_limit = (payload.get("data") or {}).get("rateLimit")
+        if rate_limit:
+            self.transport.observe_graphql(rate_limit)
+            if rate_limit.get("cost") is not None:
+                self.transport.metrics.observe_graphql_cost(op, int(rate_limit["cost"]))
+        elif query.lstrip().startswith("mutation"):
+            self.transport.metrics.observe_graphql_cost(
+                op, MUTATION_COST_ESTIMATE, estimated=True
             )
-            if resp.status_code >= 400:
-                raise ApiError(f"GraphQL HTTP {resp.status_code}: {resp.text}")
-            data = resp.json()
+        return payload
+
+    def query(
+        self,
+        query: str,
+        variables: dict[str, Any] | None = None,
+        *,
+        creates_content: bool = False,
+    ) -> dict[str, Any]:
+        op = operation_metric_name(query)
+
+        def _do() -> dict[str, Any]:
+            data = self._post(query, variables, op, creates_content=creates_content)
             if "errors" in data and data["errors"]:
-                raise ApiError(f"GraphQL errors: {data['errors']}")
+                raise GraphQLError(data["errors"])
             return data["data"]
 
-        return retry(_do, retry_on=(requests.RequestException, ApiError))
+        return self.transport.with_retries(_do, op=op, idempotent=not creates_content)
+
+    def query_partial(
+        self,
+        query: str,
+        variables: dict[str, Any] | None = None,
+        *,
+        creates_content: bool = False,
+    ) -> tuple[dict[str, Any], list[dict[str, Any]]]:
+        """Like ``query`` but return ``(data, errors)`` instead of raising on GraphQL errors.
+
+        Aliased batch documents can partially succeed; callers map ``errors[*].path`` back
+        to the alias that failed. HTTP failures are still retried and raised, as are
+        errors that come without any data.
+        ``creates_content`` paces the request like other content-creating calls.
+        """
+        op = operation_metric_name(query)
+
+        def _do() -> tuple[dict[str, Any], list[dict[str, Any]]]:
+            payload = self._post(query, variables, op, creates_content=creates_content)
+            errors = payload.get("errors") or []
+            data = payload.get("data")
+            if data is None:
+                raise GraphQLError(errors)
+            return data, errors
+
+        return self.transport.with_retries(_do, op=op, idempotent=not creates_content)
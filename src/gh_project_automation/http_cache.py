@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Mapping
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+DEFAULT_MAX_BYTES = 100 * 1024 * 1024
+# Response headers kept with a cached body; `Link` is needed to keep paginating from cache.
+STORED_HEADERS = ("Content-Type", "Link", "ETag", "Last-Modified")
+_SUFFIX = ".entry"
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    url: str
+    headers: dict[str, str]
+    body: bytes
+
+    @property
+    def validators(self) -> dict[str, str]:
+        """Conditional request headers that revalidate this entry."""
+        out = {}
+        if "ETag" in self.headers:
+            out["If-None-Match"] = self.headers["ETag"]
+        if "Last-Modified" in self.headers:
+            out["If-Modified-Since"] = self.headers["Last-Modified"]
+        return out
+
+    def to_response(self, request: requests.PreparedRequest | None = None) -> requests.Response:
+        """A 200 response carrying the cached body, as if the server had sent it again."""
+        resp = requests.Response()
+        resp.status_code = 200
+        resp.url = self.url
+        resp.headers = CaseInsensitiveDict(self.headers)
+        resp._content = self.body
+        resp.encoding = "utf-8"
+        if request is not None:
+            resp.request = request
+        return resp
+
+
+class HttpCache:
+    """On-disk cache of GET responses for conditional requests (``ETag``/``Last-Modified``).
+
+    One file per URL holds the validators, the headers in ``STORED_HEADERS`` and the body.
+    Entries are evicted least recently used first once the directory exceeds ``max_bytes``;
+    file modification times carry the recency across runs. Safe to share across threads.
+    """
+
+    def __init__(self, directory: str | Path, *, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._sizes: OrderedDict[str, int] = OrderedDict()  # key -> bytes, oldest first
+        self._total = 0
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(_SUFFIX):
+                st = entry.stat()
+                entries.append((st.st_mtime, entry.name[: -len(_SUFFIX)], st.st_size))
+        for _, key, size in sorted(entries):
+            self._sizes[key] = size
+            self._total += size
+
+    def __len__(self) -> int:
+        return len(self._sizes)
+
+    @staticmethod
+    def key(url: str) -> str:
+        return hashlib.sha256(url.encode()).hexdigest()[:32]
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}{_SUFFIX}"
+
+    def get(self, url: str) -> CachedResponse | None:
+        key = self.key(url)
+        with self._lock:
+            if key not in self._sizes:
+                return None
+            self._sizes.move_to_end(key)
+        path = self._path(key)
+        try:
+            raw = path.read_bytes()
+            os.utime(path)
+        except FileNotFoundError:
+            self._forget(key)
+            return None
+        meta, _, body = raw.partition(b"\n")
+        try:
+            info = json.loads(meta)
+        except json.JSONDecodeError:
+            self._forget(key)
+            return None
+        if info.get("url") != url:  # hash collision or foreign file
+            return None
+        return CachedResponse(url=url, headers=dict(info.get("headers") or {}), body=body)
+
+    def put(self, url: str, headers: Mapping[str, str], body: bytes) -> None:
+        """Store a 200 response that carries a validator; anything else is not worth keeping."""
+        kept = {h: headers[h] for h in STORED_HEADERS if h in headers}
+        if "ETag" not in kept and "Last-Modified" not in kept:
+            return
+        key = self.key(url)
+        blob = json.dumps({"url": url, "headers": kept}).encode() + b"\n" + body
+        path = self._path(key)
+        tmp = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(blob)
+        tmp.replace(path)
+        with self._lock:
+            self._total += len(blob) - self._sizes.pop(key, 0)
+            self._sizes[key] = len(blob)
+            evicted = self._evict_locked()
+        for old in evicted:
+            self._path(old).unlink(missing_ok=True)
+
+    def _evict_locked(self) -> list[str]:
+        evicted = []
+        while self._total > self.max_bytes and len(self._sizes) > 1:
+            old, size = self._sizes.popitem(last=False)
+            self._total -= size
+            evicted.append(old)
+        return evicted
+
+    def _forget(self, key: str) -> None:
+        with self._lock:
+            self._total -= self._sizes.pop(key, 0)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {"entries": len(self._sizes), "bytes": self._total}
@@ -1,10 +1,48 @@
 from __future__ import annotations
 
+import threading
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING, Any, Sequence
 
 from .github_rest import GitHubREST
-from .utils import console
+from .reporter import Reporter, RichReporter
+from .utils import ApiError, GraphQLError
+
+if TYPE_CHECKING:
+    from .dedupe import DedupeIndex
+    from .graphql_client import GraphQLClient
+    from .repo_index import RepoRef
+
+# rest: POST /issues, then add the issue to the project in a second call.
+# graphql: createIssue with projectV2Ids creates and adds it in one request (REST as fallback).
+CREATE_MODES = ("rest", "graphql")
+
+REPOSITORY_ID_QUERY = """
+query RepositoryId($owner: String!, $name: String!) {
+  repository(owner: $owner, name: $name) { id }
+}
+"""
+
+CREATE_ISSUE_MUTATION = """
+mutation CreateIssue(
+  $repositoryId: ID!, $title: String!, $body: String, $projectIds: [ID!],
+  $labelIds: [ID!], $milestoneId: ID, $assigneeIds: [ID!]
+) {
+  createIssue(
+    input: {
+      repositoryId: $repositoryId, title: $title, body: $body, projectV2Ids: $projectIds,
+      labelIds: $labelIds, milestoneId: $milestoneId, assigneeIds: $assigneeIds
+    }
+  ) {
+    issue {
+      number
+      id
+      url
+      projectItems(first: 20) { nodes { id project { id } } }
+    }
+  }
+}
+"""
 
 
 @dataclass(frozen=True)
@@ -12,24 +50,199 @@ class CreatedIssue:
     number: int
     node_id: str
     html_url: str
+    existing: bool = False  # matched an issue already in the repository
+    item_id: str | None = None  # project item, when creation also added it to the project
+
+
+class _GraphQLCreateUnavailable(Exception):
+    """The GraphQL path cannot be used (nothing was created); fall back to REST."""
+
+
+# Errors that would reject every createIssue of the run, not just this one: the API does not
+# know the mutation's arguments or types (projectV2Ids on older GitHub Enterprise Server), or
+# the token may not create through it.
+_SCHEMA_ERROR_CODES = frozenset(
+    {"argumentNotAccepted", "undefinedType", "undefinedField", "variableMismatch"}
+)
+
+
+def _unsupported(errors: Sequence[dict[str, Any]]) -> bool:
+    for error in errors:
+        code = (error.get("extensions") or {}).get("code")
+        if code in _SCHEMA_ERROR_CODES or error.get("type") == "FORBIDDEN":
+            return True
+        if "projectV2Ids" in str(error.get("message") or ""):
+            return True
+    return False
 
 
 class IssueCreator:
-    def __init__(self, rest: GitHubREST, *, owner: str, repo: str) -> None:
+    def __init__(
+        self,
+        rest: GitHubREST,
+        *,
+        owner: str,
+        repo: str,
+        quiet: bool = False,
+        dedupe: DedupeIndex | None = None,
+        reporter: Reporter | None = None,
+        gql: GraphQLClient | None = None,
+        project_id: str = "",
+        via: str = "rest",
+    ) -> None:
+        if via not in CREATE_MODES:
+            raise ValueError(f"via must be one of {', '.join(CREATE_MODES)}")
+        if via == "graphql" and (gql is None or not project_id):
+            raise ValueError("creating via GraphQL needs gql and project_id")
         self.rest = rest
         self.owner = owner
         self.repo = repo
+        self.gql = gql
+        self.project_id = project_id
+        self.via = via
+        self._repository_id: str | None = None
+        self._lock = threading.Lock()
+        self.quiet = quiet  # concurrent runs report per issue from the engine instead
+        self.dedupe = dedupe
+        self.reporter = reporter or RichReporter()
+        if not self.reporter.verbose:
+            self.quiet = True
+
+    def _print(self, msg: str) -> None:
+        if not self.quiet:
+            self.reporter.log(msg)
+
+    def create(
+        self,
+        *,
+        title: str,
+        body: str,
+        execute: bool,
+        labels: Sequence[RepoRef] = (),
+        milestone: RepoRef | None = None,
+        assignees: Sequence[RepoRef] = (),
+    ) -> CreatedIssue:
+        """Create one issue; labels, milestone and assignees (resolved by validation) go in the
+        same request."""
+        if self.dedupe is not None:
+            existing = self.dedupe.lookup(title, body)
+            if existing is not None:
+                self._print(f"[dim]Already exists[/dim]: {existing.html_url}")
+                return existing
 
-    def create(self, *, title: str, body: str, execute: bool) -> CreatedIssue:
         if not execute:
-            console.print(f"[yellow]DRY-RUN[/yellow] would create issue: {title}")
+            if self.via == "graphql":
+                self._print(
+                    f"[yellow]DRY-RUN[/yellow] would create issue in the project: {title}"
+                )
+                return CreatedIssue(
+                    number=-1,
+                    node_id="DRY_RUN_NODE_ID",
+                    html_url="DRY_RUN_URL",
+                    item_id="DRY_RUN_ITEM_ID",
+                )
+            self._print(f"[yellow]DRY-RUN[/yellow] would create issue: {title}")
             # Placeholder values
             return CreatedIssue(number=-1, node_id="DRY_RUN_NODE_ID", html_url="DRY_RUN_URL")
 
-        console.print(f"[cyan]Creating issue[/cyan]: {title}")
-        data = self.rest.create_issue(owner=self.owner, repo=self.repo, title=title, body=body)
+        created = None
+        if self.via == "graphql":
+            try:
+                created = self._create_graphql(title, body, labels, milestone, assignees)
+            except _GraphQLCreateUnavailable as e:
+                with self._lock:
+                    switched, self.via = self.via == "graphql", "rest"
+                if switched:  # every later issue would fail the same way
+                    self.reporter.message(
+                        f"[yellow]GraphQL issue creation unavailable ({e}); using REST[/yellow]"
+                    )
+        if created is None:
+            self._print(f"[cyan]Creating issue[/cyan]: {title}")
+            data = self.rest.create_issue(
+                owner=self.owner,
+                repo=self.repo,
+                title=title,
+                body=body,
+                labels=[r.name for r in labels],
+                milestone=milestone.number if milestone is not None else None,
+                assignees=[r.name for r in assignees],
+            )
+            created = CreatedIssue(
+                number=int(data["number"]),
+                node_id=str(data["node_id"]),
+                html_url=str(data["html_url"]),
+            )
+        if self.dedupe is not None:
+            self.dedupe.add(title, body, created)
+        return created
+
+    def repository_id(self) -> str:
+        """Node ID of the target repository, looked up once and cached."""
+        assert self.gql is not None
+        with self._lock:
+            if self._repository_id is None:
+                try:
+                    data = self.gql.query(
+                        REPOSITORY_ID_QUERY, {"owner": self.owner, "name": self.repo}
+                    )
+                except ApiError as e:
+                    raise _GraphQLCreateUnavailable(f"repository lookup failed: {e}") from e
+                repo = data.get("repository")
+                if not repo:
+                    name = f"{self.owner}/{self.repo}"
+                    raise _GraphQLCreateUnavailable(f"repository {name} not found")
+                self._repository_id = str(repo["id"])
+            return self._repository_id
+
+    def _create_graphql(
+        self,
+        title: str,
+        body: str,
+        labels: Sequence[RepoRef],
+        milestone: RepoRef | None,
+        assignees: Sequence[RepoRef],
+    ) -> CreatedIssue:
+        assert self.gql is not None
+        variables: dict[str, Any] = {
+            "repositoryId": self.repository_id(),
+            "title": title,
+            "body": body,
+            "projectIds": [self.project_id],
+        }
+        if labels:
+            variables["labelIds"] = [r.id for r in labels]
+        if milestone is not None:
+            variables["milestoneId"] = milestone.id
+        if assignees:
+            variables["assigneeIds"] = [r.id for r in assignees]
+        self._print(f"[cyan]Creating issue in the project[/cyan]: {title}")
+        try:
+            data, errors = self.gql.query_partial(
+                CREATE_ISSUE_MUTATION, variables, creates_content=True
+            )
+        except GraphQLError as e:
+            # rejected without data (e.g. projectV2Ids unknown to this API): nothing was created
+            if not e.rate_limited and _unsupported(e.errors):
+                raise _GraphQLCreateUnavailable(f"createIssue failed: {e.errors}") from e
+            raise
+        issue: dict[str, Any] | None = (data.get("createIssue") or {}).get("issue")
+        if issue is None:
+            # the mutation was rejected as a whole, so nothing exists yet and REST is safe; an
+            # error about this issue's own input fails the issue, not the GraphQL path
+            if _unsupported(errors):
+                raise _GraphQLCreateUnavailable(f"createIssue failed: {errors}")
+            raise GraphQLError(errors)
+        item_id = next(
+            (
+                str(n["id"])
+                for n in (issue.get("projectItems") or {}).get("nodes") or []
+                if (n.get("project") or {}).get("id") == self.project_id
+            ),
+            None,  # not added (e.g. no project access): the pipeline adds it separately
+        )
         return CreatedIssue(
-            number=int(data["number"]),
-            node_id=str(data["node_id"]),
-            html_url=str(data["html_url"]),
+            number=int(issue["number"]),
+            node_id=str(issue["id"]),
+            html_url=str(issue["url"]),
+            item_id=item_id,
         )
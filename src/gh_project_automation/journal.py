@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Any, Iterable
+
+from .issue_creator import CreatedIssue
+from .utils import ValidationError
+
+DEFAULT_FSYNC_EVERY = 20
+
+
+@dataclass
+class JournalEntry:
+    created: CreatedIssue | None = None
+    item_id: str | None = None
+    fields_applied: set[str] = field(default_factory=set)  # field node IDs
+    done: bool = False
+
+
+class RunJournal:
+    """Append-only JSON-lines record of per-issue progress for ``--execute`` runs.
+
+    Each line records one completed stage (``created``, ``added``, ``fields``, ``done``) for an
+    issue key. Lines are flushed to the OS as they are written, so a killed process loses
+    nothing; ``fsync`` runs every ``fsync_every`` records and on close to survive power loss.
+    A truncated final line (crash mid-write) is ignored on load and cut off the file, so
+    records appended after a resume start on a line of their own.
+    """
+
+    def __init__(self, path: str | Path, *, fsync_every: int = DEFAULT_FSYNC_EVERY) -> None:
+        self.path = Path(path)
+        self.fsync_every = max(1, fsync_every)
+        self._entries: dict[str, JournalEntry] = {}
+        self._lock = threading.Lock()
+        self._fh: IO[str] | None = None
+        self._unsynced = 0
+        if self.path.exists():
+            self._load()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _load(self) -> None:
+        with self.path.open("rb") as fh:
+            data = fh.read()
+        complete = data.rfind(b"\n") + 1  # end of the last newline-terminated line
+        for line in data[:complete].splitlines():
+            try:
+                rec = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            self._apply(rec)
+        tail = data[complete:]
+        if not tail.strip():
+            return
+        try:
+            self._apply(json.loads(tail))  # written in full, only the newline is missing
+            repair = b"\n"
+        except json.JSONDecodeError:
+            repair = b""  # partial trailing write: cut it off so the next append starts clean
+        with self.path.open("r+b") as fh:
+            fh.truncate(complete)
+            fh.seek(complete)
+            if repair:
+                fh.write(tail.rstrip() + repair)
+
+    def _apply(self, rec: dict[str, Any]) -> None:
+        entry = self._entries.setdefault(str(rec["key"]), JournalEntry())
+        stage = rec.get("stage")
+        if stage == "created":
+            entry.created = CreatedIssue(
+                number=int(rec["number"]),
+                node_id=str(rec["node_id"]),
+                html_url=str(rec["html_url"]),
+                existing=bool(rec.get("existing", False)),
+            )
+        elif stage == "added":
+            entry.item_id = str(rec["item_id"])
+        elif stage == "fields":
+            entry.fields_applied.update(str(f) for f in rec.get("fields", []))
+        elif stage == "done":
+            entry.done = True
+
+    def get(self, key: str) -> JournalEntry | None:
+        with self._lock:
+            return self._entries.get(key)
+
+    def _write(self, rec: dict[str, Any]) -> None:
+        with self._lock:
+            self._apply(rec)
+            if self._fh is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._fh = self.path.open("a", encoding="utf-8")
+            self._fh.write(json.dumps(rec, ensure_ascii=False) + "\n")
+            self._fh.flush()
+            self._unsynced += 1
+            if self._unsynced >= self.fsync_every:
+                os.fsync(self._fh.fileno())
+                self._unsynced = 0
+
+    def record_created(self, key: str, created: CreatedIssue) -> None:
+        self._write(
+            {
+                "key": key,
+                "stage": "created",
+                "number": created.number,
+                "node_id": created.node_id,
+                "html_url": created.html_url,
+                "existing": created.existing,
+            }
+        )
+
+    def record_added(self, key: str, item_id: str) -> None:
+        self._write({"key": key, "stage": "added", "item_id": item_id})
+
+    def record_fields(self, key: str, field_ids: Iterable[str]) -> None:
+        ids = sorted(field_ids)
+        if ids:
+            self._write({"key": key, "stage": "fields", "fields": ids})
+
+    def record_done(self, key: str) -> None:
+        self._write({"key": key, "stage": "done"})
+
+    def close(self) -> None:
+        with self._lock:
+            if self._fh is not None:
+                self._fh.flush()
+                os.fsync(self._fh.fileno())
+                self._fh.close()
+                self._fh = None
+                self._unsynced = 0
+
+    def __enter__(self) -> RunJournal:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+def open_journal(path: str | Path, *, resume: bool) -> RunJournal:
+    """Open ``path`` for a run; refuse to mix a new run into an existing journal."""
+    journal = RunJournal(path)
+    if len(journal) and not resume:
+        raise ValidationError(
+            f"Journal {path} already has {len(journal)} issue(s). "
+            "Pass --resume to continue that run, or choose a new --journal path."
+        )
+    return journal
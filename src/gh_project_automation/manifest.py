@@ -0,0 +1,299 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Sequence
+
+from .dedupe import DedupeIndex
+from .engine import IssuePipeline, run_pipeline
+from .github_rest import GitHubREST
+from .graphql_client import GraphQLClient
+from .issue_creator import IssueCreator
+from .journal import open_journal
+from .project_fields import FieldsCache
+from .project_item_manager import DEFAULT_MAX_BATCH_SIZE, ProjectItemManager
+from .repo_index import RepoIndex
+from .reporter import Reporter, RichReporter
+from .transport import HttpTransport
+from .utils import ConfigError, ValidationError
+from .validator import ValidatedIssue, iter_issues, validate_with_cache
+
+TARGET_KEYS = (
+    "name",
+    "repo",
+    "project_id",
+    "issues",
+    "fields",
+    "journal",
+    "dedupe_index",
+    "repo_index",
+)
+_REQUIRED_KEYS = ("repo", "project_id", "issues", "fields")
+_PATH_KEYS = ("issues", "fields", "journal", "dedupe_index", "repo_index")
+DEFAULT_PARALLEL_TARGETS = 4
+
+
+@dataclass(frozen=True)
+class ManifestTarget:
+    name: str
+    owner: str
+    repo: str
+    project_id: str
+    issues: Path
+    fields: Path
+    journal: Path | None = None
+    dedupe_index: Path | None = None
+    repo_index: Path | None = None
+
+
+def _parse_target(raw: Any, index: int, base_dir: Path) -> ManifestTarget:
+    where = f"target #{index + 1}"
+    if not isinstance(raw, dict):
+        raise ValidationError(f"Manifest {where}: expected an object")
+    unknown = sorted(set(raw) - set(TARGET_KEYS))
+    if unknown:
+        raise ValidationError(f"Manifest {where}: unknown key(s) {', '.join(unknown)}")
+    missing = [k for k in _REQUIRED_KEYS if not str(raw.get(k) or "").strip()]
+    if missing:
+        raise ValidationError(f"Manifest {where}: missing {', '.join(missing)}")
+    owner, sep, repo = str(raw["repo"]).strip().partition("/")
+    if not sep or not owner or not repo or "/" in repo:
+        raise ValidationError(f"Manifest {where}: repo must be 'owner/name', got '{raw['repo']}'")
+    # relative paths are relative to the manifest, so a manifest can be run from anywhere
+    paths = {k: base_dir / str(raw[k]) for k in _PATH_KEYS if raw.get(k)}
+    return ManifestTarget(
+        name=str(raw.get("name") or f"{owner}/{repo}"),
+        owner=owner,
+        repo=repo,
+        project_id=str(raw["project_id"]).strip(),
+        issues=paths["issues"],
+        fields=paths["fields"],
+        journal=paths.get("journal"),
+        dedupe_index=paths.get("dedupe_index"),
+        repo_index=paths.get("repo_index"),
+    )
+
+
+def load_manifest(path: str | Path) -> list[ManifestTarget]:
+    """Read a manifest: ``{"defaults": {...}, "targets": [{...}, ...]}``.
+
+    Each target names a repo (``owner/name``), a project id, an issues file and a fields file,
+    and optionally a journal, a dedupe index and a repository index (labels, milestones,
+    assignees); ``defaults`` fills keys a target leaves out.
+    """
+    p = Path(path)
+    try:
+        raw = json.loads(p.read_text(encoding="utf-8"))
+    except FileNotFoundError as e:
+        raise ConfigError(f"Manifest not found: {p}") from e
+    except json.JSONDecodeError as e:
+        raise ValidationError(f"Invalid JSON in manifest {p}: {e}") from e
+    if not isinstance(raw, dict) or not isinstance(raw.get("targets"), list):
+        raise ValidationError(f"Manifest {p} must be an object with a 'targets' list")
+    defaults = raw.get("defaults") or {}
+    if not isinstance(defaults, dict):
+        raise ValidationError(f"Manifest {p}: 'defaults' must be an object")
+
+    targets = [
+        _parse_target({**defaults, **t} if isinstance(t, dict) else t, i, p.parent)
+        for i, t in enumerate(raw["targets"])
+    ]
+    if not targets:
+        raise ValidationError(f"Manifest {p} has no targets")
+    names = Counter(t.name for t in targets)
+    dup = [n for n, c in names.items() if c > 1]
+    if dup:
+        raise ValidationError(
+            f"Duplicate target name(s) {', '.join(dup)}; set 'name' to tell them apart"
+        )
+    fields_by_project: dict[str, Path] = {}
+    for t in targets:
+        if fields_by_project.setdefault(t.project_id, t.fields) != t.fields:
+            raise ValidationError(
+                f"Project {t.project_id} uses two fields files "
+                f"({fields_by_project[t.project_id]} and {t.fields}); use one per project"
+            )
+    return targets
+
+
+class _TargetReporter(Reporter):
+    """Forwards one target's output to the shared reporter, tagged with the target name.
+
+    Targets run on their own threads, so calls are serialized. Per-target run events become
+    ``target_started``/``target_finished``; the manifest run emits the overall pair itself.
+    """
+
+    _RENAMED = {"run_started": "target_started", "run_finished": "target_finished"}
+
+    def __init__(self, base: Reporter, name: str, lock: threading.Lock) -> None:
+        self.base = base
+        self.name = name
+        self.verbose = base.verbose
+        self._lock = lock
+
+    def rule(self, title: str) -> None:
+        with self._lock:
+            self.base.rule(f"{self.name} · {title}")
+
+    def log(self, message: str) -> None:
+        with self._lock:
+            self.base.log(message)
+
+    def message(self, message: str) -> None:
+        with self._lock:
+            self.base.message(f"[bold]{self.name}[/bold]: {message}")
+
+    def event(self, name: str, **data: Any) -> None:
+        with self._lock:
+            self.base.event(self._RENAMED.get(name, name), target=self.name, **data)
+
+    def preview(self, issues: Sequence[ValidatedIssue], *, limit: int | None = None) -> None:
+        with self._lock:
+            self.base.rule(self.name)
+            self.base.preview(issues, limit=limit)
+
+
+@dataclass
+class TargetResult:
+    name: str
+    counts: Counter[str] = field(default_factory=Counter)
+    error: str | None = None
+
+
+def run_manifest(
+    targets: Sequence[ManifestTarget],
+    *,
+    transport: HttpTransport,
+    execute: bool,
+    create_via: str = "rest",
+    concurrency: int = 1,
+    parallel_targets: int = DEFAULT_PARALLEL_TARGETS,
+    max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+    on_duplicate: str = "skip",
+    resume: bool = False,
+    loose: bool = False,
+    fields_ttl: float | None = None,
+    refresh_fields: bool = True,
+    reporter: Reporter | None = None,
+) -> list[TargetResult]:
+    """Import every target's issues over one shared transport.
+
+    All files are validated before anything is sent; field metadata is loaded (and refreshed
+    at most once) per project, however many targets share it. Up to ``parallel_targets`` targets
+    run at once, each with ``concurrency`` issues in flight; the transport's ``max_in_flight``
+    is what bounds the total. A failing target stops on its own and the others carry on.
+    """
+    reporter = reporter or RichReporter()
+    gql = GraphQLClient(transport)
+    rest = GitHubREST(transport)
+    lock = threading.Lock()
+    tagged = {t.name: _TargetReporter(reporter, t.name, lock) for t in targets}
+
+    caches: dict[str, FieldsCache] = {}
+    repo_indexes: dict[tuple[str, str], RepoIndex] = {}
+    validated: list[list[ValidatedIssue]] = []
+    errors = 0
+    for t in targets:
+        cache = caches.get(t.project_id)
+        if cache is None:
+            cache = FieldsCache(
+                t.fields,
+                gql=gql if refresh_fields else None,
+                project_id=t.project_id,
+                ttl_s=fields_ttl,
+            )
+            if cache.ensure_fresh():
+                tagged[t.name].message(f"Fetched fields metadata into {t.fields}")
+            caches[t.project_id] = cache
+        index = repo_indexes.get((t.owner, t.repo))
+        if index is None:
+            index = RepoIndex(
+                t.repo_index,
+                owner=t.owner,
+                repo=t.repo,
+                gql=gql if refresh_fields else None,
+                ttl_s=fields_ttl,
+            )
+            index.ensure_fresh()
+            repo_indexes[t.owner, t.repo] = index
+        _, report = validate_with_cache(
+            list(iter_issues(t.issues)), cache, loose=loose, repo_index=index
+        )
+        for err in report.errors:
+            tagged[t.name].message(f"[red]Invalid[/red] {err}")
+        errors += len(report.errors)
+        validated.append(report.issues)
+        if report.ok:
+            tagged[t.name].preview(report.issues)
+    if errors:
+        raise ValidationError(f"{errors} validation error(s) across {len(targets)} target(s)")
+
+    def _run(t: ManifestTarget, issues: list[ValidatedIssue]) -> TargetResult:
+        out = tagged[t.name]
+        quiet = concurrency > 1
+        dedupe = None
+        journal = None
+        pipeline: IssuePipeline | None = None
+        try:
+            if t.dedupe_index is not None:
+                dedupe = DedupeIndex(t.dedupe_index, owner=t.owner, repo=t.repo)
+                dedupe.refresh(rest)
+                dedupe.save()
+            journal = open_journal(t.journal, resume=resume) if t.journal else None
+            pipeline = IssuePipeline(
+                creator=IssueCreator(
+                    rest,
+                    owner=t.owner,
+                    repo=t.repo,
+                    quiet=quiet,
+                    dedupe=dedupe,
+                    reporter=out,
+                    gql=gql,
+                    project_id=t.project_id,
+                    via=create_via,
+                ),
+                pim=ProjectItemManager(
+                    gql,
+                    project_id=t.project_id,
+                    max_batch_size=max_batch_size,
+                    quiet=quiet,
+                    reporter=out,
+                ),
+                execute=execute,
+                journal=journal,
+                on_duplicate=on_duplicate,
+            )
+            run_pipeline(
+                pipeline, issues, concurrency=concurrency, total=len(issues), reporter=out
+            )
+        except Exception as e:
+            out.message(f"[red]Failed[/red]: {e}")
+            return TargetResult(t.name, pipeline.counts if pipeline else Counter(), str(e))
+        finally:
+            if journal is not None:
+                journal.close()
+            if dedupe is not None:
+                dedupe.save()
+        return TargetResult(t.name, pipeline.counts)
+
+    total = sum(len(v) for v in validated)
+    reporter.event("run_started", total=total, execute=execute, concurrency=concurrency)
+    started = time.monotonic()
+    counts: Counter[str] = Counter()
+    try:
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(parallel_targets, len(targets))), thread_name_prefix="target"
+        ) as executor:
+            results = list(executor.map(_run, targets, validated))
+        for r in results:
+            counts.update(r.counts)
+    finally:
+        reporter.event(
+            "run_finished", counts=dict(counts), elapsed_s=round(time.monotonic() - started, 3)
+        )
+    return results
@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import json
+import math
+import threading
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Any, Callable, Sequence
+
+# Upper bounds (seconds) of the latency histogram buckets; the last bucket is +Inf.
+LATENCY_BUCKETS: tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, math.inf
+)
+PROM_PREFIX = "gh_project_automation"
+
+Hook = Callable[[str, dict[str, Any]], None]
+
+
+class Histogram:
+    """Fixed-bucket latency histogram (constant memory however long the run is)."""
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS) -> None:
+        self.buckets = tuple(buckets)
+        self.counts = [0] * len(self.buckets)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile by interpolating inside the bucket that contains it."""
+        if self.count == 0:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        lower = 0.0
+        for bound, n in zip(self.buckets, self.counts, strict=True):
+            if n and seen + n >= rank:
+                upper = self.max if math.isinf(bound) else min(bound, self.max)
+                return lower + (upper - lower) * (rank - seen) / n
+            seen += n
+            lower = bound
+        return self.max
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum_s": round(self.sum, 6),
+            "mean_s": round(self.sum / self.count, 6) if self.count else 0.0,
+            "p50_s": round(self.quantile(0.5), 6),
+            "p95_s": round(self.quantile(0.95), 6),
+            "p99_s": round(self.quantile(0.99), 6),
+            "max_s": round(self.max, 6),
+        }
+
+
+class Metrics:
+    """Per-operation API metrics for one run; shared by the transport and both clients.
+
+    Operations are logical names (``create_issue``, ``add_item``, ``update_field``, ...), not
+    URLs. Hooks receive every observation as ``(event, data)`` for external tracers; they run
+    on the calling thread, so they should be cheap. ``graphql_cost`` is the rate-limit cost
+    GitHub reported where a document selects it, plus an estimate for mutations (which cannot);
+    ``graphql_cost_estimated`` is the estimated part. Sections add a named entry to ``summary``
+    (e.g. the adaptive controller's decisions).
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._latency: dict[str, Histogram] = defaultdict(Histogram)
+        self._status: dict[str, Counter[str]] = defaultdict(Counter)
+        self._retries: Counter[str] = Counter()
+        self._backoff_s: Counter[str] = Counter()
+        self._bytes_sent: Counter[str] = Counter()
+        self._bytes_received: Counter[str] = Counter()
+        self._graphql_cost: Counter[str] = Counter()
+        self._graphql_cost_estimated: Counter[str] = Counter()
+        self._rate_wait_s = 0.0
+        self.hooks: list[Hook] = []
+        self.sections: dict[str, Callable[[], dict[str, Any]]] = {}
+
+    def add_hook(self, hook: Hook) -> None:
+        self.hooks.append(hook)
+
+    def add_section(self, name: str, summary: Callable[[], dict[str, Any]]) -> None:
+        self.sections[name] = summary
+
+    def _emit(self, event: str, data: dict[str, Any]) -> None:
+        for hook in self.hooks:
+            hook(event, data)
+
+    def observe_call(
+        self,
+        op: str,
+        *,
+        seconds: float,
+        status: int | str,
+        bytes_sent: int = 0,
+        bytes_received: int = 0,
+        retry_after_s: float | None = None,
+    ) -> None:
+        with self._lock:
+            self._latency[op].observe(seconds)
+            self._status[op][str(status)] += 1
+            self._bytes_sent[op] += bytes_sent
+            self._bytes_received[op] += bytes_received
+        if self.hooks:
+            self._emit(
+                "call",
+                {
+                    "op": op,
+                    "seconds": seconds,
+                    "status": status,
+                    "bytes_sent": bytes_sent,
+                    "bytes_received": bytes_received,
+                    "retry_after_s": retry_after_s,
+                },
+            )
+
+    def observe_retry(self, op: str, *, delay_s: float, error: str = "") -> None:
+        with self._lock:
+            self._retries[op] += 1
+            self._backoff_s[op] += delay_s
+        if self.hooks:
+            self._emit("retry", {"op": op, "delay_s": delay_s, "error": error})
+
+    def observe_rate_wait(self, seconds: float) -> None:
+        if seconds <= 0:
+            return
+        with self._lock:
+            self._rate_wait_s += seconds
+        if self.hooks:
+            self._emit("rate_wait", {"seconds": seconds})
+
+    def observe_graphql_cost(self, op: str, cost: int, *, estimated: bool = False) -> None:
+        with self._lock:
+            self._graphql_cost[op] += cost
+            if estimated:
+                self._graphql_cost_estimated[op] += cost
+        if self.hooks:
+            self._emit("graphql_cost", {"op": op, "cost": cost, "estimated": estimated})
+
+    def summary(self) -> dict[str, Any]:
+        extra = {name: fn() for name, fn in self.sections.items()}
+        with self._lock:
+            ops = sorted(set(self._latency) | set(self._retries) | set(self._graphql_cost))
+            return {
+                "operations": {
+                    op: {
+                        **(self._latency[op].summary() if op in self._latency else {}),
+                        "status": dict(self._status.get(op, {})),
+                        "retries": self._retries[op],
+                        "backoff_s": round(self._backoff_s[op], 6),
+                        "bytes_sent": self._bytes_sent[op],
+                        "bytes_received": self._bytes_received[op],
+                        "graphql_cost": self._graphql_cost[op],
+                        "graphql_cost_estimated": self._graphql_cost_estimated[op],
+                    }
+                    for op in ops
+                },
+                "rate_wait_s": round(self._rate_wait_s, 6),
+                **extra,
+            }
+
+    def to_prometheus(self) -> str:
+        """Render in the Prometheus text exposition format (for node_exporter's textfile dir)."""
+        p = PROM_PREFIX
+        out: list[str] = []
+
+        def _family(name: str, kind: str, help_: str) -> None:
+            out.append(f"# HELP {p}_{name} {help_}")
+            out.append(f"# TYPE {p}_{name} {kind}")
+
+        with self._lock:
+            _family("request_duration_seconds", "histogram", "API call latency by operation.")
+            for op, h in sorted(self._latency.items()):
+                cumulative = 0
+                for bound, n in zip(h.buckets, h.counts, strict=True):
+                    cumulative += n
+                    le = "+Inf" if math.isinf(bound) else repr(bound)
+                    out.append(
+                        f'{p}_request_duration_seconds_bucket{{op="{op}",le="{le}"}} {cumulative}'
+                    )
+                out.append(f'{p}_request_duration_seconds_sum{{op="{op}"}} {h.sum}')
+                out.append(f'{p}_request_duration_seconds_count{{op="{op}"}} {h.count}')
+
+            _family("requests_total", "counter", "API calls by operation and HTTP status.")
+            for op, statuses in sorted(self._status.items()):
+                for status, n in sorted(statuses.items()):
+                    out.append(f'{p}_requests_total{{op="{op}",status="{status}"}} {n}')
+
+            for name, help_, counter in (
+                ("retries_total", "Retried attempts by operation.", self._retries),
+                ("backoff_seconds_total", "Time slept between retries.", self._backoff_s),
+                ("bytes_sent_total", "Request body bytes sent.", self._bytes_sent),
+                ("bytes_received_total", "Response body bytes received.", self._bytes_received),
+                ("graphql_cost_total", "GraphQL rate-limit cost.", self._graphql_cost),
+                (
+                    "graphql_cost_estimated_total",
+                    "Part of the GraphQL cost estimated rather than reported.",
+                    self._graphql_cost_estimated,
+                ),
+            ):
+                _family(name, "counter", help_)
+                for op, value in sorted(counter.items()):
+                    out.append(f'{p}_{name}{{op="{op}"}} {value}')
+
+            _family("rate_wait_seconds_total", "counter", "Time spent pacing for rate limits.")
+            out.append(f"{p}_rate_wait_seconds_total {self._rate_wait_s}")
+        return "\n".join(out) + "\n"
+
+    def write_json(self, path: str | Path) -> None:
+        _write_atomic(Path(path), json.dumps(self.summary(), indent=2) + "\n")
+
+    def write_prometheus(self, path: str | Path) -> None:
+        _write_atomic(Path(path), self.to_prometheus())
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    # Scrapers may read the file at any moment; never let them see a half-written one.
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_text(text, encoding="utf-8")
+    tmp.replace(path)
@@ -1,37 +1,245 @@
 from __future__ import annotations
 
+import hashlib
 import json
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from .utils import ValidationError
+from .utils import ApiError, ValidationError
+
+if TYPE_CHECKING:
+    from .graphql_client import GraphQLClient
+
+# Project v2 field data types this tool can validate and set.
+SINGLE_SELECT = "SINGLE_SELECT"
+ITERATION = "ITERATION"
+NUMBER = "NUMBER"
+TEXT = "TEXT"
+DATE = "DATE"
+SUPPORTED_DATA_TYPES = (SINGLE_SELECT, ITERATION, NUMBER, TEXT, DATE)
+# Types whose values are picked from `options` (label -> node id).
+OPTION_DATA_TYPES = (SINGLE_SELECT, ITERATION)
+
+META_KEY = "_meta"  # reserved top-level key in fields.json for cache bookkeeping
 
 
 @dataclass(frozen=True)
 class FieldMeta:
     id: str
-    options: dict[str, str]  # human label -> option id
+    options: dict[str, str] = field(default_factory=dict)  # human label -> option/iteration id
+    data_type: str = SINGLE_SELECT
 
 
-def load_fields_json(path: str | Path) -> dict[str, FieldMeta]:
-    p = Path(path)
-    raw = json.loads(p.read_text(encoding="utf-8"))
+def parse_fields(raw: Any) -> dict[str, FieldMeta]:
     out: dict[str, FieldMeta] = {}
 
     if not isinstance(raw, dict):
         raise ValidationError("fields.json must be an object mapping field name -> metadata")
 
     for field_name, meta in raw.items():
-        if not isinstance(meta, dict) or "id" not in meta or "options" not in meta:
-            raise ValidationError(f"Invalid metadata for field '{field_name}'. Expected keys: id, options")
-        options = meta["options"]
+        if field_name == META_KEY:
+            continue
+        data_type = str(meta.get("type", SINGLE_SELECT)) if isinstance(meta, dict) else ""
+        well_formed = isinstance(meta, dict) and "id" in meta
+        if well_formed and data_type in OPTION_DATA_TYPES:
+            well_formed = "options" in meta
+        if not well_formed:
+            raise ValidationError(
+                f"Invalid metadata for field '{field_name}'. Expected keys: id, options"
+            )
+        if data_type not in SUPPORTED_DATA_TYPES:
+            raise ValidationError(f"Unsupported type '{data_type}' for field '{field_name}'")
+        options = meta.get("options", {})
         if not isinstance(options, dict):
             raise ValidationError(f"Invalid options for field '{field_name}': must be an object")
-        out[field_name] = FieldMeta(id=str(meta["id"]), options={str(k): str(v) for k, v in options.items()})
+        out[field_name] = FieldMeta(
+            id=str(meta["id"]),
+            options={str(k): str(v) for k, v in options.items()},
+            data_type=data_type,
+        )
     return out
 
 
+def load_fields_json(path: str | Path) -> dict[str, FieldMeta]:
+    p = Path(path)
+    return parse_fields(json.loads(p.read_text(encoding="utf-8")))
+
+
+def fields_to_json(fields: dict[str, FieldMeta]) -> dict[str, Any]:
+    out: dict[str, Any] = {}
+    for name, meta in fields.items():
+        entry: dict[str, Any] = {"id": meta.id}
+        if meta.data_type != SINGLE_SELECT:
+            entry["type"] = meta.data_type
+        if meta.data_type in OPTION_DATA_TYPES:
+            entry["options"] = dict(meta.options)
+        out[name] = entry
+    return out
+
+
+def fields_fingerprint(fields: dict[str, FieldMeta]) -> str:
+    blob = json.dumps(fields_to_json(fields), sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(blob.encode()).hexdigest()[:16]
+
+
+PROJECT_FIELDS_QUERY = """
+query ProjectFields($projectId: ID!, $after: String) {
+  rateLimit { cost remaining resetAt }
+  node(id: $projectId) {
+    ... on ProjectV2 {
+      fields(first: 100, after: $after) {
+        pageInfo { hasNextPage endCursor }
+        nodes {
+          ... on ProjectV2FieldCommon { id name dataType }
+          ... on ProjectV2SingleSelectField { options { id name } }
+          ... on ProjectV2IterationField {
+            configuration {
+              iterations { id title }
+              completedIterations { id title }
+            }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+
+def _field_from_node(node: dict[str, Any]) -> FieldMeta | None:
+    data_type = node.get("dataType")
+    if data_type not in SUPPORTED_DATA_TYPES:
+        return None  # built-in fields (title, assignees, labels, ...) are not set this way
+    options: dict[str, str] = {}
+    if data_type == SINGLE_SELECT:
+        options = {opt["name"]: opt["id"] for opt in node.get("options") or []}
+    elif data_type == ITERATION:
+        conf = node.get("configuration") or {}
+        for it in (conf.get("completedIterations") or []) + (conf.get("iterations") or []):
+            options[it["title"]] = it["id"]
+    return FieldMeta(id=str(node["id"]), options=options, data_type=data_type)
+
+
+def fetch_fields_metadata(gql: GraphQLClient, project_id: str) -> dict[str, FieldMeta]:
+    """Fetch every supported field of a Project v2, following ``fields`` pagination."""
+    out: dict[str, FieldMeta] = {}
+    after: str | None = None
+    while True:
+        data = gql.query(PROJECT_FIELDS_QUERY, {"projectId": project_id, "after": after})
+        node = data.get("node")
+        if not node:
+            raise ValidationError(f"Project {project_id} not found or not a Project v2")
+        conn = node["fields"]
+        for f in conn["nodes"]:
+            meta = _field_from_node(f) if f else None
+            if meta is not None:
+                out[f["name"]] = meta
+        page = conn["pageInfo"]
+        if not page["hasNextPage"]:
+            return out
+        after = page["endCursor"]
+
+
+class FieldsCache:
+    """``fields.json`` treated as a cache of a project's field metadata.
+
+    The file records when it was fetched and a fingerprint of its content. It is refetched
+    (with full pagination) when older than ``ttl_s``, when it was written for another project
+    than ``project_id``, or once per run when validation hits an unknown field/option; a run
+    never refreshes more than once.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        gql: GraphQLClient | None = None,
+        project_id: str | None = None,
+        ttl_s: float | None = None,
+    ) -> None:
+        self.path = Path(path)
+        self.gql = gql
+        self.project_id = project_id
+        self.ttl_s = ttl_s
+        self.refreshed = False
+        self.refresh_error: str | None = None
+        self.fetched_at: float | None = None
+        self.fingerprint: str | None = None
+        self.saved_for: str | None = None  # project the file was fetched from
+        self.fields: dict[str, FieldMeta] = {}
+        if self.path.exists():
+            raw = json.loads(self.path.read_text(encoding="utf-8"))
+            self.fields = parse_fields(raw)
+            meta = raw.get(META_KEY) or {}
+            self.fetched_at = meta.get("fetched_at")
+            self.saved_for = meta.get("project_id")
+            self.fingerprint = meta.get("fingerprint") or fields_fingerprint(self.fields)
+
+    @property
+    def can_refresh(self) -> bool:
+        return self.gql is not None and bool(self.project_id) and not self.refreshed
+
+    def is_stale(self, *, now: float | None = None) -> bool:
+        if not self.fields:
+            return True
+        if self.project_id and self.saved_for and self.saved_for != self.project_id:
+            return True  # another project's field and option IDs
+        if self.ttl_s is None:
+            return False
+        if self.fetched_at is None:
+            return True
+        return (now if now is not None else time.time()) - self.fetched_at > self.ttl_s
+
+    def refresh(self) -> bool:
+        """Refetch and rewrite the file. Returns True when the metadata changed."""
+        if self.gql is None or not self.project_id:
+            raise ValidationError("Cannot refresh fields metadata without a project and client")
+        fields = fetch_fields_metadata(self.gql, self.project_id)
+        self.refreshed = True
+        old = self.fingerprint
+        self.fields = fields
+        self.saved_for = self.project_id
+        self.fetched_at = time.time()
+        self.fingerprint = fields_fingerprint(fields)
+        self.save()
+        return self.fingerprint != old
+
+    def try_refresh(self) -> bool:
+        """``refresh`` for the on-miss path: a failure is recorded, not raised, and not retried."""
+        try:
+            return self.refresh()
+        except (ApiError, OSError) as e:  # requests' network errors subclass OSError
+            self.refreshed = True
+            self.refresh_error = str(e)
+            return False
+
+    def allow_refresh(self) -> None:
+        """Start a new run in a long-lived process: one more refresh on a miss is allowed."""
+        self.refreshed = False
+        self.refresh_error = None
+
+    def ensure_fresh(self) -> bool:
+        """Refresh if stale (TTL elapsed or empty). Returns True when a refetch happened."""
+        if self.can_refresh and self.is_stale():
+            self.refresh()
+            return True
+        return False
+
+    def save(self) -> None:
+        raw = fields_to_json(self.fields)
+        raw[META_KEY] = {
+            "project_id": self.project_id,
+            "fetched_at": self.fetched_at,
+            "fingerprint": self.fingerprint,
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp.write_text(json.dumps(raw, indent=2, ensure_ascii=False), encoding="utf-8")
+        tmp.replace(self.path)
+
+
 # Canonical field names (as they appear in fields.json)
 CANONICAL_FIELDS: dict[str, str] = {
     "release": "Release",
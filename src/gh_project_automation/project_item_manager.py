@@ -1,12 +1,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Iterator, Sequence
 
 from .graphql_client import GraphQLClient
-from .project_fields import FieldMeta
-from .utils import ApiError, console
-
+from .project_fields import DATE, ITERATION, NUMBER, SINGLE_SELECT, TEXT, FieldMeta
+from .reporter import Reporter, RichReporter
+from .utils import ApiError
 
 ADD_ITEM_MUTATION = """
 mutation AddProjectV2Item($projectId:ID!, $contentId:ID!) {
@@ -17,7 +17,9 @@ mutation AddProjectV2Item($projectId:ID!, $contentId:ID!) {
 """
 
 UPDATE_SINGLE_SELECT_MUTATION = """
-mutation UpdateProjectV2ItemFieldValue($projectId: ID!, $itemId: ID!, $fieldId: ID!, $optionId: String!) {
+mutation UpdateProjectV2ItemFieldValue(
+  $projectId: ID!, $itemId: ID!, $fieldId: ID!, $optionId: String!
+) {
   updateProjectV2ItemFieldValue(
     input: {
       projectId: $projectId
@@ -31,24 +33,224 @@ mutation UpdateProjectV2ItemFieldValue($projectId: ID!, $itemId: ID!, $fieldId:
 }
 """
 
+_FIELD_ID = "field { ... on ProjectV2FieldCommon { id } }"
+
+# Selection for one ProjectV2Item: content metadata plus every readable field value.
+_ITEM_SELECTION = f"""
+          id
+          updatedAt
+          content {{
+            __typename
+            ... on Issue {{ id number title url state updatedAt repository {{ nameWithOwner }} }}
+            ... on PullRequest {{
+              id number title url state updatedAt repository {{ nameWithOwner }}
+            }}
+            ... on DraftIssue {{ id title updatedAt }}
+          }}
+          fieldValues(first: 50) {{
+            nodes {{
+              ... on ProjectV2ItemFieldSingleSelectValue {{ optionId {_FIELD_ID} }}
+              ... on ProjectV2ItemFieldIterationValue {{ iterationId {_FIELD_ID} }}
+              ... on ProjectV2ItemFieldNumberValue {{ number {_FIELD_ID} }}
+              ... on ProjectV2ItemFieldTextValue {{ text {_FIELD_ID} }}
+              ... on ProjectV2ItemFieldDateValue {{ date {_FIELD_ID} }}
+            }}
+          }}"""
+
+PROJECT_ITEMS_QUERY = f"""
+query ProjectItems($projectId: ID!, $first: Int!, $after: String) {{
+  node(id: $projectId) {{
+    ... on ProjectV2 {{
+      items(first: $first, after: $after) {{
+        pageInfo {{ hasNextPage endCursor }}
+        nodes {{{_ITEM_SELECTION}
+        }}
+      }}
+    }}
+  }}
+}}
+"""
+
+# Only ids and update times: a cheap pass to find what changed since a snapshot.
+PROJECT_ITEM_STAMPS_QUERY = """
+query ProjectItemStamps($projectId: ID!, $first: Int!, $after: String) {
+  node(id: $projectId) {
+    ... on ProjectV2 {
+      items(first: $first, after: $after) {
+        pageInfo { hasNextPage endCursor }
+        nodes {
+          id
+          updatedAt
+          content {
+            ... on Issue { updatedAt }
+            ... on PullRequest { updatedAt }
+            ... on DraftIssue { updatedAt }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+PROJECT_ITEMS_BY_IDS_QUERY = f"""
+query ProjectItemsByIds($ids: [ID!]!) {{
+  nodes(ids: $ids) {{
+    ... on ProjectV2Item {{{_ITEM_SELECTION}
+    }}
+  }}
+}}
+"""
+# GitHub caps connection pages at 100 nodes.
+DEFAULT_ITEMS_PAGE_SIZE = 100
+_VALUE_KEYS = ("optionId", "iterationId", "number", "text", "date")
+
+# Upper bound on aliased mutations per document. GitHub does not publish a hard limit, but
+# very large documents hit node/complexity limits and make partial failures harder to retry.
+DEFAULT_MAX_BATCH_SIZE = 50
+
 
 @dataclass(frozen=True)
 class AddedProjectItem:
     item_id: str
 
 
+# ProjectV2FieldValue input key and GraphQL variable type for each settable data type.
+VALUE_INPUTS: dict[str, tuple[str, str]] = {
+    SINGLE_SELECT: ("singleSelectOptionId", "String!"),
+    ITERATION: ("iterationId", "String!"),
+    NUMBER: ("number", "Float!"),
+    TEXT: ("text", "String!"),
+    DATE: ("date", "Date!"),
+}
+
+
+@dataclass(frozen=True)
+class ProjectItem:
+    id: str
+    content_type: str  # Issue, PullRequest, DraftIssue ("" when the content is not visible)
+    content_id: str
+    number: int | None
+    title: str
+    url: str
+    state: str
+    repository: str
+    updated_at: str  # the later of the item's and its content's update time
+    # field id -> option/iteration id, or the literal number/text/date (same as FieldUpdate)
+    field_values: dict[str, str | float]
+
+
+def parse_project_item(node: dict[str, Any]) -> ProjectItem:
+    content = node.get("content") or {}
+    values: dict[str, str | float] = {}
+    for fv in (node.get("fieldValues") or {}).get("nodes") or []:
+        field_id = ((fv or {}).get("field") or {}).get("id")
+        if not field_id:
+            continue  # value types this tool does not read (labels, assignees, ...)
+        for key in _VALUE_KEYS:
+            if fv.get(key) is not None:
+                values[str(field_id)] = fv[key]
+                break
+    number = content.get("number")
+    return ProjectItem(
+        id=str(node["id"]),
+        content_type=str(content.get("__typename") or ""),
+        content_id=str(content.get("id") or ""),
+        number=int(number) if number is not None else None,
+        title=str(content.get("title") or ""),
+        url=str(content.get("url") or ""),
+        state=str(content.get("state") or ""),
+        repository=str((content.get("repository") or {}).get("nameWithOwner") or ""),
+        updated_at=max(str(node.get("updatedAt") or ""), str(content.get("updatedAt") or "")),
+        field_values=values,
+    )
+
+
+@dataclass(frozen=True)
+class FieldUpdate:
+    item_id: str
+    field_id: str
+    value: str | float  # option/iteration id, or the literal number/text/date
+    field_name: str = ""  # for reporting only
+    data_type: str = SINGLE_SELECT
+
+
+@dataclass(frozen=True)
+class FieldUpdateResult:
+    update: FieldUpdate
+    ok: bool
+    error: str | None = None
+
+
+def build_batch_update_mutation(updates: Sequence[FieldUpdate]) -> tuple[str, dict[str, Any]]:
+    """Build one aliased document (``f0``, ``f1``, ...) setting every update in ``updates``.
+
+    Returns ``(document, variables)``; ``$projectId`` is left for the caller to fill in.
+    """
+    params = ["$projectId: ID!"]
+    selections: list[str] = []
+    variables: dict[str, Any] = {}
+    for i, u in enumerate(updates):
+        input_key, var_type = VALUE_INPUTS[u.data_type]
+        params.append(f"$item{i}: ID!, $field{i}: ID!, $value{i}: {var_type}")
+        selections.append(
+            f"  f{i}: updateProjectV2ItemFieldValue(input: {{projectId: $projectId, "
+            f"itemId: $item{i}, fieldId: $field{i}, value: {{{input_key}: $value{i}}}}}) "
+            "{ projectV2Item { id } }"
+        )
+        variables[f"item{i}"] = u.item_id
+        variables[f"field{i}"] = u.field_id
+        variables[f"value{i}"] = u.value
+    document = (
+        f"mutation BatchUpdateProjectV2ItemFieldValues({', '.join(params)}) {{\n"
+        + "\n".join(selections)
+        + "\n}"
+    )
+    return document, variables
+
+
+def _errors_by_alias(errors: list[dict[str, Any]]) -> dict[str, str]:
+    out: dict[str, str] = {}
+    for err in errors:
+        path = err.get("path") or []
+        alias = str(path[0]) if path else ""
+        out.setdefault(alias, str(err.get("message", err)))
+    return out
+
+
 class ProjectItemManager:
-    def __init__(self, gql: GraphQLClient, *, project_id: str) -> None:
+    def __init__(
+        self,
+        gql: GraphQLClient,
+        *,
+        project_id: str,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        quiet: bool = False,
+        reporter: Reporter | None = None,
+    ) -> None:
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be >= 1")
         self.gql = gql
         self.project_id = project_id
+        self.max_batch_size = max_batch_size
+        self.quiet = quiet  # concurrent runs report per issue from the engine instead
+        self.reporter = reporter or RichReporter()
+        if not self.reporter.verbose:
+            self.quiet = True
+
+    def _print(self, msg: str) -> None:
+        if not self.quiet:
+            self.reporter.log(msg)
 
     def add_issue_to_project(self, *, issue_node_id: str, execute: bool) -> AddedProjectItem:
         if not execute:
-            console.print(f"[yellow]DRY-RUN[/yellow] would add issue node {issue_node_id} to project")
+            self._print(f"[yellow]DRY-RUN[/yellow] would add issue node {issue_node_id} to project")
             return AddedProjectItem(item_id="DRY_RUN_ITEM_ID")
 
-        console.print("[cyan]Adding issue to project[/cyan]")
-        data = self.gql.query(ADD_ITEM_MUTATION, {"projectId": self.project_id, "contentId": issue_node_id})
+        self._print("[cyan]Adding issue to project[/cyan]")
+        data = self.gql.query(
+            ADD_ITEM_MUTATION, {"projectId": self.project_id, "contentId": issue_node_id}
+        )
         item_id = data["addProjectV2ItemById"]["item"]["id"]
         return AddedProjectItem(item_id=str(item_id))
 
@@ -61,7 +263,9 @@ class ProjectItemManager:
         execute: bool,
     ) -> None:
         if not execute:
-            console.print(f"[yellow]DRY-RUN[/yellow] would set field {field.id} to option {option_id}")
+            self._print(
+                f"[yellow]DRY-RUN[/yellow] would set field {field.id} to option {option_id}"
+            )
             return
 
         data = self.gql.query(
@@ -75,3 +279,80 @@ class ProjectItemManager:
         )
         if not data.get("updateProjectV2ItemFieldValue"):
             raise ApiError("Failed to update field value (no data returned)")
+
+    def _iter_item_nodes(self, query: str, page_size: int) -> Iterator[dict[str, Any]]:
+        after: str | None = None
+        while True:
+            data = self.gql.query(
+                query, {"projectId": self.project_id, "first": page_size, "after": after}
+            )
+            node = data.get("node")
+            if not node:
+                raise ApiError(f"Project {self.project_id} not found or not a Project v2")
+            conn = node["items"]
+            for item in conn["nodes"]:
+                if item:
+                    yield item
+            page = conn["pageInfo"]
+            if not page["hasNextPage"]:
+                return
+            after = page["endCursor"]
+
+    def iter_items(self, *, page_size: int = DEFAULT_ITEMS_PAGE_SIZE) -> Iterator[ProjectItem]:
+        """Yield every item of the project with its field values, one page request at a time."""
+        for node in self._iter_item_nodes(PROJECT_ITEMS_QUERY, page_size):
+            yield parse_project_item(node)
+
+    def iter_item_stamps(
+        self, *, page_size: int = DEFAULT_ITEMS_PAGE_SIZE
+    ) -> Iterator[tuple[str, str]]:
+        """Yield ``(item_id, updated_at)`` for every item; ``updated_at`` as in ProjectItem."""
+        for node in self._iter_item_nodes(PROJECT_ITEM_STAMPS_QUERY, page_size):
+            content = node.get("content") or {}
+            yield str(node["id"]), max(
+                str(node.get("updatedAt") or ""), str(content.get("updatedAt") or "")
+            )
+
+    def get_items(self, item_ids: Sequence[str]) -> list[ProjectItem]:
+        """Fetch specific items by node id (at most DEFAULT_ITEMS_PAGE_SIZE per call).
+
+        Ids that no longer resolve to a project item are left out of the result.
+        """
+        if len(item_ids) > DEFAULT_ITEMS_PAGE_SIZE:
+            raise ValueError(f"At most {DEFAULT_ITEMS_PAGE_SIZE} ids per call")
+        if not item_ids:
+            return []
+        data = self.gql.query(PROJECT_ITEMS_BY_IDS_QUERY, {"ids": list(item_ids)})
+        return [parse_project_item(node) for node in data.get("nodes") or [] if node]
+
+    def set_fields_batch(
+        self, updates: Sequence[FieldUpdate], *, execute: bool
+    ) -> list[FieldUpdateResult]:
+        """Apply ``updates`` (one or many items) using aliased mutations, one request per chunk.
+
+        Results are returned in input order. A failed alias is reported on its own result; the
+        rest of the document still applies. Errors without an alias path fail the whole chunk.
+        """
+        if not execute:
+            for u in updates:
+                self._print(
+                    f"[yellow]DRY-RUN[/yellow] would set field {u.field_name or u.field_id} "
+                    f"to {u.value}"
+                )
+            return [FieldUpdateResult(update=u, ok=True) for u in updates]
+
+        results: list[FieldUpdateResult] = []
+        for start in range(0, len(updates), self.max_batch_size):
+            chunk = updates[start : start + self.max_batch_size]
+            document, variables = build_batch_update_mutation(chunk)
+            variables["projectId"] = self.project_id
+            data, errors = self.gql.query_partial(document, variables)
+            failed = _errors_by_alias(errors)
+            unattributed = failed.get("")
+            for i, u in enumerate(chunk):
+                alias = f"f{i}"
+                err = failed.get(alias) or unattributed
+                if err is None and not data.get(alias):
+                    err = "no data returned"
+                results.append(FieldUpdateResult(update=u, ok=err is None, error=err))
+        return results
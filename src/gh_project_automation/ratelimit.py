@@ -0,0 +1,260 @@
+from __future__ import annotations
+
+import math
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Mapping, Sequence
+
+# GitHub documents a secondary limit of 80 content-creating requests per minute.
+DEFAULT_CREATES_PER_MINUTE = 80
+# Requests held back from the primary budget so other tools sharing the token keep working.
+DEFAULT_RESERVE = 50
+# Below this fraction of the primary limit, spread the remaining budget evenly until reset.
+PACING_THRESHOLD = 0.2
+
+
+@dataclass(frozen=True)
+class BudgetSnapshot:
+    resource: str
+    limit: int | None
+    remaining: int | None
+    reset_at: float | None  # unix seconds
+    last_cost: int | None = None
+
+
+@dataclass
+class _Resource:
+    limit: int | None = None
+    remaining: int | None = None
+    reset_at: float | None = None
+    last_cost: int | None = None
+    next_at: float = 0.0  # earliest time the next request may start
+
+
+def resource_for_url(url: str) -> str:
+    return "graphql" if url.rstrip("/").endswith("/graphql") else "core"
+
+
+def is_rate_limited(status: int, headers: Mapping[str, str], body: str = "") -> bool:
+    """True for primary/secondary rate-limit rejections (not plain permission 403s)."""
+    if status == 429:
+        return True
+    if status != 403:
+        return False
+    return (
+        "Retry-After" in headers
+        or headers.get("X-RateLimit-Remaining") == "0"
+        or "rate limit" in body.lower()
+    )
+
+
+def _int(value: Any) -> int | None:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class RateBudget:
+    """Tracks GitHub's primary and secondary rate limits and paces requests before they trip.
+
+    Fed from ``X-RateLimit-*``/``Retry-After`` response headers and, when a query selects it,
+    the GraphQL ``rateLimit { cost remaining resetAt }`` object. Safe to share across threads.
+    """
+
+    def __init__(
+        self,
+        *,
+        reserve: int = DEFAULT_RESERVE,
+        creates_per_minute: int = DEFAULT_CREATES_PER_MINUTE,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.reserve = reserve
+        self.create_interval_s = 60.0 / creates_per_minute if creates_per_minute > 0 else 0.0
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._resources: dict[str, _Resource] = {}
+        self._paused_until = 0.0  # secondary limit back-off, applies to every resource
+        self._next_create_at = 0.0
+
+    def _res(self, resource: str) -> _Resource:
+        return self._resources.setdefault(resource, _Resource())
+
+    def _earliest_locked(self, res: _Resource, now: float) -> tuple[float, float]:
+        """Return ``(not_before, spacing)`` for the next request on ``res``."""
+        if res.remaining is None or res.reset_at is None or res.reset_at <= now:
+            return now, 0.0
+        if res.remaining <= self.reserve:
+            return res.reset_at, 0.0
+        if res.limit and res.remaining < res.limit * PACING_THRESHOLD:
+            return now, (res.reset_at - now) / (res.remaining - self.reserve)
+        return now, 0.0
+
+    def _start_locked(
+        self, res: _Resource, now: float, creates_content: bool
+    ) -> tuple[float, float]:
+        not_before, spacing = self._earliest_locked(res, now)
+        start = max(now, not_before, self._paused_until, res.next_at)
+        if creates_content and self.create_interval_s:
+            start = max(start, self._next_create_at)
+        return start, spacing
+
+    def wait_for(self, *, resource: str, creates_content: bool = False) -> float:
+        """Seconds a request against ``resource`` would wait now, without claiming a slot."""
+        with self._lock:
+            now = self._clock()
+            return self._start_locked(self._res(resource), now, creates_content)[0] - now
+
+    def claim(self, *, resource: str, creates_content: bool = False) -> float:
+        """Reserve the next slot for a request. Returns seconds to wait before sending it."""
+        with self._lock:
+            now = self._clock()
+            res = self._res(resource)
+            start, spacing = self._start_locked(res, now, creates_content)
+            if creates_content and self.create_interval_s:
+                self._next_create_at = start + self.create_interval_s
+            # Claim the slot so concurrent callers queue behind it instead of all waking at once.
+            res.next_at = start + spacing
+            if res.remaining is not None:
+                res.remaining -= 1
+            return start - now
+
+    def sleep(self, seconds: float) -> None:
+        if seconds > 0:
+            self._sleep(seconds)
+
+    def before_request(self, *, resource: str, creates_content: bool = False) -> float:
+        """Block until a request against ``resource`` may be sent. Returns seconds waited."""
+        wait = self.claim(resource=resource, creates_content=creates_content)
+        self.sleep(wait)
+        return wait
+
+    def observe_headers(
+        self,
+        headers: Mapping[str, str],
+        *,
+        status: int,
+        resource: str,
+        body: str = "",
+    ) -> None:
+        resource = headers.get("X-RateLimit-Resource", resource)
+        limit = _int(headers.get("X-RateLimit-Limit"))
+        remaining = _int(headers.get("X-RateLimit-Remaining"))
+        reset = _int(headers.get("X-RateLimit-Reset"))
+        retry_after = _int(headers.get("Retry-After"))
+        with self._lock:
+            now = self._clock()
+            res = self._res(resource)
+            if limit is not None:
+                res.limit = limit
+            if remaining is not None:
+                res.remaining = remaining
+            if reset is not None:
+                res.reset_at = float(reset)
+            if is_rate_limited(status, headers, body):
+                if retry_after is not None:
+                    self._paused_until = max(self._paused_until, now + retry_after)
+                elif remaining == 0 and reset is not None:
+                    self._paused_until = max(self._paused_until, float(reset))
+                else:
+                    # Secondary limit without guidance: GitHub asks clients to wait >= 60s.
+                    self._paused_until = max(self._paused_until, now + 60.0)
+
+    def observe_graphql(self, rate_limit: Mapping[str, Any]) -> None:
+        with self._lock:
+            res = self._res("graphql")
+            cost = _int(rate_limit.get("cost"))
+            remaining = _int(rate_limit.get("remaining"))
+            if cost is not None:
+                res.last_cost = cost
+            if remaining is not None:
+                res.remaining = remaining
+            limit = _int(rate_limit.get("limit"))
+            if limit is not None:
+                res.limit = limit
+            reset_at = rate_limit.get("resetAt")
+            if reset_at:
+                reset = datetime.fromisoformat(str(reset_at).replace("Z", "+00:00"))
+                res.reset_at = reset.timestamp()
+
+    def snapshot(self, resource: str) -> BudgetSnapshot:
+        with self._lock:
+            res = self._res(resource)
+            return BudgetSnapshot(
+                resource=resource,
+                limit=res.limit,
+                remaining=res.remaining,
+                reset_at=res.reset_at,
+                last_cost=res.last_cost,
+            )
+
+    def snapshots(self) -> list[BudgetSnapshot]:
+        with self._lock:
+            names = sorted(self._resources)
+        return [self.snapshot(n) for n in names]
+
+
+class TokenPool:
+    """Several tokens (PATs or app installation tokens), each paced by its own RateBudget.
+
+    Each request goes to the token that can send soonest; among tokens that are all ready, the
+    one with the most known headroom wins, so load spreads evenly. A token that runs dry (or is
+    told to back off) is parked until its reset time while the others carry the traffic.
+    """
+
+    def __init__(
+        self,
+        tokens: Sequence[str],
+        *,
+        budgets: Sequence[RateBudget] | None = None,
+        reserve: int = DEFAULT_RESERVE,
+        creates_per_minute: int = DEFAULT_CREATES_PER_MINUTE,
+    ) -> None:
+        if not tokens:
+            raise ValueError("TokenPool needs at least one token")
+        if budgets is not None and len(budgets) != len(tokens):
+            raise ValueError("one budget per token")
+        self.tokens = tuple(tokens)
+        self.budgets = list(budgets) if budgets is not None else [
+            RateBudget(reserve=reserve, creates_per_minute=creates_per_minute) for _ in tokens
+        ]
+        self._uses = [0] * len(tokens)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.tokens)
+
+    def label(self, index: int) -> str:
+        return f"token {index + 1} (...{self.tokens[index][-4:]})"
+
+    def _rank(self, index: int, resource: str, creates_content: bool) -> tuple[float, ...]:
+        budget = self.budgets[index]
+        wait = budget.wait_for(resource=resource, creates_content=creates_content)
+        remaining = budget.snapshot(resource).remaining
+        headroom = math.inf if remaining is None else remaining
+        # millisecond resolution, so tokens that are all ready tie and headroom decides
+        return round(wait, 3), -headroom, self._uses[index]
+
+    def acquire(
+        self, *, resource: str, creates_content: bool = False, wait: bool = True
+    ) -> tuple[int, float]:
+        """Pick a token for the next request and wait for its slot: ``(index, seconds waited)``.
+
+        With ``wait=False`` the slot is claimed but the caller sleeps the seconds returned.
+        """
+        with self._lock:
+            best = 0
+            if len(self.tokens) > 1:
+                best = min(
+                    range(len(self.tokens)),
+                    key=lambda i: self._rank(i, resource, creates_content),
+                )
+            seconds = self.budgets[best].claim(resource=resource, creates_content=creates_content)
+            self._uses[best] += 1
+        if wait:
+            self.budgets[best].sleep(seconds)
+        return best, seconds
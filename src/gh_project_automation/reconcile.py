@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Iterable
+
+from .bulk import DRY_RUN_LISTED, UpdateBatcher, plan_item_updates
+from .project_item_manager import (
+    DEFAULT_ITEMS_PAGE_SIZE,
+    FieldUpdateResult,
+    ProjectItem,
+    ProjectItemManager,
+)
+from .reporter import Reporter, RichReporter
+from .validator import ValidatedIssue
+
+if TYPE_CHECKING:
+    from .adaptive import AdaptiveController
+
+
+def title_key(title: str) -> str:
+    """Titles are matched ignoring case and repeated whitespace (as the dedupe index does)."""
+    return " ".join(title.split()).casefold()
+
+
+@dataclass
+class ReconcileResult:
+    scanned: int = 0
+    matched: int = 0
+    unchanged: int = 0  # matched, and every value in the file was already set
+    updated_items: int = 0
+    updates_ok: int = 0
+    failed: list[FieldUpdateResult] = field(default_factory=list)
+    missing: list[str] = field(default_factory=list)  # titles in the file not on the board
+    ambiguous: list[str] = field(default_factory=list)  # titles listed more than once in the file
+    duplicate_items: int = 0  # extra board items sharing a matched title (left alone)
+
+
+def _pick(current: ProjectItem | None, item: ProjectItem) -> ProjectItem:
+    # Oldest issue wins when the same title is on the board more than once, like the dedupe index.
+    if current is None:
+        return item
+    return min(current, item, key=lambda i: (i.number is None, i.number or 0))
+
+
+def run_reconcile(
+    pim: ProjectItemManager,
+    issues: Iterable[ValidatedIssue],
+    *,
+    repository: str,
+    execute: bool,
+    concurrency: int = 1,
+    page_size: int = DEFAULT_ITEMS_PAGE_SIZE,
+    reporter: Reporter | None = None,
+    controller: AdaptiveController | None = None,
+) -> ReconcileResult:
+    """Make the board's field values match ``issues``, sending only the values that differ.
+
+    Project items are matched to input issues by title, among issues of ``repository``
+    (``owner/repo``). Current values are read page by page; the differing values are then packed
+    into aliased mutation documents. Fields an issue does not list are left untouched, and
+    issues not found on the board are reported rather than created.
+    """
+    reporter = reporter or RichReporter()
+    result = ReconcileResult()
+
+    desired: dict[str, ValidatedIssue] = {}
+    ambiguous: set[str] = set()
+    for issue in issues:
+        key = title_key(issue.title)
+        if key in desired or key in ambiguous:
+            desired.pop(key, None)
+            if key not in ambiguous:
+                ambiguous.add(key)
+                result.ambiguous.append(issue.title)
+            continue
+        desired[key] = issue
+
+    repository = repository.casefold()
+    found: dict[str, ProjectItem] = {}
+    for item in pim.iter_items(page_size=page_size):
+        result.scanned += 1
+        if item.content_type != "Issue" or item.repository.casefold() != repository:
+            continue
+        key = title_key(item.title)
+        if key not in desired:
+            continue
+        if key in found:
+            result.duplicate_items += 1
+        found[key] = _pick(found.get(key), item)
+
+    with UpdateBatcher(
+        pim, concurrency=concurrency, reporter=reporter, controller=controller
+    ) as batcher:
+        for key, issue in desired.items():
+            item = found.get(key)
+            if item is None:
+                result.missing.append(issue.title)
+                continue
+            result.matched += 1
+            updates = plan_item_updates(item, issue.resolved)
+            if not updates:
+                result.unchanged += 1
+                continue
+            result.updated_items += 1
+            if not execute:
+                if result.updated_items <= DRY_RUN_LISTED:
+                    labels = {rf.field_id: rf.label for rf in issue.resolved}
+                    changed = ", ".join(
+                        f"{u.field_name} -> {labels[u.field_id]}" for u in updates
+                    )
+                    reporter.log(
+                        f"[yellow]DRY-RUN[/yellow] would update {item.url or item.title}: {changed}"
+                    )
+                continue
+            batcher.add(updates)
+    result.updates_ok = batcher.updates_ok
+    result.failed = batcher.failed
+    if not execute and result.updated_items > DRY_RUN_LISTED:
+        reporter.log(f"... and {result.updated_items - DRY_RUN_LISTED} more item(s)")
+    return result
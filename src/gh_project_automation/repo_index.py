@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import json
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from .utils import ApiError, ValidationError
+
+if TYPE_CHECKING:
+    from .graphql_client import GraphQLClient
+
+INDEX_VERSION = 1
+
+# Each connection is paged on its own; @include drops the ones already read in full.
+REPO_INDEX_QUERY = """
+query RepoIndex(
+  $owner: String!, $name: String!,
+  $withLabels: Boolean!, $labelsAfter: String,
+  $withMilestones: Boolean!, $milestonesAfter: String,
+  $withUsers: Boolean!, $usersAfter: String
+) {
+  repository(owner: $owner, name: $name) {
+    labels(first: 100, after: $labelsAfter) @include(if: $withLabels) {
+      pageInfo { hasNextPage endCursor }
+      nodes { id name }
+    }
+    milestones(first: 100, after: $milestonesAfter, states: [OPEN, CLOSED])
+      @include(if: $withMilestones) {
+      pageInfo { hasNextPage endCursor }
+      nodes { id number title }
+    }
+    assignableUsers(first: 100, after: $usersAfter) @include(if: $withUsers) {
+      pageInfo { hasNextPage endCursor }
+      nodes { id login }
+    }
+  }
+}
+"""
+# connection in the query -> (cursor variable, include variable, index kind)
+_CONNECTIONS = {
+    "labels": ("labelsAfter", "withLabels", "labels"),
+    "milestones": ("milestonesAfter", "withMilestones", "milestones"),
+    "assignableUsers": ("usersAfter", "withUsers", "assignees"),
+}
+KINDS = ("labels", "milestones", "assignees")
+
+
+@dataclass(frozen=True)
+class RepoRef:
+    """A label, milestone or assignable user, with both the names REST takes and the node
+    ID GraphQL takes, so creating an issue needs no further lookups."""
+
+    id: str
+    name: str  # label name, milestone title or user login, as GitHub spells it
+    number: int | None = None  # milestones only
+
+
+def _ref_from_node(kind: str, node: dict[str, Any]) -> RepoRef:
+    if kind == "labels":
+        return RepoRef(id=str(node["id"]), name=str(node["name"]))
+    if kind == "milestones":
+        return RepoRef(id=str(node["id"]), name=str(node["title"]), number=int(node["number"]))
+    return RepoRef(id=str(node["id"]), name=str(node["login"]))
+
+
+def fetch_repo_index(gql: GraphQLClient, owner: str, repo: str) -> dict[str, list[RepoRef]]:
+    """Every label, milestone and assignable user of ``owner/repo``, 100 of each per request."""
+    out: dict[str, list[RepoRef]] = {kind: [] for kind in KINDS}
+    cursors: dict[str, str | None] = {conn: None for conn in _CONNECTIONS}
+    pending = set(_CONNECTIONS)
+    while pending:
+        variables: dict[str, Any] = {"owner": owner, "name": repo}
+        for conn, (after_var, include_var, _) in _CONNECTIONS.items():
+            variables[include_var] = conn in pending
+            variables[after_var] = cursors[conn]
+        data = gql.query(REPO_INDEX_QUERY, variables)
+        node = data.get("repository")
+        if not node:
+            raise ValidationError(f"Repository {owner}/{repo} not found")
+        for conn in sorted(pending):
+            kind = _CONNECTIONS[conn][2]
+            page = node[conn]
+            out[kind].extend(_ref_from_node(kind, n) for n in page["nodes"] if n)
+            if page["pageInfo"]["hasNextPage"]:
+                cursors[conn] = page["pageInfo"]["endCursor"]
+            else:
+                pending.discard(conn)
+    return out
+
+
+class RepoIndex:
+    """A repository's labels, milestones and assignable users, looked up by name.
+
+    Names match ignoring case, as on GitHub. Like ``FieldsCache`` the index is kept in a JSON
+    file when ``path`` is given (otherwise for the run only). It is fetched when validation
+    meets a name it does not know, at most once per run, and when older than ``ttl_s``; a
+    file written for another repository is ignored.
+    """
+
+    def __init__(
+        self,
+        path: str | Path | None,
+        *,
+        owner: str,
+        repo: str,
+        gql: GraphQLClient | None = None,
+        ttl_s: float | None = None,
+    ) -> None:
+        self.path = Path(path) if path else None
+        self.owner = owner
+        self.repo = repo
+        self.gql = gql
+        self.ttl_s = ttl_s
+        self.refreshed = False
+        self.refresh_error: str | None = None
+        self.fetched_at: float | None = None
+        self._by_name: dict[str, dict[str, RepoRef]] = {kind: {} for kind in KINDS}
+        if self.path is not None and self.path.exists():
+            self._load(json.loads(self.path.read_text(encoding="utf-8")))
+
+    def _load(self, raw: dict[str, Any]) -> None:
+        if raw.get("version") != INDEX_VERSION or raw.get("repo") != f"{self.owner}/{self.repo}":
+            return  # another repository's names would resolve to the wrong IDs
+        self.fetched_at = raw.get("fetched_at")
+        self._set({kind: [RepoRef(**r) for r in raw.get(kind) or []] for kind in KINDS})
+
+    def _set(self, refs: dict[str, list[RepoRef]]) -> None:
+        self._by_name = {
+            kind: {r.name.casefold(): r for r in refs.get(kind, [])} for kind in KINDS
+        }
+
+    def __len__(self) -> int:
+        return sum(len(v) for v in self._by_name.values())
+
+    def lookup(self, kind: str, name: str) -> RepoRef | None:
+        return self._by_name[kind].get(name.strip().casefold())
+
+    def names(self, kind: str) -> list[str]:
+        return sorted(r.name for r in self._by_name[kind].values())
+
+    @property
+    def can_refresh(self) -> bool:
+        return self.gql is not None and not self.refreshed
+
+    def is_stale(self, *, now: float | None = None) -> bool:
+        if self.fetched_at is None:
+            return True
+        if self.ttl_s is None:
+            return False
+        return (now if now is not None else time.time()) - self.fetched_at > self.ttl_s
+
+    def refresh(self) -> None:
+        if self.gql is None:
+            raise ValidationError("Cannot refresh the repository index without a client")
+        refs = fetch_repo_index(self.gql, self.owner, self.repo)
+        self.refreshed = True
+        self._set(refs)
+        self.fetched_at = time.time()
+        self.save()
+
+    def try_refresh(self) -> bool:
+        """``refresh`` for the on-miss path: a failure is recorded, not raised, and not retried."""
+        try:
+            self.refresh()
+            return True
+        except (ApiError, OSError, ValidationError) as e:
+            self.refreshed = True
+            self.refresh_error = str(e)
+            return False
+
+    def allow_refresh(self) -> None:
+        """Start a new run in a long-lived process: one more refresh on a miss is allowed."""
+        self.refreshed = False
+        self.refresh_error = None
+
+    def ensure_fresh(self) -> bool:
+        """Refresh a cached index past its TTL. An index never fetched waits for a first miss,
+        so runs whose issues set no labels, milestone or assignees cost nothing."""
+        if self.path is not None and self.fetched_at is not None and self.can_refresh:
+            if self.is_stale():
+                self.refresh()
+                return True
+        return False
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        raw: dict[str, Any] = {
+            "version": INDEX_VERSION,
+            "repo": f"{self.owner}/{self.repo}",
+            "fetched_at": self.fetched_at,
+        }
+        for kind in KINDS:
+            raw[kind] = [
+                {k: v for k, v in asdict(r).items() if v is not None}
+                for r in sorted(self._by_name[kind].values(), key=lambda r: r.name)
+            ]
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp.write_text(json.dumps(raw, indent=2, ensure_ascii=False), encoding="utf-8")
+        tmp.replace(self.path)
+
+
+def read_repo_index(path: str | Path) -> RepoIndex:
+    """A saved index for offline use, for whichever repository it was written for."""
+    raw = json.loads(Path(path).read_text(encoding="utf-8"))
+    owner, _, repo = str(raw.get("repo") or "").partition("/")
+    return RepoIndex(path, owner=owner, repo=repo)
@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import json
+import sys
+import time
+from collections import Counter
+from typing import IO, TYPE_CHECKING, Any, Sequence
+
+from .utils import get_console
+
+if TYPE_CHECKING:
+    from .validator import ValidatedIssue
+
+OUTPUT_MODES = ("rich", "jsonl", "progress")
+DEFAULT_PREVIEW_ROWS = 50
+
+
+class Reporter:
+    """Where run output goes. The base class is silent; subclasses pick a format.
+
+    ``log``/``rule`` carry human-readable lines (rich markup) and are dropped by the
+    machine-oriented reporters, so the hot loop pays no rendering cost there. ``event``
+    carries structured data (issue finished/failed, run summary) for every reporter.
+    """
+
+    verbose = False  # whether per-step ``log`` lines are worth producing at all
+
+    def rule(self, title: str) -> None:
+        pass
+
+    def log(self, message: str) -> None:
+        pass
+
+    def message(self, message: str) -> None:
+        """Run-level note (not per step), shown by every reporter."""
+
+    def event(self, name: str, **data: Any) -> None:
+        pass
+
+    def preview(self, issues: Sequence[ValidatedIssue], *, limit: int | None = None) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class RichReporter(Reporter):
+    """Styled console output (the classic behaviour), with a paged preview table."""
+
+    verbose = True
+
+    def __init__(self, *, preview_rows: int = DEFAULT_PREVIEW_ROWS) -> None:
+        self.preview_rows = preview_rows
+
+    def rule(self, title: str) -> None:
+        get_console().rule(title)
+
+    def log(self, message: str) -> None:
+        get_console().print(message)
+
+    def message(self, message: str) -> None:
+        get_console().print(message)
+
+    def event(self, name: str, **data: Any) -> None:
+        if name == "issue_failed":
+            get_console().print(f"[red]Error[/red] {data.get('error')}")
+        elif name == "run_finished":
+            get_console().print(f"[dim]{_summary_line(data)}[/dim]")
+        elif name == "metrics":
+            for line in metrics_lines(data):
+                get_console().print(f"[dim]{line}[/dim]")
+
+    def preview(self, issues: Sequence[ValidatedIssue], *, limit: int | None = None) -> None:
+        from .validator import print_dry_run_preview
+
+        print_dry_run_preview(issues, limit=limit, max_rows=self.preview_rows)
+
+
+class JsonLinesReporter(Reporter):
+    """One JSON object per event, buffered and written in batches (default: stdout)."""
+
+    def __init__(self, stream: IO[str] | None = None, *, buffer_size: int = 100) -> None:
+        self.stream = stream or sys.stdout
+        self.buffer_size = max(1, buffer_size)
+        self._buf: list[str] = []
+
+    def message(self, message: str) -> None:
+        from rich.text import Text
+
+        self.event("message", text=Text.from_markup(message).plain)
+
+    def event(self, name: str, **data: Any) -> None:
+        self._buf.append(json.dumps({"ts": round(time.time(), 3), "event": name, **data}))
+        if len(self._buf) >= self.buffer_size:
+            self.flush()
+
+    def preview(self, issues: Sequence[ValidatedIssue], *, limit: int | None = None) -> None:
+        self.event("preview", issues=len(issues), field_counts=field_value_counts(issues))
+
+    def flush(self) -> None:
+        if self._buf:
+            self.stream.write("\n".join(self._buf) + "\n")
+            self.stream.flush()
+            self._buf.clear()
+
+    def close(self) -> None:
+        self.flush()
+
+
+class ProgressReporter(Reporter):
+    """A single progress bar with aggregate counts instead of per-step lines."""
+
+    def __init__(self) -> None:
+        from rich.progress import (
+            BarColumn,
+            MofNCompleteColumn,
+            Progress,
+            TextColumn,
+            TimeElapsedColumn,
+        )
+
+        self.counts: Counter[str] = Counter()
+        self._progress = Progress(
+            TextColumn("[bold]Issues"),
+            BarColumn(),
+            MofNCompleteColumn(),
+            TimeElapsedColumn(),
+            TextColumn("{task.description}"),
+            console=get_console(),
+            transient=False,
+        )
+        self._task: Any = None
+
+    def event(self, name: str, **data: Any) -> None:
+        if name == "run_started":
+            self._progress.start()
+            self._task = self._progress.add_task("", total=data.get("total"))
+        elif name in ("issue_done", "issue_failed"):
+            self.counts[data.get("status", "failed")] += 1
+            if self._task is not None:
+                desc = " · ".join(f"{k} {v}" for k, v in sorted(self.counts.items()))
+                self._progress.update(self._task, advance=1, description=desc)
+        elif name == "run_finished":
+            self.close()
+            get_console().print(f"[dim]{_summary_line(data)}[/dim]")
+        elif name == "metrics":
+            for line in metrics_lines(data):
+                get_console().print(f"[dim]{line}[/dim]")
+
+    def message(self, message: str) -> None:
+        self._progress.console.print(message)
+
+    def preview(self, issues: Sequence[ValidatedIssue], *, limit: int | None = None) -> None:
+        get_console().print(f"{len(issues)} issue(s) validated")
+        for key, counts in field_value_counts(issues).items():
+            top = ", ".join(f"{v} ×{n}" for v, n in counts.items())
+            get_console().print(f"  [bold]{key}[/bold]: {top}")
+
+    def close(self) -> None:
+        self._progress.stop()
+
+
+def field_value_counts(issues: Sequence[ValidatedIssue]) -> dict[str, dict[str, int]]:
+    counts: dict[str, Counter[str]] = {}
+    for issue in issues:
+        for key, value in issue.fields.items():
+            counts.setdefault(key, Counter())[value] += 1
+    return {k: dict(c.most_common()) for k, c in counts.items()}
+
+
+def _summary_line(data: dict[str, Any]) -> str:
+    parts = [f"{k} {v}" for k, v in sorted((data.get("counts") or {}).items())]
+    elapsed = data.get("elapsed_s")
+    if elapsed is not None:
+        parts.append(f"{elapsed:.1f}s")
+    return "Summary: " + (", ".join(parts) if parts else "nothing to do")
+
+
+def metrics_lines(summary: dict[str, Any]) -> list[str]:
+    """One line per API operation from a ``Metrics.summary()`` dict."""
+    lines = []
+    for op, m in summary.get("operations", {}).items():
+        line = f"{op}: {m.get('count', 0)} call(s)"
+        if m.get("count"):
+            line += f", p50 {m['p50_s'] * 1000:.0f}ms, p95 {m['p95_s'] * 1000:.0f}ms"
+        if m.get("retries"):
+            line += f", {m['retries']} retries ({m['backoff_s']:.1f}s backoff)"
+        if m.get("graphql_cost"):
+            line += f", cost {m['graphql_cost']}"
+        lines.append(line)
+    if summary.get("rate_wait_s"):
+        lines.append(f"rate-limit pacing: {summary['rate_wait_s']:.1f}s")
+    circuit = summary.get("circuit")
+    if circuit and circuit.get("opened"):
+        lines.append(
+            f"circuit breaker: opened {circuit['opened']} time(s), "
+            f"{circuit['paused_s']:.1f}s paused, now {circuit['state'].replace('_', ' ')}"
+        )
+    adaptive = summary.get("adaptive")
+    if adaptive:
+        line = (
+            f"adaptive: concurrency {adaptive['concurrency']} (peak {adaptive['peak_concurrency']}"
+            f" of {adaptive['max_concurrency']}), batch size {adaptive['batch_size']}, "
+            f"{adaptive['increases']} up / {adaptive['decreases']} down"
+        )
+        if adaptive.get("throttled"):
+            line += f", {adaptive['throttled']} throttled response(s)"
+        lines.append(line)
+    return lines
+
+
+def make_reporter(mode: str, *, preview_rows: int = DEFAULT_PREVIEW_ROWS) -> Reporter:
+    if mode == "jsonl":
+        return JsonLinesReporter()
+    if mode == "progress":
+        return ProgressReporter()
+    return RichReporter(preview_rows=preview_rows)
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable
+
+import requests
+from urllib3.exceptions import MaxRetryError, NewConnectionError
+
+from .ratelimit import is_rate_limited
+from .utils import FATAL, RATE_LIMITED, RETRYABLE, ApiError, CircuitOpenError, GraphQLError
+
+# Server-side failures worth another attempt; other 4xx/5xx answers will not change on retry.
+RETRYABLE_STATUSES = frozenset({500, 502, 503, 504})
+# GraphQL reports its own timeouts as an HTTP 200 carrying an error like this one.
+GRAPHQL_TRANSIENT_MESSAGES = ("something went wrong while executing your query", "timeout")
+# Consecutive failed requests (5xx or no answer) that open the circuit.
+DEFAULT_FAILURE_THRESHOLD = 5
+# First pause when the circuit opens; doubled every time a probe fails.
+DEFAULT_OPEN_S = 10.0
+# Openings in a row (no success in between) after which requests fail instead of waiting.
+DEFAULT_MAX_TRIPS = 3
+# How often requests queued behind a half-open probe check whether it came back.
+HALF_OPEN_POLL_S = 0.05
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+GAVE_UP = "gave_up"
+
+
+def http_error(api: str, resp: requests.Response) -> ApiError:
+    """``ApiError`` for an HTTP error response, carrying what ``classify_error`` looks at."""
+    return ApiError(
+        f"{api} HTTP {resp.status_code}: {resp.text}",
+        status=resp.status_code,
+        rate_limited=is_rate_limited(resp.status_code, resp.headers, resp.text),
+    )
+
+
+def _never_sent(error: requests.RequestException) -> bool:
+    """True when the request failed before reaching the server (nothing can have happened)."""
+    if isinstance(error, requests.ConnectTimeout):
+        return True
+    reason = error.args[0] if error.args else None
+    return isinstance(reason, MaxRetryError) and isinstance(reason.reason, NewConnectionError)
+
+
+def _ambiguous(error: Exception) -> bool:
+    """True for failures after which a request may or may not have been carried out."""
+    if isinstance(error, GraphQLError):
+        text = str(error.errors).lower()
+        return any(m in text for m in GRAPHQL_TRANSIENT_MESSAGES)
+    if isinstance(error, ApiError):
+        return error.status in RETRYABLE_STATUSES
+    return isinstance(error, requests.RequestException) and not _never_sent(error)
+
+
+def classify_error(error: Exception, *, idempotent: bool = True) -> str:
+    """``RETRYABLE``, ``RATE_LIMITED`` or ``FATAL`` (see ``utils.retry``).
+
+    Rate-limit rejections and connections that never reached the server are safe to repeat
+    for any request. 5xx answers, timeouts and dropped connections are retried only for
+    ``idempotent`` requests: a create may have gone through, and repeating it would make a
+    duplicate. Other 4xx answers and GraphQL errors (bad input, missing access) are fatal.
+    """
+    if isinstance(error, CircuitOpenError):
+        return FATAL
+    if isinstance(error, ApiError) and error.rate_limited:
+        return RATE_LIMITED
+    if isinstance(error, requests.RequestException) and _never_sent(error):
+        return RETRYABLE
+    if _ambiguous(error):
+        return RETRYABLE if idempotent else FATAL
+    return FATAL
+
+
+class CircuitBreaker:
+    """Pauses every request sharing it while the API looks degraded.
+
+    ``failure_threshold`` consecutive failed requests (5xx or no answer, from any thread) open
+    the circuit: requests wait ``open_s`` and then a single probe is let through. A probe that
+    succeeds closes the circuit; one that fails opens it again for twice as long. The
+    ``max_trips``-th opening in a row gives up: from then on requests raise
+    ``CircuitOpenError``, so a run against an API that stays down fails after a short pause
+    instead of backing off on every call. Any answer below 500 counts as a success.
+    ``failure_threshold=0`` disables the breaker. Safe to share across threads.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        open_s: float = DEFAULT_OPEN_S,
+        max_trips: int = DEFAULT_MAX_TRIPS,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.open_s = open_s
+        self.max_trips = max(1, max_trips)
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self.state = CLOSED
+        self._failures = 0
+        self._trips = 0  # openings since the last success
+        self._open_until = 0.0
+        self._opened_at = 0.0
+        self._opened = 0
+        self._paused_s = 0.0
+
+    def before_request(self) -> bool:
+        """Block while the circuit is open. Returns True when this request is the probe."""
+        while True:
+            with self._lock:
+                if self.state == CLOSED:
+                    return False
+                if self.state == GAVE_UP:
+                    raise CircuitOpenError(
+                        f"GitHub API degraded: circuit opened {self._trips} times in a row "
+                        f"after {self.failure_threshold} consecutive failures; giving up"
+                    )
+                wait = HALF_OPEN_POLL_S
+                if self.state == OPEN:
+                    wait = self._open_until - self._clock()
+                    if wait <= 0:
+                        self.state = HALF_OPEN
+                        return True
+            self._sleep(wait)
+
+    def record(self, *, ok: bool, probe: bool = False) -> None:
+        if self.failure_threshold <= 0:
+            return
+        with self._lock:
+            now = self._clock()
+            if ok:
+                if probe:
+                    self._paused_s += now - self._opened_at
+                    self.state = CLOSED
+                    self._trips = 0
+                if self.state == CLOSED:
+                    self._failures = 0
+            elif probe:
+                self._open_locked(now)
+            elif self.state == CLOSED:
+                self._failures += 1
+                if self._failures >= self.failure_threshold:
+                    self._opened_at = now
+                    self._open_locked(now)
+
+    def _open_locked(self, now: float) -> None:
+        self._trips += 1
+        self._opened += 1
+        self._failures = 0
+        if self._trips >= self.max_trips:
+            self.state = GAVE_UP
+            self._paused_s += now - self._opened_at
+            return
+        self.state = OPEN
+        self._open_until = now + self.open_s * 2 ** (self._trips - 1)
+
+    def summary(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "state": self.state,
+                "opened": self._opened,
+                "paused_s": round(self._paused_s, 3),
+            }
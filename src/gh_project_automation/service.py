@@ -0,0 +1,347 @@
+from __future__ import annotations
+
+import io
+import json
+import shutil
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlsplit
+
+from .engine import IssuePipeline, run_pipeline
+from .issue_creator import IssueCreator
+from .journal import RunJournal
+from .project_item_manager import DEFAULT_MAX_BATCH_SIZE, ProjectItemManager
+from .reporter import JsonLinesReporter, Reporter, RichReporter
+from .utils import GhAutomationError, ValidationError
+from .validator import (
+    JSON_LINES_SUFFIXES,
+    ValidationPlan,
+    ValidationReport,
+    iter_issues,
+    iter_issues_from,
+    validate_with_cache,
+)
+
+if TYPE_CHECKING:
+    from .adaptive import AdaptiveController
+    from .github_rest import GitHubREST
+    from .graphql_client import GraphQLClient
+    from .metrics import Metrics
+    from .project_fields import FieldsCache
+    from .repo_index import RepoIndex
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_POLL_S = 1.0
+# A long-running service refetches field metadata on an unknown value at most this often.
+MIN_REFRESH_INTERVAL_S = 60.0
+MAX_BODY_BYTES = 64 * 2**20
+SPOOL_SUFFIXES = frozenset({".json", *JSON_LINES_SUFFIXES})
+RESULTS_SUFFIX = ".results.jsonl"
+
+
+class IssueService:
+    """Warm state behind ``serve``, reused by every batch.
+
+    Holds the session's clients (and with them the connection pool and rate budget), the
+    compiled validation plan, and one creator and item manager. Batches run one at a time,
+    each with ``concurrency`` issues in flight, and report to their own ``Reporter`` so
+    results stream back to whoever submitted them. Field metadata and the repository index are
+    refreshed on a miss at most once per batch and once per ``MIN_REFRESH_INTERVAL_S``.
+    """
+
+    def __init__(
+        self,
+        *,
+        rest: GitHubREST,
+        gql: GraphQLClient,
+        fields_cache: FieldsCache,
+        repo_index: RepoIndex | None = None,
+        owner: str,
+        repo: str,
+        project_id: str,
+        execute: bool,
+        concurrency: int = 1,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        create_via: str = "rest",
+        loose: bool = False,
+        controller: AdaptiveController | None = None,
+        metrics: Metrics | None = None,
+        reporter: Reporter | None = None,
+    ) -> None:
+        self.reporter = reporter or RichReporter()
+        self.fields_cache = fields_cache
+        self.repo_index = repo_index
+        self.execute = execute
+        self.concurrency = concurrency
+        self.loose = loose
+        self.controller = controller
+        self.metrics = metrics
+        self.creator = IssueCreator(
+            rest,
+            owner=owner,
+            repo=repo,
+            quiet=True,
+            reporter=self.reporter,
+            gql=gql,
+            project_id=project_id,
+            via=create_via,
+        )
+        self.pim = ProjectItemManager(
+            gql,
+            project_id=project_id,
+            max_batch_size=max_batch_size,
+            quiet=True,
+            reporter=self.reporter,
+        )
+        self.batches = 0
+        self.counts: Counter[str] = Counter()
+        self.started = time.time()
+        self._lock = threading.Lock()
+        self._plan: ValidationPlan | None = None
+        self._plan_fingerprint: str | None = None
+        # when each source last tried a refresh, successful or not (fetched_at stays unset
+        # for a hand-written file whose refresh fails)
+        self._refresh_tried_at: dict[str, float] = {
+            name: self.started for name, c in self._sources() if c.refreshed
+        }
+
+    def _sources(self) -> list[tuple[str, FieldsCache | RepoIndex]]:
+        sources: list[tuple[str, FieldsCache | RepoIndex]] = [("fields", self.fields_cache)]
+        if self.repo_index is not None:
+            sources.append(("repo_index", self.repo_index))
+        return sources
+
+    def validate(self, rows: list[Any]) -> ValidationReport:
+        cache, index = self.fields_cache, self.repo_index
+        now = time.time()
+        sources = self._sources()
+        armed = []
+        for name, c in sources:
+            tried = self._refresh_tried_at.get(name)
+            if tried is None or now - tried >= MIN_REFRESH_INTERVAL_S:
+                c.allow_refresh()
+                armed.append((name, c))
+        try:
+            for _, c in sources:
+                c.ensure_fresh()
+            current = self._plan if self._plan_fingerprint == cache.fingerprint else None
+            plan, report = validate_with_cache(
+                rows, cache, loose=self.loose, plan=current, repo_index=index
+            )
+        finally:
+            for name, c in armed:
+                if c.refreshed:  # used up by this batch
+                    self._refresh_tried_at[name] = now
+        self._plan, self._plan_fingerprint = plan, cache.fingerprint
+        return report
+
+    def run_batch(
+        self, rows: list[Any], reporter: Reporter, *, journal: RunJournal | None = None
+    ) -> dict[str, int]:
+        """Validate and run one batch, streaming its events to ``reporter``.
+
+        Returns the per-status counts. Raises ``ValidationError`` (nothing was sent) when any
+        record is invalid, and otherwise the first failure, like an import.
+        """
+        with self._lock:
+            report = self.validate(rows)
+            if not report.ok:
+                for err in report.errors:
+                    reporter.event("invalid", error=err)
+                raise ValidationError(f"{len(report.errors)} validation error(s)")
+            pipeline = IssuePipeline(
+                creator=self.creator, pim=self.pim, execute=self.execute, journal=journal
+            )
+            try:
+                run_pipeline(
+                    pipeline,
+                    report.issues,
+                    concurrency=self.concurrency,
+                    total=len(report.issues),
+                    reporter=reporter,
+                    controller=self.controller,
+                )
+            finally:
+                self.batches += 1
+                self.counts.update(pipeline.counts)
+            return dict(pipeline.counts)
+
+    def status(self) -> dict[str, Any]:
+        return {
+            "status": "ok",
+            "execute": self.execute,
+            "batches": self.batches,
+            "counts": dict(self.counts),
+            "fields_fingerprint": self.fields_cache.fingerprint,
+            "uptime_s": round(time.time() - self.started, 3),
+        }
+
+
+def _summary(counts: dict[str, int]) -> str:
+    return ", ".join(f"{k} {v}" for k, v in sorted(counts.items())) or "nothing to do"
+
+
+class Spool:
+    """Batch files dropped into ``directory``: write them elsewhere, then rename them in.
+
+    A batch is claimed by moving it into ``processing/`` and run with a journal kept in
+    ``journal/``. Its events go to ``<name>.results.jsonl`` (``a.json`` and ``a.jsonl`` do
+    not share one) and both files move to ``done/``
+    or ``failed/``. Batches a crash left in ``processing/`` are resumed first; a failed batch
+    dropped in again under the same name resumes from its journal, so no issue is created
+    twice. Hidden files and other suffixes (``.tmp``, ``.part``) are ignored.
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        self.directory = Path(directory)
+        self.processing = self.directory / "processing"
+        self.done = self.directory / "done"
+        self.failed = self.directory / "failed"
+        self.journals = self.directory / "journal"
+        for d in (self.processing, self.done, self.failed, self.journals):
+            d.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def _is_batch(path: Path) -> bool:
+        name = path.name
+        return (
+            path.is_file()
+            and not name.startswith(".")
+            and path.suffix in SPOOL_SUFFIXES
+            and not name.endswith(RESULTS_SUFFIX)
+        )
+
+    def pending(self) -> list[Path]:
+        """Interrupted batches first, then new ones by name."""
+        interrupted = sorted(p for p in self.processing.iterdir() if self._is_batch(p))
+        return interrupted + sorted(p for p in self.directory.iterdir() if self._is_batch(p))
+
+    def process(self, service: IssueService, path: Path) -> bool:
+        """Run one batch file. Returns False when it failed (it is moved to ``failed/``)."""
+        claimed = self.processing / path.name
+        if path != claimed:
+            path.replace(claimed)
+        results_path = self.processing / f"{path.name}{RESULTS_SUFFIX}"
+        journal_path = self.journals / f"{path.name}.jsonl"
+        ok = False
+        with results_path.open("a", encoding="utf-8") as fh, RunJournal(journal_path) as journal:
+            reporter = JsonLinesReporter(fh)
+            try:
+                rows = list(iter_issues(claimed))
+                counts = service.run_batch(rows, reporter, journal=journal)
+                ok = True
+                service.reporter.message(f"Batch {path.name}: {_summary(counts)}")
+            except Exception as e:  # one bad batch must not stop the service
+                reporter.event("batch_failed", error=str(e))
+                service.reporter.message(f"[red]Batch {path.name} failed[/red]: {e}")
+            finally:
+                reporter.close()
+        dest = self.done if ok else self.failed
+        claimed.replace(dest / claimed.name)
+        results_path.replace(dest / results_path.name)
+        if ok and journal_path.exists():  # kept on failure, for a resubmitted batch to resume
+            shutil.move(str(journal_path), str(dest / f"{path.name}.journal.jsonl"))
+        return ok
+
+
+def make_http_server(
+    service: IssueService, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT
+) -> ThreadingHTTPServer:
+    """Local HTTP endpoint: ``POST /batches`` (JSON array or JSON Lines body) streams one
+    JSON event per line back as the batch runs; ``GET /health`` and ``GET /metrics``
+    (Prometheus text) report on the service. There is no authentication: bind it to
+    localhost."""
+
+    class Handler(BaseHTTPRequestHandler):
+        server_version = "gh-project-automation"
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+        def _send(self, status: int, body: str, content_type: str = "application/json") -> None:
+            data = body.encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self) -> None:
+            path = urlsplit(self.path).path
+            if path == "/health":
+                self._send(200, json.dumps(service.status()))
+            elif path == "/metrics" and service.metrics is not None:
+                self._send(200, service.metrics.to_prometheus(), "text/plain; version=0.0.4")
+            else:
+                self._send(404, json.dumps({"error": f"no such endpoint: {path}"}))
+
+        def do_POST(self) -> None:
+            path = urlsplit(self.path).path
+            if path != "/batches":
+                self._send(404, json.dumps({"error": f"no such endpoint: {path}"}))
+                return
+            length = int(self.headers.get("Content-Length") or 0)
+            if length > MAX_BODY_BYTES:
+                self._send(413, json.dumps({"error": f"batch larger than {MAX_BODY_BYTES} bytes"}))
+                return
+            body = self.rfile.read(length).decode("utf-8")
+            try:
+                rows = list(iter_issues_from(io.StringIO(body)))
+            except GhAutomationError as e:
+                self._send(400, json.dumps({"error": str(e)}))
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", "application/x-ndjson")
+            self.end_headers()
+            # HTTP/1.0: the response ends when the connection closes, so events go out as
+            # they happen without chunking
+            stream = io.TextIOWrapper(self.wfile, encoding="utf-8", write_through=True)
+            reporter = JsonLinesReporter(stream, buffer_size=1)
+            try:
+                counts = service.run_batch(rows, reporter)
+                service.reporter.message(f"HTTP batch: {_summary(counts)}")
+            except Exception as e:
+                reporter.event("batch_failed", error=str(e))
+                service.reporter.message(f"[red]HTTP batch failed[/red]: {e}")
+            finally:
+                reporter.close()
+                stream.detach()
+
+    return ThreadingHTTPServer((host, port), Handler)
+
+
+def serve(
+    service: IssueService,
+    *,
+    spool: Spool | None = None,
+    server: ThreadingHTTPServer | None = None,
+    stop: threading.Event | None = None,
+    poll_s: float = DEFAULT_POLL_S,
+    once: bool = False,
+) -> None:
+    """Run the HTTP ``server`` in the background and poll ``spool`` until ``stop`` is set
+    (with ``once``: until the spool has been worked through once)."""
+    stop = stop or threading.Event()
+    thread = None
+    if server is not None:
+        thread = threading.Thread(target=server.serve_forever, name="serve-http", daemon=True)
+        thread.start()
+    try:
+        while True:
+            if spool is not None:
+                for path in spool.pending():
+                    if stop.is_set():
+                        break
+                    spool.process(service, path)
+            if once or stop.wait(poll_s):
+                return
+    finally:
+        if server is not None and thread is not None:
+            server.shutdown()
+            server.server_close()
+            thread.join()
@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable, TypeVar
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .http_cache import HttpCache
+from .metrics import Metrics
+from .ratelimit import RateBudget, TokenPool, resource_for_url
+from .retry_policy import CircuitBreaker, classify_error
+from .utils import RETRYABLE, ApiError, OutcomeUnknownError, RetryConfig, retry
+
+T = TypeVar("T")
+
+DEFAULT_POOL_MAXSIZE = 10
+DEFAULT_TIMEOUT_S = 30.0
+
+
+class HttpTransport:
+    """Pooled HTTP session shared by the REST and GraphQL clients.
+
+    Owns one ``requests.Session`` so TCP/TLS connections are reused across calls. Auth and
+    accept headers are built once. Every request passes through ``budget`` so both clients
+    pace against the same rate limits, and is timed into ``metrics`` under its ``op`` name.
+    ``max_in_flight`` caps concurrent requests across every thread sharing the transport.
+    With a ``tokens`` pool, each request is sent with whichever token has headroom and is
+    paced by that token's own budget (``budget`` is then the first token's). With a ``cache``,
+    GETs are sent as conditional requests and a ``304`` is answered from disk. Every request
+    also passes the circuit ``breaker``, which pauses the whole run while the API is failing.
+    A ``fence`` (see ``set_fence``) is checked before each request is sent. Use as a context
+    manager (or call ``close``) to release the pool.
+    """
+
+    def __init__(
+        self,
+        *,
+        token: str = "",
+        api_base: str = "https://api.github.com",
+        pool_connections: int = 4,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        timeout_s: float = DEFAULT_TIMEOUT_S,
+        budget: RateBudget | None = None,
+        metrics: Metrics | None = None,
+        max_in_flight: int | None = None,
+        tokens: TokenPool | None = None,
+        cache: HttpCache | None = None,
+        retry_config: RetryConfig | None = None,
+        breaker: CircuitBreaker | None = None,
+    ) -> None:
+        self.tokens = tokens or TokenPool([token], budgets=[budget or RateBudget()])
+        self.token = self.tokens.tokens[0]
+        self.budget = self.tokens.budgets[0]
+        self.api_base = api_base.rstrip("/")
+        self.timeout_s = timeout_s
+        self._auth = [f"Bearer {t}" for t in self.tokens.tokens]
+        self._local = threading.local()  # budget of the token this thread used last
+        self.metrics = metrics or Metrics()
+        self.cache = cache
+        self.retry_config = retry_config or RetryConfig()
+        self.breaker = breaker or CircuitBreaker()
+        self.metrics.add_section("circuit", self.breaker.summary)
+        self._in_flight = threading.BoundedSemaphore(max_in_flight) if max_in_flight else None
+        self._fence: Callable[[], None] | None = None
+        self._fence_interval_s = 0.0
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        # requests transparently decodes gzip/deflate bodies when the server compresses them.
+        self.session.headers.update(
+            {
+                "Accept": "application/vnd.github+json",
+                "Accept-Encoding": "gzip, deflate",
+                "User-Agent": "gh-project-automation",
+            }
+        )
+
+    def set_fence(self, check: Callable[[], None], *, interval_s: float) -> None:
+        """Call ``check`` right before every request is sent, and at least every
+        ``interval_s`` while a request waits for its rate-limit slot. ``check`` raises to stop
+        the request; ``QueuePipeline`` renews the issue's lease with it."""
+        if interval_s <= 0:
+            raise ValueError("interval_s must be > 0")
+        self._fence = check
+        self._fence_interval_s = interval_s
+
+    def _wait(self, budget: RateBudget, seconds: float) -> None:
+        fence = self._fence
+        if fence is None:
+            budget.sleep(seconds)
+            return
+        # never pace longer than the interval without checking the fence
+        while seconds > self._fence_interval_s:
+            budget.sleep(self._fence_interval_s)
+            seconds -= self._fence_interval_s
+            fence()
+        budget.sleep(seconds)
+        fence()
+
+    def url(self, path: str) -> str:
+        return f"{self.api_base}/{path.lstrip('/')}"
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        creates_content: bool = False,
+        op: str = "",
+        **kwargs: Any,
+    ) -> requests.Response:
+        resource = resource_for_url(url)
+        op = op or resource
+        index, waited = self.tokens.acquire(
+            resource=resource, creates_content=creates_content, wait=False
+        )
+        budget = self._local.budget = self.tokens.budgets[index]
+        self._wait(budget, waited)
+        self.metrics.observe_rate_wait(waited)
+        probe = self.breaker.before_request()
+        kwargs["headers"] = {**(kwargs.get("headers") or {}), "Authorization": self._auth[index]}
+        if self._in_flight is not None:
+            self._in_flight.acquire()
+        started = time.perf_counter()
+        try:
+            resp = self.session.request(method, url, timeout=self.timeout_s, **kwargs)
+        except requests.RequestException:
+            self.metrics.observe_call(op, seconds=time.perf_counter() - started, status="error")
+            self.breaker.record(ok=False, probe=probe)
+            raise
+        finally:
+            if self._in_flight is not None:
+                self._in_flight.release()
+        self.breaker.record(ok=resp.status_code < 500, probe=probe)
+        throttled = resp.status_code in (403, 429)
+        retry_after = resp.headers.get("Retry-After") if throttled else None
+        self.metrics.observe_call(
+            op,
+            seconds=time.perf_counter() - started,
+            status=resp.status_code,
+            bytes_sent=len(resp.request.body or b""),
+            # wire size when the server sent one (compressed), else the decoded body
+            bytes_received=int(resp.headers.get("Content-Length") or len(resp.content)),
+            retry_after_s=float(retry_after) if retry_after and retry_after.isdigit() else None,
+        )
+        body = resp.text if throttled else ""
+        budget.observe_headers(
+            resp.headers, status=resp.status_code, resource=resource, body=body
+        )
+        return resp
+
+    def post(
+        self, url: str, *, json: Any, creates_content: bool = False, op: str = ""
+    ) -> requests.Response:
+        return self.request("POST", url, json=json, creates_content=creates_content, op=op)
+
+    def get(
+        self, url: str, *, params: dict[str, Any] | None = None, op: str = ""
+    ) -> requests.Response:
+        if self.cache is None:
+            return self.request("GET", url, params=params, op=op)
+        full_url = requests.Request("GET", url, params=params).prepare().url or url
+        cached = self.cache.get(full_url)
+        headers = cached.validators if cached is not None else None
+        resp = self.request("GET", full_url, headers=headers, op=op)
+        # a 304 does not count against the REST quota and carries no body
+        if resp.status_code == 304 and cached is not None:
+            return cached.to_response(resp.request)
+        if resp.status_code == 200:
+            self.cache.put(full_url, resp.headers, resp.content)
+        return resp
+
+    def observe_graphql(self, rate_limit: dict[str, Any]) -> None:
+        """Feed a GraphQL ``rateLimit`` object to the budget of the token that fetched it."""
+        getattr(self._local, "budget", self.budget).observe_graphql(rate_limit)
+
+    def with_retries(self, fn: Callable[[], T], *, op: str, idempotent: bool = True) -> T:
+        """Call ``fn`` (which sends one request) under the retry policy.
+
+        Failures are classified by ``retry_policy.classify_error``; requests that are not
+        ``idempotent`` (creates) are not repeated after an answer that leaves it unknown
+        whether they were carried out.
+        """
+        try:
+            return retry(
+                fn,
+                retry_on=(requests.RequestException, ApiError),
+                cfg=self.retry_config,
+                on_retry=self.retry_hook(op),
+                classify=lambda e: classify_error(e, idempotent=idempotent),
+            )
+        except (requests.RequestException, ApiError) as e:
+            if idempotent or classify_error(e) != RETRYABLE:
+                raise
+            raise OutcomeUnknownError(
+                f"{op}: {e} (not retried: it may have been carried out; check before rerunning)",
+                status=getattr(e, "status", None),
+            ) from e
+
+    def retry_hook(self, op: str) -> Callable[[int, Exception, float], None]:
+        """``on_retry`` callback for ``utils.retry`` that records backoff under ``op``."""
+
+        def _hook(attempt: int, error: Exception, delay_s: float) -> None:
+            self.metrics.observe_retry(op, delay_s=delay_s, error=type(error).__name__)
+
+        return _hook
+
+    def close(self) -> None:
+        self.session.close()
+
+    def __enter__(self) -> HttpTransport:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
@@ -1,16 +1,36 @@
 from __future__ import annotations
 
+import hashlib
+import random
 import time
 from dataclasses import dataclass
-from typing import Callable, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, TypeVar
 
-from rich.console import Console
+if TYPE_CHECKING:
+    from rich.console import Console
 
-console = Console()
+_console: Console | None = None
 
 T = TypeVar("T")
 
 
+def get_console() -> Console:
+    """The shared rich console, created (and rich imported) on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        _console = Console()
+    return _console
+
+
+def __getattr__(name: str) -> Any:
+    # `utils.console` stays available without importing rich for commands that never print
+    if name == "console":
+        return get_console()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 class GhAutomationError(RuntimeError):
     """Base exception for this tool."""
 
@@ -24,7 +44,39 @@ class ValidationError(GhAutomationError):
 
 
 class ApiError(GhAutomationError):
-    pass
+    """An API call failed. ``status`` is the HTTP status when the API answered at all;
+    ``rate_limited`` marks rate-limit rejections (the request was not carried out)."""
+
+    def __init__(
+        self, message: str, *, status: int | None = None, rate_limited: bool = False
+    ) -> None:
+        super().__init__(message)
+        self.status = status
+        self.rate_limited = rate_limited
+
+
+class GraphQLError(ApiError):
+    """The GraphQL endpoint answered (HTTP 200) with ``errors`` instead of data."""
+
+    def __init__(self, errors: list[dict[str, Any]]) -> None:
+        limited = any(str(e.get("type")) == "RATE_LIMITED" for e in errors)
+        super().__init__(f"GraphQL errors: {errors}", rate_limited=limited)
+        self.errors = errors
+
+
+class OutcomeUnknownError(ApiError):
+    """A create failed in a way that leaves it unknown whether the issue was made (a 5xx, a
+    timeout or a dropped connection after the request went out); it is not sent again."""
+
+
+class CircuitOpenError(ApiError):
+    """Raised instead of sending a request once the circuit breaker has given up on the API."""
+
+
+# How ``retry`` treats a failure, as decided by its ``classify`` callback.
+RETRYABLE = "retryable"
+RATE_LIMITED = "rate_limited"
+FATAL = "fatal"
 
 
 @dataclass(frozen=True)
@@ -32,11 +84,14 @@ class RetryConfig:
     max_attempts: int = 4
     base_delay_s: float = 0.8
     max_delay_s: float = 8.0
+    max_rate_limited: int = 5  # rate-limit rejections tolerated per call, on top of attempts
 
 
-def backoff_sleep(attempt: int, cfg: RetryConfig) -> None:
-    delay = min(cfg.max_delay_s, cfg.base_delay_s * (2 ** (attempt - 1)))
+def backoff_sleep(attempt: int, cfg: RetryConfig) -> float:
+    # full jitter: concurrent callers that failed together do not retry together
+    delay = random.uniform(0, min(cfg.max_delay_s, cfg.base_delay_s * (2 ** (attempt - 1))))
     time.sleep(delay)
+    return delay
 
 
 def retry(
@@ -44,15 +99,41 @@ def retry(
     *,
     retry_on: tuple[type[Exception], ...],
     cfg: RetryConfig = RetryConfig(),
+    on_retry: Callable[[int, Exception, float], None] | None = None,
+    classify: Callable[[Exception], str] | None = None,
 ) -> T:
-    last_exc: Exception | None = None
-    for attempt in range(1, cfg.max_attempts + 1):
+    """Call ``fn`` until it succeeds; ``on_retry(attempt, error, delay_s)`` sees each backoff.
+
+    ``classify(error)`` sorts failures (all ``RETRYABLE`` without it): ``FATAL`` ones are
+    raised at once; ``RATE_LIMITED`` ones are retried without a backoff of their own, since the
+    rate budget already holds the next request until the limit resets; ``RETRYABLE`` ones back
+    off exponentially with full jitter, up to ``cfg.max_attempts`` attempts.
+    """
+    failures = 0
+    rate_limited = 0
+    while True:
         try:
             return fn()
         except retry_on as e:  # type: ignore[misc]
-            last_exc = e
-            if attempt == cfg.max_attempts:
+            kind = classify(e) if classify is not None else RETRYABLE
+            if kind == FATAL:
                 raise
-            backoff_sleep(attempt, cfg)
-    assert last_exc is not None
-    raise last_exc
+            if kind == RATE_LIMITED:
+                rate_limited += 1
+                if rate_limited > cfg.max_rate_limited:
+                    raise
+                delay = 0.0
+            else:
+                failures += 1
+                if failures >= cfg.max_attempts:
+                    raise
+                delay = backoff_sleep(failures, cfg)
+            if on_retry is not None:
+                on_retry(failures + rate_limited, e, delay)
+
+
+def content_hash(title: str, body: str) -> str:
+    """Stable hash of an issue's normalized title/body (whitespace and line endings ignored)."""
+    norm_title = " ".join(title.split()).casefold()
+    norm_body = "\n".join(line.rstrip() for line in body.strip().splitlines())
+    return hashlib.sha256(f"{norm_title}\0{norm_body}".encode()).hexdigest()[:32]
@@ -1,15 +1,24 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
+import math
+from dataclasses import dataclass, field
+from datetime import date
 from pathlib import Path
-from typing import Any, Iterable
-
-from rich.table import Table
-
-from .project_fields import CANONICAL_FIELDS, FieldMeta, get_canonical_field_name
-from .utils import ValidationError, console
+from typing import IO, Any, Iterable, Iterator, NamedTuple
 
+from .project_fields import (
+    CANONICAL_FIELDS,
+    DATE,
+    NUMBER,
+    OPTION_DATA_TYPES,
+    SINGLE_SELECT,
+    FieldMeta,
+    FieldsCache,
+)
+from .repo_index import RepoIndex, RepoRef
+from .reporter import field_value_counts
+from .utils import ValidationError, get_console
 
 REQUIRED_ISSUE_KEYS = [
     "title",
@@ -23,6 +32,23 @@ REQUIRED_ISSUE_KEYS = [
     "type",
     "effort",
 ]
+# Optional keys resolved against the repository: issue key, ``RepoIndex`` kind, singular.
+REPO_KEYS = (
+    ("labels", "labels", "label"),
+    ("milestone", "milestones", "milestone"),
+    ("assignees", "assignees", "assignee"),
+)
+MAX_ASSIGNEES = 10  # GitHub's limit per issue
+
+
+@dataclass(frozen=True)
+class ResolvedField:
+    issue_key: str
+    field_name: str  # canonical name, as in fields.json
+    field_id: str
+    value: str | float  # option/iteration id, or the literal number/text/date
+    label: str  # human value as written in fields.json / the issue
+    data_type: str = SINGLE_SELECT
 
 
 @dataclass(frozen=True)
@@ -30,14 +56,453 @@ class ValidatedIssue:
     title: str
     description: str
     fields: dict[str, str]  # issue_key -> human option label
+    resolved: tuple[ResolvedField, ...] = ()  # in CANONICAL_FIELDS order
+    labels: tuple[RepoRef, ...] = ()
+    milestone: RepoRef | None = None
+    assignees: tuple[RepoRef, ...] = ()
+
+
+JSON_LINES_SUFFIXES = {".jsonl", ".ndjson"}
+_CHUNK_SIZE = 1 << 16
 
 
 def load_issues(path: str | Path) -> list[dict[str, Any]]:
+    return list(iter_issues(path))
+
+
+def iter_issues(path: str | Path) -> Iterator[dict[str, Any]]:
+    """Yield raw issue records one at a time without reading the whole file.
+
+    Accepts JSON Lines (``.jsonl``/``.ndjson``, or any file whose first character is ``{``)
+    and a top-level JSON array, which is parsed incrementally element by element.
+    """
     p = Path(path)
-    raw = json.loads(p.read_text(encoding="utf-8"))
-    if not isinstance(raw, list):
-        raise ValidationError("issues JSON must be a list of issue objects")
-    return raw
+    with p.open(encoding="utf-8") as fh:
+        yield from iter_issues_from(fh, json_lines=p.suffix.lower() in JSON_LINES_SUFFIXES)
+
+
+def iter_issues_from(fh: IO[str], *, json_lines: bool = False) -> Iterator[dict[str, Any]]:
+    """``iter_issues`` over an open, seekable text stream (a file or a request body)."""
+    if json_lines:
+        yield from _iter_json_lines(fh)
+        return
+    head = fh.read(_CHUNK_SIZE)
+    first = head.lstrip()[:1]
+    if first == "[":
+        yield from _iter_json_array(fh, head)
+    elif first == "{":
+        fh.seek(0)
+        yield from _iter_json_lines(fh)
+    elif first:
+        raise ValidationError("issues JSON must be a list of issue objects (or JSON Lines)")
+
+
+def _iter_json_lines(fh: IO[str]) -> Iterator[Any]:
+    for lineno, line in enumerate(fh, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValidationError(f"Invalid JSON on line {lineno}: {e.msg}") from e
+
+
+def _iter_json_array(fh: IO[str], buf: str) -> Iterator[Any]:
+    decoder = json.JSONDecoder()
+    pos = buf.index("[") + 1
+    eof = False
+    expect_value = True  # False right after an element, until its comma is seen
+    while True:
+        # skip whitespace and the separating comma
+        while True:
+            while pos < len(buf) and buf[pos].isspace():
+                pos += 1
+            if pos < len(buf) and buf[pos] == "," and not expect_value:
+                pos += 1
+                expect_value = True
+                continue
+            break
+        if pos >= len(buf):
+            if eof:
+                raise ValidationError("issues JSON ended before the closing ']'")
+            chunk = fh.read(_CHUNK_SIZE)
+            buf, pos, eof = buf[pos:] + chunk, 0, not chunk
+            continue
+        if buf[pos] == "]":
+            return
+        if not expect_value:
+            raise ValidationError("issues JSON: expected ',' between array elements")
+        try:
+            value, end = decoder.raw_decode(buf, pos)
+        except json.JSONDecodeError as e:
+            if eof:
+                raise ValidationError(f"Invalid issues JSON: {e.msg}") from e
+            value, end = None, -1
+        # An element that runs to the end of the buffer may be truncated (e.g. a number).
+        if end == -1 or (end == len(buf) and not eof):
+            chunk = fh.read(_CHUNK_SIZE)
+            buf, pos, eof = buf[pos:] + chunk, 0, not chunk
+            continue
+        yield value
+        pos = end
+        expect_value = False
+        if pos > _CHUNK_SIZE:
+            buf, pos = buf[pos:], 0
+
+
+def normalize_label(value: str) -> str:
+    """Loose-match key: collapse whitespace and case-fold."""
+    return " ".join(value.split()).casefold()
+
+
+@dataclass(frozen=True)
+class _FieldPlan:
+    issue_key: str
+    field_name: str
+    field_id: str
+    data_type: str
+    options: dict[str, ResolvedField]  # lookup key -> prebuilt (shared, immutable) result
+    allowed: str  # pre-rendered for error messages
+
+    @classmethod
+    def compile(
+        cls, issue_key: str, field_name: str, meta: FieldMeta, *, loose: bool
+    ) -> _FieldPlan:
+        options = {
+            label: ResolvedField(
+                issue_key=issue_key,
+                field_name=field_name,
+                field_id=meta.id,
+                value=opt_id,
+                label=label,
+                data_type=meta.data_type,
+            )
+            for label, opt_id in meta.options.items()
+        }
+        if loose:
+            for rf in list(options.values()):
+                options.setdefault(normalize_label(rf.label), rf)
+        return cls(
+            issue_key=issue_key,
+            field_name=field_name,
+            field_id=meta.id,
+            data_type=meta.data_type,
+            options=options,
+            allowed=_allowed(meta),
+        )
+
+    def resolve(self, val: str, *, loose: bool = False) -> ResolvedField | None:
+        if self.data_type not in OPTION_DATA_TYPES:
+            return self.resolve_literal(val)
+        rf = self.options.get(val)
+        if rf is None and loose:
+            rf = self.options.get(normalize_label(val))
+        return rf
+
+    def resolve_literal(self, val: str) -> ResolvedField | None:
+        """Number/text/date fields: parse the value itself. None if it is not valid."""
+        value: str | float = val
+        if self.data_type == NUMBER:
+            try:
+                value = float(val)
+            except ValueError:
+                return None
+            if not math.isfinite(value):
+                return None
+        elif self.data_type == DATE:
+            try:
+                value = date.fromisoformat(val).isoformat()
+            except ValueError:
+                return None
+        return ResolvedField(
+            issue_key=self.issue_key,
+            field_name=self.field_name,
+            field_id=self.field_id,
+            value=value,
+            label=val,
+            data_type=self.data_type,
+        )
+
+
+def _allowed(meta: FieldMeta) -> str:
+    if meta.data_type in OPTION_DATA_TYPES:
+        return ", ".join(sorted(meta.options))
+    if meta.data_type == NUMBER:
+        return "a number"
+    if meta.data_type == DATE:
+        return "a date (YYYY-MM-DD)"
+    return "any text"
+
+
+class RecordCheck(NamedTuple):
+    issue: ValidatedIssue | None
+    errors: list[str]
+    unknown_option: bool = False  # a value missing from cached options (metadata may be stale)
+    unknown_name: bool = False  # a label/milestone/assignee missing from the repository index
+
+
+@dataclass
+class ValidationReport:
+    issues: list[ValidatedIssue] = field(default_factory=list)
+    errors: list[str] = field(default_factory=list)
+    unknown_options: bool = False
+    unknown_names: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    def raise_for_errors(self, *, max_listed: int = 20) -> None:
+        if not self.errors:
+            return
+        listed = self.errors[:max_listed]
+        more = len(self.errors) - len(listed)
+        msg = f"{len(self.errors)} validation error(s):\n" + "\n".join(f"- {e}" for e in listed)
+        if more:
+            msg += f"\n... and {more} more"
+        raise ValidationError(msg)
+
+
+def _repo_names(key: str, value: Any) -> list[str] | None:
+    """Names given for ``key``: one string, or for labels/assignees a list. None if neither."""
+    if value is None:
+        return []
+    if isinstance(value, str):
+        value = [value]
+    elif key == "milestone" or not isinstance(value, list):
+        return None
+    if not all(isinstance(v, str) for v in value):
+        return None
+    return list(dict.fromkeys(v.strip() for v in value if v.strip()))
+
+
+class ValidationPlan:
+    """Field metadata compiled once into per-field lookup tables.
+
+    Validating a record is then one dict hit per field, and the resulting ``ValidatedIssue``
+    carries resolved field/option IDs so the execution loop does no metadata lookups. With
+    ``loose=True`` values also match after whitespace collapsing and case-folding. The
+    optional ``labels``, ``milestone`` and ``assignees`` keys are resolved the same way
+    against ``repo_index``; without one they are not checked and not carried over.
+    """
+
+    def __init__(
+        self,
+        fields_meta: dict[str, FieldMeta],
+        *,
+        loose: bool = False,
+        repo_index: RepoIndex | None = None,
+    ) -> None:
+        self.loose = loose
+        self.repo_index = repo_index
+        self.metadata_errors: list[str] = []
+        self._fields: list[_FieldPlan] = []
+        for issue_key, canonical in CANONICAL_FIELDS.items():
+            meta = fields_meta.get(canonical)
+            if meta is None:
+                self.metadata_errors.append(
+                    f"Field '{canonical}' not found in fields metadata. "
+                    f"(needed by issue key '{issue_key}')"
+                )
+                continue
+            self._fields.append(_FieldPlan.compile(issue_key, canonical, meta, loose=loose))
+
+    def check_record(self, row: int, issue: Any) -> RecordCheck:
+        """Validate one record, collecting every problem instead of stopping at the first."""
+        if not isinstance(issue, dict):
+            return RecordCheck(None, [f"Issue #{row} must be an object"])
+        errors: list[str] = []
+        missing = [k for k in REQUIRED_ISSUE_KEYS if k not in issue]
+        if missing:
+            errors.append(f"Issue #{row} missing required keys: {', '.join(missing)}")
+
+        title = str(issue.get("title", "")).strip()
+        if "title" in issue and not title:
+            errors.append(f"Issue #{row} title cannot be empty")
+
+        fields: dict[str, str] = {}
+        resolved: list[ResolvedField] = []
+        unknown_option = False
+        for fp in self._fields:
+            if fp.issue_key not in issue:
+                continue  # already reported as missing
+            val = str(issue[fp.issue_key]).strip()
+            rf = fp.resolve(val, loose=self.loose)
+            if rf is None:
+                unknown_option = unknown_option or fp.data_type in OPTION_DATA_TYPES
+                errors.append(
+                    f"Invalid value '{val}' for field '{fp.field_name}' "
+                    f"in issue #{row}. Allowed: {fp.allowed}"
+                )
+                continue
+            fields[fp.issue_key] = rf.label
+            resolved.append(rf)
+
+        refs: dict[str, list[RepoRef]] = {"labels": [], "milestone": [], "assignees": []}
+        unknown_name = False
+        if self.repo_index is not None:
+            unknown_name = self._check_repo_refs(row, issue, refs, errors)
+
+        if errors or self.metadata_errors:
+            return RecordCheck(None, errors, unknown_option, unknown_name)
+        issue_obj = ValidatedIssue(
+            title=title,
+            description=str(issue["description"]),
+            fields=fields,
+            resolved=tuple(resolved),
+            labels=tuple(refs["labels"]),
+            milestone=refs["milestone"][0] if refs["milestone"] else None,
+            assignees=tuple(refs["assignees"]),
+        )
+        return RecordCheck(issue_obj, [])
+
+    def _check_repo_refs(
+        self, row: int, issue: dict[str, Any], refs: dict[str, list[RepoRef]], errors: list[str]
+    ) -> bool:
+        """Resolve labels/milestone/assignees into ``refs``. True when a name was unknown."""
+        assert self.repo_index is not None
+        index = self.repo_index
+        unknown = False
+        for key, kind, what in REPO_KEYS:
+            names = _repo_names(key, issue.get(key))
+            if names is None:
+                shape = "a milestone title" if key == "milestone" else "a list of names"
+                errors.append(f"Issue #{row} {key} must be {shape}")
+                continue
+            for name in names:
+                ref = index.lookup(kind, name)
+                if ref is None:
+                    unknown = True
+                    errors.append(
+                        f"Unknown {what} '{name}' in issue #{row} "
+                        f"(not in {index.owner}/{index.repo})"
+                    )
+                elif ref not in refs[key]:
+                    refs[key].append(ref)
+        if len(refs["assignees"]) > MAX_ASSIGNEES:
+            errors.append(f"Issue #{row} has more than {MAX_ASSIGNEES} assignees")
+        return unknown
+
+    def iter_validated(self, issues: Iterable[Any]) -> Iterator[ValidatedIssue]:
+        """Lazily validate ``issues``; raises ``ValidationError`` when a bad record is reached."""
+        if self.metadata_errors:
+            raise ValidationError("; ".join(self.metadata_errors))
+        for row, issue in enumerate(issues, start=1):
+            check = self.check_record(row, issue)
+            if check.issue is None:
+                raise ValidationError("; ".join(check.errors))
+            yield check.issue
+
+    def validate_all(self, issues: Iterable[Any]) -> ValidationReport:
+        """Validate every record in one pass and report all errors, not just the first."""
+        report = ValidationReport(errors=list(self.metadata_errors))
+        for row, issue in enumerate(issues, start=1):
+            check = self.check_record(row, issue)
+            if check.issue is not None:
+                report.issues.append(check.issue)
+            report.errors.extend(check.errors)
+            report.unknown_options = report.unknown_options or check.unknown_option
+            report.unknown_names = report.unknown_names or check.unknown_name
+        return report
+
+
+def validate_with_cache(
+    rows: list[Any],
+    cache: FieldsCache,
+    *,
+    loose: bool = False,
+    plan: ValidationPlan | None = None,
+    repo_index: RepoIndex | None = None,
+) -> tuple[ValidationPlan, ValidationReport]:
+    """Validate ``rows``; if metadata looks stale, refresh ``cache`` once and validate again.
+
+    ``plan`` reuses one compiled earlier from the same metadata (a long-lived process).
+    ``repo_index`` is refreshed the same way when a label, milestone or assignee is unknown.
+    """
+    if plan is None:
+        plan = ValidationPlan(cache.fields, loose=loose, repo_index=repo_index)
+    report = plan.validate_all(rows)
+    refetched = False
+    if (report.unknown_options or plan.metadata_errors) and cache.can_refresh:
+        cache.try_refresh()
+        plan = ValidationPlan(cache.fields, loose=loose, repo_index=repo_index)
+        refetched = True
+    if report.unknown_names and repo_index is not None and repo_index.can_refresh:
+        repo_index.try_refresh()
+        refetched = True
+    if refetched:
+        report = plan.validate_all(rows)
+    return plan, report
+
+
+def iter_validated_with_cache(
+    issues: Iterable[Any],
+    cache: FieldsCache,
+    *,
+    loose: bool = False,
+    repo_index: RepoIndex | None = None,
+) -> Iterator[ValidatedIssue]:
+    """Streaming counterpart of ``validate_with_cache``: refresh at most once, on first miss."""
+    plan = ValidationPlan(cache.fields, loose=loose, repo_index=repo_index)
+    if plan.metadata_errors and cache.can_refresh:
+        cache.try_refresh()
+        plan = ValidationPlan(cache.fields, loose=loose, repo_index=repo_index)
+    if plan.metadata_errors:
+        raise ValidationError("; ".join(plan.metadata_errors))
+    for row, issue in enumerate(issues, start=1):
+        check = plan.check_record(row, issue)
+        if check.unknown_option and cache.can_refresh:
+            cache.try_refresh()
+            plan = ValidationPlan(cache.fields, loose=loose, repo_index=repo_index)
+            check = plan.check_record(row, issue)
+        if check.unknown_name and repo_index is not None and repo_index.can_refresh:
+            repo_index.try_refresh()
+            check = plan.check_record(row, issue)
+        if check.issue is None:
+            raise ValidationError("; ".join(check.errors))
+        yield check.issue
+
+
+def find_field(fields_meta: dict[str, FieldMeta], name: str) -> tuple[str, FieldMeta]:
+    """Look up a field by project field name or issue key (``status``), ignoring case."""
+    wanted = name.strip().casefold()
+    canonical = CANONICAL_FIELDS.get(wanted, "").casefold()
+    for field_name, meta in fields_meta.items():
+        if field_name.casefold() in (wanted, canonical):
+            return field_name, meta
+    raise ValidationError(f"Field '{name}' not found in fields metadata")
+
+
+def resolve_field_value(
+    fields_meta: dict[str, FieldMeta],
+    name: str,
+    value: str,
+    *,
+    loose: bool = False,
+) -> ResolvedField:
+    """Resolve one ``name=value`` pair given on the command line.
+
+    ``name`` is matched as in ``find_field``; ``value`` is an option/iteration label or a
+    literal, as in an issues file.
+    """
+    field_name, meta = find_field(fields_meta, name)
+    issue_key = next((k for k, v in CANONICAL_FIELDS.items() if v == field_name), name.strip())
+    fp = _FieldPlan.compile(issue_key, field_name, meta, loose=loose)
+    rf = fp.resolve(value.strip(), loose=loose)
+    if rf is None:
+        raise ValidationError(
+            f"Invalid value '{value}' for field '{field_name}'. Allowed: {fp.allowed}"
+        )
+    return rf
+
+
+def iter_validated(
+    issues: Iterable[dict[str, Any]],
+    *,
+    fields_meta: dict[str, FieldMeta],
+) -> Iterator[ValidatedIssue]:
+    """Lazily validate ``issues``; raises ``ValidationError`` when a bad record is reached."""
+    return ValidationPlan(fields_meta).iter_validated(issues)
 
 
 def validate_issues(
@@ -45,53 +510,38 @@ def validate_issues(
     *,
     fields_meta: dict[str, FieldMeta],
 ) -> list[ValidatedIssue]:
-    validated: list[ValidatedIssue] = []
-    for idx, issue in enumerate(issues, start=1):
-        if not isinstance(issue, dict):
-            raise ValidationError(f"Issue #{idx} must be an object")
-        missing = [k for k in REQUIRED_ISSUE_KEYS if k not in issue]
-        if missing:
-            raise ValidationError(f"Issue #{idx} missing required keys: {', '.join(missing)}")
+    report = ValidationPlan(fields_meta).validate_all(issues)
+    report.raise_for_errors()
+    return report.issues
 
-        title = str(issue["title"]).strip()
-        desc = str(issue["description"])
 
-        if not title:
-            raise ValidationError(f"Issue #{idx} title cannot be empty")
+PREVIEW_COLUMNS = ["release", "phase", "area", "priority", "risk", "type", "effort", "status"]
 
-        # validate each project field value exists in fields.json
-        issue_fields: dict[str, str] = {}
-        for issue_key in CANONICAL_FIELDS.keys():
-            val = str(issue[issue_key]).strip()
-            canonical = get_canonical_field_name(issue_key)
-            if canonical not in fields_meta:
-                raise ValidationError(
-                    f"Field '{canonical}' not found in fields metadata. "
-                    f"(needed by issue key '{issue_key}')"
-                )
-            meta = fields_meta[canonical]
-            if val not in meta.options:
-                allowed = ", ".join(sorted(meta.options.keys()))
-                raise ValidationError(
-                    f"Invalid value '{val}' for field '{canonical}' in issue #{idx}. "
-                    f"Allowed: {allowed}"
-                )
-            issue_fields[issue_key] = val
 
-        validated.append(ValidatedIssue(title=title, description=desc, fields=issue_fields))
-    return validated
+def print_dry_run_preview(
+    issues: list[ValidatedIssue], *, limit: int | None = None, max_rows: int | None = None
+) -> None:
+    """Render the preview table; past ``max_rows`` rows, summarize the rest as value counts."""
+    from rich.table import Table
 
+    slice_ = issues[:limit] if limit else issues
+    shown = slice_[:max_rows] if max_rows else slice_
+    hidden = len(slice_) - len(shown)
 
-def print_dry_run_preview(issues: list[ValidatedIssue], *, limit: int | None = None) -> None:
     table = Table(title="Dry-run Preview (Issues)")
     table.add_column("#", style="dim", width=4)
     table.add_column("Title", overflow="fold")
-    for k in ["release", "phase", "area", "priority", "risk", "type", "effort", "status"]:
+    for k in PREVIEW_COLUMNS:
         table.add_column(k)
-
-    slice_ = issues[:limit] if limit else issues
-    for i, it in enumerate(slice_, start=1):
-        row = [str(i), it.title] + [it.fields[k] for k in ["release","phase","area","priority","risk","type","effort","status"]]
+    for i, it in enumerate(shown, start=1):
+        row = [str(i), it.title] + [it.fields[k] for k in PREVIEW_COLUMNS]
         table.add_row(*row)
+    if hidden:
+        table.caption = f"... {hidden} more issue(s) not shown"
 
+    console = get_console()
     console.print(table)
+    if hidden:
+        for key, counts in field_value_counts(slice_).items():
+            summary = ", ".join(f"{v} ×{n}" for v, n in counts.items())
+            console.print(f"  [bold]{key}[/bold] ({len(slice_)}): {summary}")
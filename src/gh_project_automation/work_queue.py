@@ -0,0 +1,391 @@
+from __future__ import annotations
+
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator
+
+from .engine import IssuePipeline, IssueResult, Log
+from .issue_creator import CreatedIssue
+from .journal import JournalEntry
+from .repo_index import RepoRef
+from .utils import ConfigError, GhAutomationError, OutcomeUnknownError, content_hash
+from .validator import ResolvedField, ValidatedIssue
+
+if TYPE_CHECKING:
+    from .transport import HttpTransport
+
+# A claimed issue whose lease nobody has renewed for this long is given to another worker.
+DEFAULT_LEASE_S = 300.0
+# Issues claimed per transaction; the lease clock starts for all of them at once.
+DEFAULT_CLAIM_SIZE = 20
+# Claims of a failed issue before it is left for someone to look at.
+DEFAULT_MAX_ATTEMPTS = 3
+SCHEMA_VERSION = 1
+
+PENDING = "pending"
+LEASED = "leased"
+DONE = "done"
+FAILED = "failed"
+# A create that may or may not have happened: never claimed again, someone has to look.
+NEEDS_CHECK = "needs_check"
+STATUSES = (PENDING, LEASED, DONE, FAILED, NEEDS_CHECK)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS items (
+    key TEXT PRIMARY KEY,
+    idx INTEGER NOT NULL,
+    issue TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    stage TEXT NOT NULL DEFAULT 'new',
+    number INTEGER,
+    node_id TEXT,
+    html_url TEXT,
+    item_id TEXT,
+    fields_applied TEXT NOT NULL DEFAULT '[]',
+    owner TEXT,
+    lease_until REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS items_by_status ON items (status, idx);
+"""
+
+
+class LeaseLostError(GhAutomationError):
+    """A worker's lease on an issue ran out and another worker has claimed it since."""
+
+
+def _issue_to_json(issue: ValidatedIssue) -> str:
+    return json.dumps(asdict(issue), ensure_ascii=False)
+
+
+def _issue_from_json(raw: str) -> ValidatedIssue:
+    data = json.loads(raw)
+    return ValidatedIssue(
+        title=data["title"],
+        description=data["description"],
+        fields=data["fields"],
+        resolved=tuple(ResolvedField(**rf) for rf in data["resolved"]),
+        labels=tuple(RepoRef(**r) for r in data.get("labels") or ()),
+        milestone=RepoRef(**data["milestone"]) if data.get("milestone") else None,
+        assignees=tuple(RepoRef(**r) for r in data.get("assignees") or ()),
+    )
+
+
+class WorkQueue:
+    """SQLite work queue of validated issues, drained by any number of worker processes.
+
+    ``load`` inserts issues keyed like journal entries (content hash plus occurrence), so
+    loading the same file twice adds nothing. Workers ``claim`` issues under a lease and record
+    each finished step (created, added, fields, done) through the ``RunJournal`` interface;
+    every record renews the lease. When a worker dies its lease runs out and the issue is
+    claimed again, resuming after the last recorded step. Records are fenced by the lease
+    owner, so a worker that lost its lease gets ``LeaseLostError`` instead of overwriting the
+    new owner's progress. The database runs in WAL mode; every process on a host (or on a
+    filesystem with working locks) can share it. One connection per instance, thread-safe.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        worker_id: str = "",
+        lease_s: float = DEFAULT_LEASE_S,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.path = Path(path)
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.lease_s = lease_s
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # autocommit; claims and loads open their own IMMEDIATE transactions
+        self._db = sqlite3.connect(
+            str(self.path), timeout=30.0, isolation_level=None, check_same_thread=False
+        )
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+        version = self._meta("schema")
+        if version is None:
+            self._set_meta("schema", str(SCHEMA_VERSION))
+        elif version != str(SCHEMA_VERSION):
+            raise ConfigError(f"{self.path}: unsupported work queue version {version}")
+
+    def _meta(self, name: str) -> str | None:
+        row = self._db.execute("SELECT value FROM meta WHERE name = ?", (name,)).fetchone()
+        return None if row is None else str(row[0])
+
+    def _set_meta(self, name: str, value: str) -> None:
+        self._db.execute("INSERT OR REPLACE INTO meta (name, value) VALUES (?, ?)", (name, value))
+
+    def bind(self, *, owner: str, repo: str, project_id: str) -> None:
+        """Record the queue's target on first use; refuse to work it against another one."""
+        target = f"{owner}/{repo} -> {project_id}"
+        with self._lock:
+            current = self._meta("target")
+            if current is None:
+                self._set_meta("target", target)
+            elif current != target:
+                raise ConfigError(
+                    f"Work queue {self.path} was loaded for {current}, not {target}. "
+                    "Check GITHUB_OWNER/GITHUB_REPO/GITHUB_PROJECT_ID or use another --queue."
+                )
+
+    # ---- loading ----
+
+    def load(self, issues: Iterable[ValidatedIssue]) -> int:
+        """Queue ``issues`` in order. Returns how many were new."""
+        seen: dict[str, int] = {}
+        rows = []
+        for issue in issues:
+            h = content_hash(issue.title, issue.description)
+            n = seen.get(h, 0)
+            seen[h] = n + 1
+            rows.append((f"{h}:{n}", _issue_to_json(issue)))
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                base = self._db.execute("SELECT COALESCE(MAX(idx), 0) FROM items").fetchone()[0]
+                before = self._db.total_changes
+                self._db.executemany(
+                    "INSERT OR IGNORE INTO items (key, idx, issue) VALUES (?, ?, ?)",
+                    [(key, base + i, raw) for i, (key, raw) in enumerate(rows, start=1)],
+                )
+                added = self._db.total_changes - before
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+        return added
+
+    # ---- claiming ----
+
+    def claim(
+        self, limit: int = DEFAULT_CLAIM_SIZE, *, max_attempts: int = DEFAULT_MAX_ATTEMPTS
+    ) -> list[tuple[str, ValidatedIssue]]:
+        """Lease up to ``limit`` issues: pending ones, expired leases and failed ones with
+        attempts left, in load order."""
+        with self._lock:
+            now = self._clock()
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                rows = self._db.execute(
+                    "SELECT key, issue FROM items"
+                    " WHERE status = 'pending'"
+                    " OR (status = 'leased' AND lease_until < ?)"
+                    " OR (status = 'failed' AND attempts < ?)"
+                    " ORDER BY idx LIMIT ?",
+                    (now, max_attempts, limit),
+                ).fetchall()
+                self._db.executemany(
+                    "UPDATE items SET status = 'leased', owner = ?, lease_until = ? WHERE key = ?",
+                    [(self.worker_id, now + self.lease_s, key) for key, _ in rows],
+                )
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+        return [(str(key), _issue_from_json(raw)) for key, raw in rows]
+
+    def release(self) -> int:
+        """Hand back every issue this worker has leased (claimed but not finished)."""
+        with self._lock:
+            cur = self._db.execute(
+                "UPDATE items SET status = 'pending', owner = NULL, lease_until = NULL"
+                " WHERE owner = ? AND status = 'leased'",
+                (self.worker_id,),
+            )
+            return cur.rowcount
+
+    def renew(self, key: str) -> None:
+        """Extend the lease on ``key``; ``LeaseLostError`` if another worker holds it now."""
+        with self._lock:
+            self._update_locked(key, "lease_until = ?", (self._clock() + self.lease_s,))
+
+    def fail(self, key: str, error: str, *, status: str = FAILED) -> None:
+        """Give up on ``key`` for now: ``FAILED`` is claimed again while attempts are left,
+        ``NEEDS_CHECK`` never is."""
+        with self._lock:
+            self._db.execute(
+                "UPDATE items SET status = ?, attempts = attempts + 1, error = ?,"
+                " owner = NULL, lease_until = NULL"
+                " WHERE key = ? AND owner = ? AND status = 'leased'",
+                (status, error, key, self.worker_id),
+            )
+
+    # ---- RunJournal interface (what IssuePipeline records progress through) ----
+
+    def _update_locked(self, key: str, assignments: str, params: tuple[Any, ...]) -> None:
+        cur = self._db.execute(
+            f"UPDATE items SET {assignments}"
+            " WHERE key = ? AND owner = ? AND status = 'leased'",
+            (*params, key, self.worker_id),
+        )
+        if cur.rowcount == 0:
+            raise LeaseLostError(f"Lease on queued issue {key} expired and was claimed again")
+
+    def get(self, key: str) -> JournalEntry | None:
+        with self._lock:
+            self._update_locked(key, "lease_until = ?", (self._clock() + self.lease_s,))
+            number, node_id, html_url, item_id, applied, stage = self._db.execute(
+                "SELECT number, node_id, html_url, item_id, fields_applied, stage"
+                " FROM items WHERE key = ?",
+                (key,),
+            ).fetchone()
+        created = None
+        if number is not None:
+            created = CreatedIssue(number=int(number), node_id=node_id, html_url=html_url)
+        return JournalEntry(
+            created=created,
+            item_id=item_id,
+            fields_applied=set(json.loads(applied)),
+            done=stage == DONE,
+        )
+
+    def record_created(self, key: str, created: CreatedIssue) -> None:
+        with self._lock:
+            self._update_locked(
+                key,
+                "number = ?, node_id = ?, html_url = ?, stage = 'created', lease_until = ?",
+                (created.number, created.node_id, created.html_url, self._clock() + self.lease_s),
+            )
+
+    def record_added(self, key: str, item_id: str) -> None:
+        with self._lock:
+            self._update_locked(
+                key,
+                "item_id = ?, stage = 'added', lease_until = ?",
+                (item_id, self._clock() + self.lease_s),
+            )
+
+    def record_fields(self, key: str, field_ids: Iterable[str]) -> None:
+        ids = set(field_ids)
+        if not ids:
+            return
+        with self._lock:
+            row = self._db.execute(
+                "SELECT fields_applied FROM items WHERE key = ?", (key,)
+            ).fetchone()
+            applied = sorted(ids | set(json.loads(row[0])))
+            self._update_locked(
+                key,
+                "fields_applied = ?, stage = 'fields', lease_until = ?",
+                (json.dumps(applied), self._clock() + self.lease_s),
+            )
+
+    def record_done(self, key: str) -> None:
+        with self._lock:
+            self._update_locked(
+                key, "status = 'done', stage = 'done', owner = NULL, lease_until = NULL", ()
+            )
+
+    # ---- reporting ----
+
+    def stats(self) -> dict[str, int]:
+        """Issues per status, plus ``expired`` leases (claimable again)."""
+        with self._lock:
+            counts = dict.fromkeys(STATUSES, 0)
+            for status, n in self._db.execute(
+                "SELECT status, COUNT(*) FROM items GROUP BY status"
+            ):
+                counts[str(status)] = int(n)
+            counts["expired"] = self._db.execute(
+                "SELECT COUNT(*) FROM items WHERE status = 'leased' AND lease_until < ?",
+                (self._clock(),),
+            ).fetchone()[0]
+        return counts
+
+    def failures(self, limit: int = 10) -> list[tuple[str, str]]:
+        """``(title, error)`` of failed issues and ones to check, in load order."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT issue, error FROM items WHERE status IN ('failed', 'needs_check')"
+                " ORDER BY idx LIMIT ?",
+                (limit,),
+            ).fetchall()
+        return [(json.loads(raw)["title"], str(error or "")) for raw, error in rows]
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def __enter__(self) -> WorkQueue:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+class QueuePipeline(IssuePipeline):
+    """``IssuePipeline`` over issues claimed from a ``WorkQueue``.
+
+    Keys are the ones the queue assigned at load time and progress is recorded in the queue.
+    An issue that fails is marked failed there (with its error) and the run moves on to the
+    next one; ``max_attempts`` decides whether it is claimed again. A create whose outcome is
+    unknown is marked ``needs_check`` instead: claiming it again would create it twice.
+    ``attach`` makes every request renew the lease of the issue it is sent for, so a long
+    rate-limit wait cannot let another worker claim (and create) the same issue meanwhile.
+    """
+
+    stop_on_failure = False
+
+    def __init__(self, *, queue: WorkQueue, **kwargs: Any) -> None:
+        super().__init__(journal=queue, **kwargs)
+        self.queue = queue
+        self._keys: dict[int, str] = {}
+        self._current = threading.local()  # key of the issue this thread is working on
+
+    def attach(self, transport: HttpTransport) -> None:
+        # a third of the lease: two renewals can be missed before it runs out
+        transport.set_fence(self.renew_lease, interval_s=self.queue.lease_s / 3)
+
+    def renew_lease(self) -> None:
+        key = getattr(self._current, "key", "")
+        if key:
+            self.queue.renew(key)
+
+    def claimed(
+        self, claim_size: int = DEFAULT_CLAIM_SIZE, *, max_attempts: int = DEFAULT_MAX_ATTEMPTS
+    ) -> Iterator[ValidatedIssue]:
+        """Yield claimed issues, claiming the next batch when one runs out, until none is left."""
+        while True:
+            batch = self.queue.claim(claim_size, max_attempts=max_attempts)
+            if not batch:
+                return
+            for key, issue in batch:
+                self._keys[id(issue)] = key
+                yield issue
+
+    def key_for(self, issue: ValidatedIssue) -> str:
+        # the run loops ask once per issue, right after taking it from ``claimed``
+        return self._keys.pop(id(issue))
+
+    def run_one(self, index: int, issue: ValidatedIssue, log: Log, *, key: str = "") -> IssueResult:
+        self._current.key = key
+        try:
+            return super().run_one(index, issue, log, key=key)
+        except LeaseLostError:
+            raise  # the issue is another worker's now
+        except OutcomeUnknownError as e:
+            self.queue.fail(key, str(e), status=NEEDS_CHECK)
+            raise
+        except Exception as e:
+            self.queue.fail(key, str(e))
+            raise
+        finally:
+            self._current.key = ""
+
+
+def summarize(stats: dict[str, int]) -> str:
+    line = ", ".join(f"{stats.get(s, 0)} {s}" for s in STATUSES)
+    if stats.get("expired"):
+        line += f" ({stats['expired']} lease(s) expired)"
+    return line
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+import pytest
+
+from gh_project_automation.fake_server import FakeGitHub
+
+
+@pytest.fixture
+def fake_github(monkeypatch):
+    """A running fake GitHub API with the CLI's environment pointed at it."""
+    with FakeGitHub() as server:
+        monkeypatch.setenv("GITHUB_TOKEN", "test-token")
+        monkeypatch.setenv("GITHUB_OWNER", "octo")
+        monkeypatch.setenv("GITHUB_REPO", "demo")
+        monkeypatch.setenv("GITHUB_PROJECT_ID", server.project_id)
+        monkeypatch.setenv("GITHUB_API_BASE", server.url)
+        yield server
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import json
+
+from gh_project_automation import cli
+from gh_project_automation.adaptive import AdaptiveController
+from gh_project_automation.fake_server import FakeGitHubConfig
+from gh_project_automation.project_fields import CANONICAL_FIELDS
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _window(ctl: AdaptiveController, clock: _Clock, *, seconds: float = 0.05) -> None:
+    for _ in range(ctl.window):
+        clock.now += 0.01
+        ctl.observe("call", {"op": "add_item", "seconds": seconds, "status": 200})
+
+
+def test_slow_start_then_throttle_backoff_and_careful_probing():
+    clock = _Clock()
+    ctl = AdaptiveController(max_concurrency=32, max_batch_size=50, window=10, clock=clock)
+    for expected in (2, 4, 8, 16):
+        _window(ctl, clock)
+        assert ctl.concurrency == expected
+
+    throttled = {"op": "update_field", "seconds": 0.01, "status": 403, "retry_after_s": 1}
+    ctl.observe("call", throttled)
+    ctl.observe("call", throttled)  # same burst: one decrease
+    assert (ctl.concurrency, ctl.batch_size) == (8, 25)
+    _window(ctl, clock)  # still inside Retry-After: no growth
+    assert ctl.concurrency == 8
+
+    clock.now += 1
+    for _ in range(15):
+        _window(ctl, clock)
+    # back up additively to just below the throttled level, then held there before probing it
+    assert ctl.concurrency == 15 and ctl.batch_size == 50
+    for _ in range(3):
+        _window(ctl, clock)
+    assert ctl.concurrency == 16
+
+    summary = ctl.summary()
+    assert summary["throttled"] == 2 and summary["peak_concurrency"] == 16
+    assert summary["decisions"][4]["reason"] == "throttled (update_field)"
+
+
+def test_latency_and_errors_shrink_limits():
+    clock = _Clock()
+    ctl = AdaptiveController(
+        max_concurrency=8, max_batch_size=40, initial_concurrency=8, window=10, clock=clock
+    )
+    _window(ctl, clock, seconds=0.05)  # learns the best p95
+    _window(ctl, clock, seconds=0.5)
+    assert ctl.concurrency == 6 and ctl.decisions[-1].reason.startswith("p95 10.0x")
+
+    ctl.observe("call", {"op": "update_field", "seconds": 30.0, "status": "error"})
+    _window(ctl, clock)
+    assert (ctl.concurrency, ctl.batch_size) == (4, 20)
+
+
+def test_adaptive_import_survives_a_concurrency_limit(fake_github, tmp_path, capsys):
+    fake_github.config = FakeGitHubConfig(max_in_flight=4, retry_after_s=0)
+    issues = tmp_path / "issues.jsonl"
+    with issues.open("w", encoding="utf-8") as f:
+        for i in range(60):
+            row = {"title": f"Issue {i}", "description": ""}
+            row.update({k: f"{canonical} {i % 3}" for k, canonical in CANONICAL_FIELDS.items()})
+            f.write(json.dumps(row) + "\n")
+    argv = [
+        "--issues", str(issues),
+        "--fields", str(tmp_path / "fields.json"),
+        "--execute",
+        "--adaptive",
+        "--max-graphql-cost-per-minute", "0",  # the fake answers far faster than GitHub allows
+        "--concurrency", "16",
+        "--max-creates-per-minute", "0",
+        "--output", "jsonl",
+        "--metrics-json", str(tmp_path / "metrics.json"),
+    ]  # fmt: skip
+    assert cli.main(argv) == 0
+
+    assert len(fake_github.issues) == 60
+    adaptive = json.loads((tmp_path / "metrics.json").read_text())["adaptive"]
+    assert adaptive["max_concurrency"] == 16 and adaptive["decisions"]
+    events = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    metrics = next(e for e in events if e["event"] == "metrics")
+    assert metrics["adaptive"]["concurrency"] == adaptive["concurrency"]
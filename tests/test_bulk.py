@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import io
+import json
+import threading
+
+import pytest
+
+from gh_project_automation import cli
+from gh_project_automation.bulk import (
+    UpdateBatcher,
+    parse_change,
+    parse_filter,
+    plan_item_updates,
+)
+from gh_project_automation.fake_server import synthetic_fields
+from gh_project_automation.project_item_manager import FieldUpdate, ProjectItem
+from gh_project_automation.reporter import JsonLinesReporter
+from gh_project_automation.utils import ApiError, ValidationError
+
+
+def _item(values: dict[str, str]) -> ProjectItem:
+    return ProjectItem(
+        id="PVTI_1",
+        content_type="Issue",
+        content_id="I_1",
+        number=1,
+        title="t",
+        url="u",
+        state="OPEN",
+        repository="o/r",
+        updated_at="",
+        field_values=dict(values),
+    )
+
+
+def test_filters_and_changes_resolve_labels_and_skip_values_already_set():
+    fields = synthetic_fields()
+    status, release = fields["Status"], fields["Release"]
+    where = parse_filter("status=Status 0|", fields)
+    assert where.matches(_item({status.id: status.options["Status 0"]}))
+    assert where.matches(_item({}))  # empty alternative: field unset
+    assert not where.matches(_item({status.id: status.options["Status 1"]}))
+
+    changes = [parse_change("Status=Status 2", fields), parse_change("release=Release 1", fields)]
+    item = _item({status.id: status.options["Status 2"], release.id: release.options["Release 0"]})
+    updates = plan_item_updates(item, changes)
+    assert [(u.field_name, u.value) for u in updates] == [("Release", release.options["Release 1"])]
+
+    with pytest.raises(ValidationError, match="Allowed"):
+        parse_change("Status=Nope", fields)
+
+
+def test_bulk_update_reclassifies_matching_items_in_batches(fake_github, tmp_path, capsys):
+    for i in range(250):
+        fake_github.seed_item(f"Item {i}", {"Status": f"Status {i % 2}", "Release": "Release 0"})
+    argv = [
+        "bulk-update",
+        "--fields", str(tmp_path / "fields.json"),
+        "--where", "status=Status 0",
+        "--set", "Status=Status 2",
+        "--set", "Release=Release 1",
+        "--execute",
+        "--concurrency", "3",
+        "--batch-size", "20",
+        "--output", "jsonl",
+    ]  # fmt: skip
+    assert cli.main(argv) == 0
+
+    status, release = fake_github.fields["Status"], fake_github.fields["Release"]
+    values = [item["fields"] for item in fake_github.items.values()]
+    assert sum(v[status.id] == status.options["Status 2"] for v in values) == 125
+    assert sum(v[status.id] == status.options["Status 1"] for v in values) == 125
+    assert sum(v[release.id] == release.options["Release 1"] for v in values) == 125
+    assert fake_github.calls["ProjectItems"] == 3
+    assert fake_github.calls["BatchUpdateProjectV2ItemFieldValues"] == 13  # 250 updates / 20
+
+    events = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    done = next(e for e in events if e["event"] == "bulk_update_finished")
+    assert done["matched"] == 125 and done["updates_ok"] == 250 and done["failed"] == 0
+
+
+def test_batcher_shuts_its_threads_down_when_a_document_fails():
+    class _FailingPIM:
+        max_batch_size = 1
+
+        def set_fields_batch(self, updates, *, execute):
+            raise ApiError("GraphQL HTTP 502")
+
+    pim = _FailingPIM()
+    batcher = UpdateBatcher(pim, reporter=JsonLinesReporter(io.StringIO()))  # type: ignore[arg-type]
+    with pytest.raises(ApiError), batcher:
+        batcher.add([FieldUpdate(item_id="PVTI_1", field_id="F_1", value="O_1")])
+    assert not [t for t in threading.enumerate() if t.name.startswith("bulk")]
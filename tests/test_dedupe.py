@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from typing import Any
+
+from gh_project_automation.dedupe import DedupeIndex
+from gh_project_automation.issue_creator import CreatedIssue, IssueCreator
+
+
+class _FakeREST:
+    def __init__(self, issues: list[dict[str, Any]]) -> None:
+        self.issues = issues
+        self.since: list[str | None] = []
+        self.created: list[str] = []
+
+    def list_issues(self, *, owner: str, repo: str, since: str | None = None):
+        self.since.append(since)
+        return [i for i in self.issues if since is None or i["updated_at"] >= since]
+
+    def create_issue(
+        self, *, owner: str, repo: str, title: str, body: str, **extra: Any
+    ) -> dict[str, Any]:
+        self.created.append(title)
+        n = 100 + len(self.created)
+        return {"number": n, "node_id": f"N{n}", "html_url": f"https://x/{n}"}
+
+
+def _issue(number: int, title: str, body: str, updated_at: str) -> dict[str, Any]:
+    return {
+        "number": number,
+        "title": title,
+        "body": body,
+        "node_id": f"N{number}",
+        "html_url": f"https://x/{number}",
+        "updated_at": updated_at,
+    }
+
+
+def test_lookup_ignores_whitespace_and_case(tmp_path):
+    rest = _FakeREST([_issue(1, "Fix  Login", "Body\r\nline  ", "2024-01-01T00:00:00Z")])
+    index = DedupeIndex(tmp_path / "idx.json", owner="o", repo="r")
+    assert index.refresh(rest) == 1  # type: ignore[arg-type]
+    hit = index.lookup("fix login", "Body\nline")
+    assert hit == CreatedIssue(number=1, node_id="N1", html_url="https://x/1", existing=True)
+    assert index.lookup("fix login", "other body") is None
+
+
+def test_refresh_is_incremental_after_save(tmp_path):
+    rest = _FakeREST([_issue(1, "A", "", "2024-01-01T00:00:00Z")])
+    index = DedupeIndex(tmp_path / "idx.json", owner="o", repo="r")
+    index.refresh(rest)  # type: ignore[arg-type]
+    index.save()
+
+    rest.issues.append(_issue(2, "B", "", "2024-02-01T00:00:00Z"))
+    reloaded = DedupeIndex(tmp_path / "idx.json", owner="o", repo="r")
+    reloaded.refresh(rest)  # type: ignore[arg-type]
+    assert rest.since == [None, "2024-01-01T00:00:00Z"]
+    assert len(reloaded) == 2
+
+
+def test_creator_skips_existing_and_indexes_new(tmp_path):
+    rest = _FakeREST([_issue(1, "A", "", "2024-01-01T00:00:00Z")])
+    index = DedupeIndex(None, owner="o", repo="r")
+    index.refresh(rest)  # type: ignore[arg-type]
+    creator = IssueCreator(rest, owner="o", repo="r", quiet=True, dedupe=index)  # type: ignore[arg-type]
+
+    assert creator.create(title="A", body="", execute=True).existing
+    first = creator.create(title="B", body="", execute=True)
+    again = creator.create(title="B", body="", execute=True)
+    assert rest.created == ["B"]
+    assert again.existing and again.number == first.number
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from gh_project_automation import cli
+from gh_project_automation.github_rest import GitHubREST
+from gh_project_automation.graphql_client import GraphQLClient
+from gh_project_automation.issue_creator import IssueCreator
+from gh_project_automation.project_fields import CANONICAL_FIELDS
+from gh_project_automation.transport import HttpTransport
+from gh_project_automation.utils import GraphQLError
+
+
+def _write_issues(path, n: int) -> None:
+    with path.open("w", encoding="utf-8") as f:
+        for i in range(n):
+            row = {"title": f"Issue {i}", "description": f"Body {i}"}
+            row.update({k: f"{canonical} {i % 3}" for k, canonical in CANONICAL_FIELDS.items()})
+            f.write(json.dumps(row) + "\n")
+
+
+def test_execute_creates_issues_and_sets_every_field(fake_github, tmp_path, capsys):
+    issues = tmp_path / "issues.jsonl"
+    _write_issues(issues, 12)
+    metrics_path = tmp_path / "metrics.json"
+    argv = [
+        "--issues", str(issues),
+        "--fields", str(tmp_path / "fields.json"),  # missing: fetched from the fake project
+        "--execute",
+        "--concurrency", "4",
+        "--max-creates-per-minute", "0",
+        "--output", "jsonl",
+        "--metrics-json", str(metrics_path),
+    ]  # fmt: skip
+    assert cli.main(argv) == 0
+
+    assert len(fake_github.issues) == 12
+    assert len(fake_github.items) == 12
+    assert all(len(item["fields"]) == len(CANONICAL_FIELDS) for item in fake_github.items.values())
+    # one aliased mutation per issue, not one per field
+    assert fake_github.calls["BatchUpdateProjectV2ItemFieldValues"] == 12
+
+    events = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    finished = next(e for e in events if e["event"] == "run_finished")
+    assert finished["counts"] == {"created": 12}
+    ops = json.loads(metrics_path.read_text())["operations"]
+    assert ops["create_issue"]["count"] == 12
+    assert ops["update_field"]["count"] == 12
+
+
+def test_create_via_graphql_adds_to_project_in_the_same_request(fake_github, tmp_path):
+    issues = tmp_path / "issues.jsonl"
+    _write_issues(issues, 6)
+    journal = tmp_path / "journal.jsonl"
+    argv = [
+        "--issues", str(issues),
+        "--fields", str(tmp_path / "fields.json"),
+        "--execute",
+        "--create-via", "graphql",
+        "--concurrency", "3",
+        "--max-creates-per-minute", "0",
+        "--journal", str(journal),
+        "--output", "jsonl",
+    ]  # fmt: skip
+    assert cli.main(argv) == 0
+
+    assert len(fake_github.items) == 6
+    assert all(len(item["fields"]) == len(CANONICAL_FIELDS) for item in fake_github.items.values())
+    assert fake_github.calls["CreateIssue"] == 6
+    assert fake_github.calls["RepositoryId"] == 1  # resolved once, then cached
+    assert fake_github.calls["create_issue"] == 0 and fake_github.calls["AddProjectV2Item"] == 0
+    stages = [json.loads(line)["stage"] for line in journal.read_text().splitlines()]
+    assert stages.count("added") == 6  # resumable at the field step
+
+
+def test_create_via_graphql_falls_back_to_rest(fake_github, tmp_path, capsys):
+    # e.g. a token that may create issues but not project items: the field is null, nothing made
+    fake_github.graphql_handlers["CreateIssue"] = lambda variables: (
+        {"createIssue": None},
+        [{"type": "FORBIDDEN", "message": "Resource not accessible by integration"}],
+    )
+    issues = tmp_path / "issues.jsonl"
+    _write_issues(issues, 3)
+    argv = [
+        "--issues", str(issues),
+        "--fields", str(tmp_path / "fields.json"),
+        "--execute",
+        "--create-via", "graphql",
+        "--max-creates-per-minute", "0",
+        "--output", "jsonl",
+    ]  # fmt: skip
+    assert cli.main(argv) == 0
+
+    assert len(fake_github.items) == 3
+    assert fake_github.calls["CreateIssue"] == 1  # only tried once
+    assert fake_github.calls["create_issue"] == 3 and fake_github.calls["AddProjectV2Item"] == 3
+    assert "using REST" in capsys.readouterr().out
+
+
+def test_one_rejected_graphql_create_does_not_switch_the_run_to_rest(fake_github):
+    create = fake_github.graphql_handlers["CreateIssue"]
+
+    def reject_one(variables):
+        if variables["title"] == "bad":
+            return {"createIssue": None}, [{"type": "UNPROCESSABLE", "message": "title invalid"}]
+        return create(variables)
+
+    fake_github.graphql_handlers["CreateIssue"] = reject_one
+    with HttpTransport(token="t", api_base=fake_github.url) as transport:
+        creator = IssueCreator(
+            GitHubREST(transport),
+            owner="octo",
+            repo="demo",
+            quiet=True,
+            gql=GraphQLClient(transport),
+            project_id=fake_github.project_id,
+            via="graphql",
+        )
+        with pytest.raises(GraphQLError, match="title invalid"):
+            creator.create(title="bad", body="", execute=True)
+        created = creator.create(title="good", body="", execute=True)
+
+    assert creator.via == "graphql" and created.item_id is not None
+    assert fake_github.calls["CreateIssue"] == 2 and fake_github.calls["create_issue"] == 0
+    assert len(fake_github.issues) == 1
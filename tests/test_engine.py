@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import io
+import json
+import threading
+import time
+from typing import Any
+
+import pytest
+
+from gh_project_automation.engine import IssuePipeline, run_pipeline
+from gh_project_automation.issue_creator import CreatedIssue, IssueCreator
+from gh_project_automation.journal import RunJournal
+from gh_project_automation.project_fields import CANONICAL_FIELDS, FieldMeta
+from gh_project_automation.project_item_manager import ProjectItemManager
+from gh_project_automation.reporter import JsonLinesReporter
+from gh_project_automation.utils import ApiError
+from gh_project_automation.validator import ValidatedIssue, ValidationPlan
+
+
+class _FakeREST:
+    def __init__(self, fail_title: str | None = None) -> None:
+        self.fail_title = fail_title
+        self.created: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def create_issue(
+        self, *, owner: str, repo: str, title: str, body: str, **extra: Any
+    ) -> dict[str, Any]:
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.01)
+        with self._lock:
+            self.in_flight -= 1
+        if title == self.fail_title:
+            raise ApiError("boom")
+        self.created.append(title)
+        return {"number": 1, "node_id": f"N-{title}", "html_url": f"https://x/{title}"}
+
+
+class _FakeGQL:
+    def query(self, query: str, variables: dict[str, Any] | None = None) -> dict[str, Any]:
+        return {"addProjectV2ItemById": {"item": {"id": f"I-{variables['contentId']}"}}}
+
+    def query_partial(self, query: str, variables: dict[str, Any] | None = None):
+        n = sum(1 for k in (variables or {}) if k.startswith("item"))
+        return {f"f{i}": {"projectV2Item": {"id": "x"}} for i in range(n)}, []
+
+
+def _pipeline(rest: _FakeREST, journal: RunJournal | None = None) -> IssuePipeline:
+    return IssuePipeline(
+        creator=IssueCreator(rest, owner="o", repo="r", quiet=True),  # type: ignore[arg-type]
+        pim=ProjectItemManager(_FakeGQL(), project_id="P", quiet=True),  # type: ignore[arg-type]
+        execute=True,
+        journal=journal,
+    )
+
+
+def _issues(n: int) -> list[ValidatedIssue]:
+    fields_meta = {c: FieldMeta(id=f"F-{c}", options={"v": "O"}) for c in CANONICAL_FIELDS.values()}
+    rows = [
+        {"title": f"t{i}", "description": "", **{k: "v" for k in CANONICAL_FIELDS}}
+        for i in range(n)
+    ]
+    return ValidationPlan(fields_meta).validate_all(rows).issues
+
+
+def test_concurrent_run_is_bounded_and_ordered():
+    rest = _FakeREST()
+    results = run_pipeline(_pipeline(rest), iter(_issues(12)), concurrency=4)
+    assert [r.index for r in results] == list(range(1, 13))
+    assert 1 < rest.max_in_flight <= 4
+
+
+def test_concurrent_run_stops_on_first_failure():
+    rest = _FakeREST(fail_title="t2")
+    with pytest.raises(ApiError):
+        run_pipeline(_pipeline(rest), iter(_issues(50)), concurrency=2)
+
+
+def test_resume_skips_recorded_stages(tmp_path):
+    issues = _issues(3)
+    first = _pipeline(_FakeREST())
+    keys = [first.key_for(i) for i in issues]
+    with RunJournal(tmp_path / "run.jsonl") as j:
+        j.record_created(keys[0], CreatedIssue(number=1, node_id="N", html_url="https://x/t0"))
+        j.record_added(keys[0], "ITEM")
+        j.record_fields(keys[0], ["F-Release"])
+        j.record_done(keys[1])
+
+    rest = _FakeREST()
+    with RunJournal(tmp_path / "run.jsonl") as journal:
+        run_pipeline(_pipeline(rest, journal), issues)
+        assert rest.created == ["t2"]
+        assert all(journal.get(k).done for k in keys)  # type: ignore[union-attr]
+
+
+def test_jsonl_reporter_gets_one_event_per_issue_and_a_summary():
+    out = io.StringIO()
+    reporter = JsonLinesReporter(out, buffer_size=1000)
+    run_pipeline(_pipeline(_FakeREST()), iter(_issues(5)), concurrency=2, reporter=reporter)
+    assert out.getvalue() == ""  # still buffered
+    reporter.close()
+    events = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert [e["event"] for e in events] == ["run_started"] + ["issue_done"] * 5 + ["run_finished"]
+    assert events[-1]["counts"] == {"created": 5}
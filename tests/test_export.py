@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import csv
+import json
+
+from gh_project_automation import cli
+from gh_project_automation.export import iter_snapshot
+
+
+def test_export_merges_only_changed_items_into_existing_snapshot(fake_github, tmp_path, capsys):
+    ids = [fake_github.seed_item(f"Item {i}", {"Status": "Status 0"}) for i in range(10)]
+    out = tmp_path / "items.jsonl"
+    argv = [
+        "export",
+        "--fields", str(tmp_path / "fields.json"),
+        "--out", str(out),
+        "--page-size", "4",
+        "--output", "jsonl",
+    ]  # fmt: skip
+    assert cli.main(argv) == 0
+    assert fake_github.calls["ProjectItems"] == 3
+    rows = list(iter_snapshot(out))
+    assert [r["title"] for r in rows] == [f"Item {i}" for i in range(10)]
+    assert rows[0]["fields"] == {"Status": "Status 0"}
+    capsys.readouterr()
+
+    status = fake_github.fields["Status"]
+    fake_github._set_value(ids[3], status.id, status.options["Status 4"])
+    fake_github.remove_item(ids[5])
+    fake_github.seed_item("Item new", {"Status": "Status 1"})
+
+    table = tmp_path / "items.csv"
+    assert cli.main([*argv, "--table", str(table)]) == 0
+    assert fake_github.calls["ProjectItems"] == 3  # no full re-read
+    assert fake_github.calls["ProjectItemStamps"] == 3
+    assert fake_github.calls["ProjectItemsByIds"] == 1
+
+    events = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    done = next(e for e in events if e["event"] == "export_finished")
+    assert (done["full"], done["items"], done["added"], done["updated"], done["removed"]) == (
+        False, 10, 1, 1, 1
+    )  # fmt: skip
+
+    by_title = {r["title"]: r["fields"] for r in iter_snapshot(out)}
+    assert by_title["Item 3"] == {"Status": "Status 4"}
+    assert by_title["Item new"] == {"Status": "Status 1"}
+    assert "Item 5" not in by_title
+
+    with table.open(encoding="utf-8", newline="") as fh:
+        records = list(csv.DictReader(fh))
+    assert len(records) == 10
+    assert {r["title"]: r["Status"] for r in records}["Item 3"] == "Status 4"
+    assert records[0]["Release"] == ""
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from gh_project_automation.github_rest import GitHubREST
+from gh_project_automation.http_cache import HttpCache
+from gh_project_automation.ratelimit import RateBudget
+from gh_project_automation.transport import HttpTransport
+
+
+def test_lru_eviction_keeps_recently_used_entries(tmp_path):
+    cache = HttpCache(tmp_path, max_bytes=700)
+    body = b"x" * 150
+    for n in range(3):
+        cache.put(f"https://api/{n}", {"ETag": f'"{n}"'}, body)
+    assert cache.get("https://api/0") is not None  # now most recently used
+    cache.put("https://api/3", {"ETag": '"3"'}, body)
+
+    assert cache.get("https://api/1") is None
+    assert cache.get("https://api/0").validators == {"If-None-Match": '"0"'}
+    cache.put("https://api/nope", {}, body)  # no validator: not stored
+    assert cache.get("https://api/nope") is None
+    assert len(HttpCache(tmp_path, max_bytes=700)) == 3  # index rebuilt from disk
+
+
+def test_repeated_listing_is_served_from_cache_with_304s(fake_github, tmp_path):
+    for i in range(150):
+        fake_github.seed_item(f"Issue {i}")
+
+    def _list() -> list[int]:
+        with HttpTransport(
+            token="t",
+            api_base=fake_github.url,
+            budget=RateBudget(creates_per_minute=0),
+            cache=HttpCache(tmp_path / "http"),
+        ) as transport:
+            issues = GitHubREST(transport).list_issues(owner="octo", repo="demo")
+            return [i["number"] for i in issues]
+
+    first = _list()
+    used = fake_github._windows["core"].used
+    assert _list() == first and len(first) == 150
+    assert fake_github.calls["not_modified"] == 2  # both pages revalidated, no bodies sent
+    assert fake_github._windows["core"].used == used  # and no quota spent
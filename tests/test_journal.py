@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import pytest
+
+from gh_project_automation.issue_creator import CreatedIssue
+from gh_project_automation.journal import RunJournal, open_journal
+from gh_project_automation.utils import ValidationError
+
+
+def test_journal_round_trip_and_truncated_tail(tmp_path):
+    path = tmp_path / "run.jsonl"
+    with RunJournal(path, fsync_every=2) as j:
+        j.record_created("k1", CreatedIssue(number=7, node_id="N7", html_url="https://x/7"))
+        j.record_added("k1", "ITEM7")
+        j.record_fields("k1", ["F1", "F2"])
+        j.record_created("k2", CreatedIssue(number=8, node_id="N8", html_url="https://x/8"))
+        j.record_done("k2")
+    with path.open("a", encoding="utf-8") as fh:
+        fh.write('{"key": "k1", "stage": "fie')  # crash mid-write
+
+    j = RunJournal(path)
+    e1 = j.get("k1")
+    assert e1 is not None
+    assert e1.created is not None and e1.created.number == 7
+    assert e1.item_id == "ITEM7"
+    assert e1.fields_applied == {"F1", "F2"}
+    assert not e1.done
+    assert j.get("k2").done  # type: ignore[union-attr]
+
+
+def test_records_after_a_truncated_tail_survive_reload(tmp_path):
+    path = tmp_path / "run.jsonl"
+    with RunJournal(path) as j:
+        j.record_created("k1", CreatedIssue(number=7, node_id="N7", html_url="https://x/7"))
+    with path.open("a", encoding="utf-8") as fh:
+        fh.write('{"key": "k1", "stage": "crea')  # crash mid-write
+
+    with RunJournal(path) as j:
+        existing = CreatedIssue(number=8, node_id="N8", html_url="https://x/8", existing=True)
+        j.record_created("k2", existing)
+    j = RunJournal(path)
+    e2 = j.get("k2")
+    assert e2 is not None and e2.created == existing
+    assert j.get("k1") is not None
+    assert all(line.startswith("{") for line in path.read_text(encoding="utf-8").splitlines())
+
+
+def test_open_journal_requires_resume_for_existing_run(tmp_path):
+    path = tmp_path / "run.jsonl"
+    with RunJournal(path) as j:
+        j.record_done("k1")
+    with pytest.raises(ValidationError):
+        open_journal(path, resume=False)
+    assert len(open_journal(path, resume=True)) == 1
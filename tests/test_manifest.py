@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from gh_project_automation import cli
+from gh_project_automation.manifest import load_manifest
+from gh_project_automation.project_fields import CANONICAL_FIELDS
+from gh_project_automation.utils import ValidationError
+
+
+def _write_issues(path, prefix: str, n: int) -> None:
+    with path.open("w", encoding="utf-8") as f:
+        for i in range(n):
+            row = {"title": f"{prefix} {i}", "description": ""}
+            row.update({k: f"{canonical} {i % 3}" for k, canonical in CANONICAL_FIELDS.items()})
+            f.write(json.dumps(row) + "\n")
+
+
+def test_manifest_validation(tmp_path):
+    manifest = tmp_path / "m.json"
+    manifest.write_text(
+        json.dumps(
+            {
+                "defaults": {"project_id": "PVT_1", "fields": "f.json"},
+                "targets": [
+                    {"repo": "octo/api", "issues": "api.jsonl"},
+                    {"repo": "octo/web", "issues": "web.jsonl", "project_id": "PVT_2"},
+                ],
+            }
+        )
+    )
+    api, web = load_manifest(manifest)
+    assert (api.name, api.owner, api.repo, api.project_id) == ("octo/api", "octo", "api", "PVT_1")
+    assert web.project_id == "PVT_2" and web.fields == tmp_path / "f.json"
+
+    manifest.write_text(json.dumps({"targets": [{"repo": "octo", "project_id": "P"}]}))
+    with pytest.raises(ValidationError, match="missing issues, fields"):
+        load_manifest(manifest)
+
+
+def test_manifest_imports_every_target_with_one_metadata_fetch(
+    fake_github, tmp_path, monkeypatch, capsys
+):
+    monkeypatch.delenv("GITHUB_OWNER")
+    monkeypatch.delenv("GITHUB_REPO")
+    monkeypatch.delenv("GITHUB_PROJECT_ID")
+    targets = []
+    for repo in ("api", "web", "docs"):
+        _write_issues(tmp_path / f"{repo}.jsonl", repo, 5)
+        targets.append({"repo": f"octo/{repo}", "issues": f"{repo}.jsonl"})
+    manifest = tmp_path / "manifest.json"
+    manifest.write_text(
+        json.dumps(
+            {
+                "defaults": {"project_id": fake_github.project_id, "fields": "fields.json"},
+                "targets": targets,
+            }
+        )
+    )
+    argv = [
+        "manifest",
+        "--manifest", str(manifest),
+        "--execute",
+        "--concurrency", "2",
+        "--max-creates-per-minute", "0",
+        "--output", "jsonl",
+    ]  # fmt: skip
+    assert cli.main(argv) == 0
+
+    assert len(fake_github.issues) == 15
+    assert {i["html_url"].split("/")[4] for i in fake_github.issues.values()} == {
+        "api", "web", "docs"
+    }  # fmt: skip
+    assert fake_github.calls["ProjectFields"] == 1  # metadata cached per project
+
+    events = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    finished = [e for e in events if e["event"] == "target_finished"]
+    assert sorted(e["target"] for e in finished) == ["octo/api", "octo/docs", "octo/web"]
+    run = next(e for e in events if e["event"] == "run_finished")
+    assert run["counts"] == {"created": 15}
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import json
+
+import requests
+
+from gh_project_automation.github_rest import GitHubREST
+from gh_project_automation.graphql_client import MUTATION_COST_ESTIMATE, GraphQLClient
+from gh_project_automation.metrics import Histogram, Metrics
+from gh_project_automation.project_item_manager import ADD_ITEM_MUTATION
+from gh_project_automation.ratelimit import RateBudget
+from gh_project_automation.transport import HttpTransport
+from gh_project_automation.utils import RetryConfig, retry
+
+
+def _response(
+    status: int, payload: object, headers: dict[str, str] | None = None
+) -> requests.Response:
+    resp = requests.Response()
+    resp.status_code = status
+    resp.headers.update(headers or {})
+    resp._content = json.dumps(payload).encode()
+    resp.request = requests.Request("POST", "https://api.github.com/x", json={"a": 1}).prepare()
+    return resp
+
+
+def test_histogram_quantiles_stay_within_observed_range():
+    h = Histogram()
+    for v in [0.01] * 90 + [0.4] * 10:
+        h.observe(v)
+    assert h.quantile(0.5) <= 0.05
+    assert 0.25 <= h.quantile(0.95) <= 0.4
+    assert h.summary()["max_s"] == 0.4
+
+
+def test_transport_records_latency_status_and_retries_per_operation(monkeypatch):
+    monkeypatch.setattr("gh_project_automation.utils.time.sleep", lambda s: None)
+    metrics = Metrics()
+    events: list[str] = []
+    metrics.add_hook(lambda event, data: events.append(f"{event}:{data.get('op')}"))
+    transport = HttpTransport(token="t", metrics=metrics, budget=RateBudget(creates_per_minute=0))
+    throttled = _response(429, {}, {"Retry-After": "0"})
+    replies = iter([throttled, _response(201, {"number": 1})])
+    transport.session.request = lambda *a, **kw: next(replies)  # type: ignore[method-assign]
+
+    assert GitHubREST(transport).create_issue(owner="o", repo="r", title="t", body="b") == {
+        "number": 1
+    }
+
+    op = metrics.summary()["operations"]["create_issue"]
+    assert op["count"] == 2
+    assert op["status"] == {"429": 1, "201": 1}
+    assert op["retries"] == 1
+    assert op["bytes_sent"] > 0
+    assert events == ["call:create_issue", "retry:create_issue", "call:create_issue"]
+
+    prom = metrics.to_prometheus()
+    assert 'gh_project_automation_requests_total{op="create_issue",status="201"} 1' in prom
+    assert 'request_duration_seconds_bucket{op="create_issue",le="+Inf"} 2' in prom
+
+
+def test_mutation_cost_is_estimated_and_query_cost_measured():
+    metrics = Metrics()
+    transport = HttpTransport(token="t", metrics=metrics)
+    replies = iter(
+        [
+            _response(200, {"data": {"addProjectV2ItemById": {"item": {"id": "PVTI_1"}}}}),
+            _response(200, {"data": {"node": None, "rateLimit": {"cost": 2, "remaining": 9}}}),
+        ]
+    )
+    transport.session.request = lambda *a, **kw: next(replies)  # type: ignore[method-assign]
+    gql = GraphQLClient(transport)
+    gql.query(ADD_ITEM_MUTATION, {"projectId": "P", "contentId": "I_1"})
+    gql.query("query ProjectFields { rateLimit { cost remaining } }")
+
+    ops = metrics.summary()["operations"]
+    assert ops["add_item"]["graphql_cost"] == MUTATION_COST_ESTIMATE
+    assert ops["add_item"]["graphql_cost_estimated"] == MUTATION_COST_ESTIMATE
+    assert (ops["fetch_fields"]["graphql_cost"], ops["fetch_fields"]["graphql_cost_estimated"]) == (
+        2,
+        0,
+    )
+    assert 'graphql_cost_estimated_total{op="add_item"} 5' in metrics.to_prometheus()
+
+
+def test_retry_reports_each_backoff():
+    seen: list[tuple[int, float]] = []
+    calls = iter([ValueError(), ValueError(), "ok"])
+
+    def _fn() -> str:
+        v = next(calls)
+        if isinstance(v, Exception):
+            raise v
+        return v
+
+    cfg = RetryConfig(base_delay_s=0)
+    out = retry(_fn, retry_on=(ValueError,), cfg=cfg, on_retry=lambda a, e, d: seen.append((a, d)))
+    assert out == "ok"
+    assert seen == [(1, 0), (2, 0)]
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+from gh_project_automation.project_fields import (
+    DATE,
+    ITERATION,
+    NUMBER,
+    FieldMeta,
+    FieldsCache,
+    fetch_fields_metadata,
+    load_fields_json,
+)
+from gh_project_automation.validator import ValidationPlan, validate_with_cache
+
+
+def _page(nodes: list[dict[str, Any]], cursor: str | None) -> dict[str, Any]:
+    return {
+        "node": {
+            "fields": {
+                "pageInfo": {"hasNextPage": cursor is not None, "endCursor": cursor},
+                "nodes": nodes,
+            }
+        }
+    }
+
+
+def _select(name: str, options: dict[str, str]) -> dict[str, Any]:
+    return {
+        "id": f"F_{name}",
+        "name": name,
+        "dataType": "SINGLE_SELECT",
+        "options": [{"id": v, "name": k} for k, v in options.items()],
+    }
+
+
+class _FakeGQL:
+    def __init__(self, pages: list[dict[str, Any]]) -> None:
+        self.pages = pages
+        self.calls: list[dict[str, Any]] = []
+
+    def query(self, query: str, variables: dict[str, Any] | None = None) -> dict[str, Any]:
+        self.calls.append(variables or {})
+        return self.pages[len(self.calls) - 1]
+
+
+def test_fetch_follows_pagination_and_field_types():
+    gql = _FakeGQL(
+        [
+            _page(
+                [
+                    _select("Status", {"Backlog": "O1"}),
+                    {"id": "T", "name": "Title", "dataType": "TITLE"},
+                ],
+                "c1",
+            ),
+            _page(
+                [
+                    {"id": "F_Points", "name": "Points", "dataType": "NUMBER"},
+                    {
+                        "id": "F_Sprint",
+                        "name": "Sprint",
+                        "dataType": "ITERATION",
+                        "configuration": {
+                            "iterations": [{"id": "IT2", "title": "Sprint 2"}],
+                            "completedIterations": [{"id": "IT1", "title": "Sprint 1"}],
+                        },
+                    },
+                    {},  # fields of unsupported kinds come back as empty objects
+                ],
+                None,
+            ),
+        ]
+    )
+    fields = fetch_fields_metadata(gql, "P1")  # type: ignore[arg-type]
+    assert [c["after"] for c in gql.calls] == [None, "c1"]
+    assert set(fields) == {"Status", "Points", "Sprint"}
+    assert fields["Points"].data_type == NUMBER
+    assert fields["Sprint"].data_type == ITERATION
+    assert fields["Sprint"].options == {"Sprint 1": "IT1", "Sprint 2": "IT2"}
+
+
+def _all_fields(status_options: dict[str, str]) -> list[dict[str, Any]]:
+    names = ["Release", "Phase", "Area", "Priority", "Risk", "Type", "Effort"]
+    return [_select(n, {"x": f"O_{n}"}) for n in names] + [_select("Status", status_options)]
+
+
+def _row(status: str) -> dict[str, Any]:
+    keys = ["release", "phase", "area", "priority", "risk", "type", "effort"]
+    return {"title": "T", "description": "", "status": status, **{k: "x" for k in keys}}
+
+
+def test_cache_refreshes_once_on_unknown_option(tmp_path):
+    path = tmp_path / "fields.json"
+    gql = _FakeGQL([_page(_all_fields({"Backlog": "O1"}), None)])
+    FieldsCache(path, gql=gql, project_id="P1").refresh()  # type: ignore[arg-type]
+    assert json.loads(path.read_text())["_meta"]["fingerprint"]
+    assert set(load_fields_json(path)) >= {"Status", "Release"}
+
+    # An option was added in the UI after the cache was written.
+    gql = _FakeGQL([_page(_all_fields({"Backlog": "O1", "Ready": "O2"}), None)])
+    cache = FieldsCache(path, gql=gql, project_id="P1")  # type: ignore[arg-type]
+    assert not cache.ensure_fresh()  # no TTL: not stale
+    _, report = validate_with_cache([_row("Ready"), _row("Nope")], cache)
+    assert len(gql.calls) == 1
+    assert [i.fields["status"] for i in report.issues] == ["Ready"]
+    assert len(report.errors) == 1
+    assert not cache.can_refresh  # at most once per run
+
+
+def test_cache_written_for_another_project_is_refetched(tmp_path):
+    path = tmp_path / "fields.json"
+    gql = _FakeGQL([_page(_all_fields({"Backlog": "O1"}), None)])
+    FieldsCache(path, gql=gql, project_id="P1").refresh()  # type: ignore[arg-type]
+
+    gql = _FakeGQL([_page(_all_fields({"Backlog": "O9"}), None)])
+    assert not FieldsCache(path, gql=gql, project_id="P1").is_stale()  # type: ignore[arg-type]
+    cache = FieldsCache(path, gql=gql, project_id="P2")  # type: ignore[arg-type]
+    assert cache.ensure_fresh() and len(gql.calls) == 1
+    assert cache.fields["Status"].options == {"Backlog": "O9"}
+    assert json.loads(path.read_text())["_meta"]["project_id"] == "P2"
+
+
+def test_plan_validates_number_and_date_fields():
+    names = ["Release", "Phase", "Area", "Priority", "Risk", "Type", "Status"]
+    meta = {n: FieldMeta(id=f"F_{n}", options={"x": "O"}) for n in names}
+    meta["Effort"] = FieldMeta(id="F_Effort", data_type=NUMBER)
+    plan = ValidationPlan(meta)
+    row = {**_row("x"), "effort": "2.5"}
+    issue = plan.validate_all([row]).issues[0]
+    assert issue.resolved[-2].value == 2.5
+
+    assert not plan.validate_all([{**row, "effort": "lots"}]).ok
+    meta["Effort"] = FieldMeta(id="F_Effort", data_type=DATE)
+    assert ValidationPlan(meta).validate_all([{**row, "effort": "2024-02-30"}]).errors
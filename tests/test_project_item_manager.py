@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from typing import Any
+
+from gh_project_automation.project_item_manager import (
+    FieldUpdate,
+    ProjectItemManager,
+    build_batch_update_mutation,
+)
+
+
+class _FakeGQL:
+    def __init__(self, fail_aliases: set[str] | None = None) -> None:
+        self.calls: list[tuple[str, dict[str, Any]]] = []
+        self.fail_aliases = fail_aliases or set()
+
+    def query_partial(self, query: str, variables: dict[str, Any] | None = None):
+        variables = variables or {}
+        self.calls.append((query, variables))
+        n = sum(1 for k in variables if k.startswith("item"))
+        data: dict[str, Any] = {}
+        errors: list[dict[str, Any]] = []
+        for i in range(n):
+            alias = f"f{i}"
+            if alias in self.fail_aliases:
+                data[alias] = None
+                errors.append({"path": [alias], "message": "bad option"})
+            else:
+                data[alias] = {"projectV2Item": {"id": variables[f"item{i}"]}}
+        return data, errors
+
+
+def _updates(n: int, item_id: str = "I1") -> list[FieldUpdate]:
+    return [
+        FieldUpdate(item_id=item_id, field_id=f"F{i}", value=f"O{i}", field_name=f"Field{i}")
+        for i in range(n)
+    ]
+
+
+def test_build_batch_update_mutation_aliases_every_update():
+    doc, variables = build_batch_update_mutation(_updates(3))
+    assert doc.count("updateProjectV2ItemFieldValue") == 3
+    for i in range(3):
+        assert f"f{i}: updateProjectV2ItemFieldValue" in doc
+        assert variables[f"field{i}"] == f"F{i}"
+        assert variables[f"value{i}"] == f"O{i}"
+
+
+def test_set_fields_batch_one_request_per_chunk():
+    gql = _FakeGQL()
+    pim = ProjectItemManager(gql, project_id="P1", max_batch_size=5)  # type: ignore[arg-type]
+    results = pim.set_fields_batch(_updates(8) + _updates(4, item_id="I2"), execute=True)
+    assert len(gql.calls) == 3
+    assert all(r.ok for r in results)
+    assert all(v["projectId"] == "P1" for _, v in gql.calls)
+
+
+def test_set_fields_batch_reports_partial_failures_per_field():
+    gql = _FakeGQL(fail_aliases={"f2"})
+    pim = ProjectItemManager(gql, project_id="P1")  # type: ignore[arg-type]
+    results = pim.set_fields_batch(_updates(4), execute=True)
+    assert [r.ok for r in results] == [True, True, False, True]
+    assert results[2].update.field_name == "Field2"
+    assert results[2].error == "bad option"
+
+
+def test_set_fields_batch_dry_run_makes_no_calls():
+    gql = _FakeGQL()
+    pim = ProjectItemManager(gql, project_id="P1")  # type: ignore[arg-type]
+    results = pim.set_fields_batch(_updates(2), execute=False)
+    assert gql.calls == []
+    assert all(r.ok for r in results)
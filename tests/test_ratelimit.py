@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from gh_project_automation.ratelimit import RateBudget, TokenPool
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+        self.slept: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, s: float) -> None:
+        self.slept.append(s)
+        self.now += s
+
+
+def _headers(*, remaining: int, reset: int) -> dict[str, str]:
+    return {
+        "X-RateLimit-Limit": "5000",
+        "X-RateLimit-Remaining": str(remaining),
+        "X-RateLimit-Reset": str(reset),
+    }
+
+
+def _budget(clock: _Clock, **kw) -> RateBudget:
+    return RateBudget(clock=clock, sleep=clock.sleep, **kw)
+
+
+def test_no_wait_with_healthy_budget():
+    clock = _Clock()
+    b = _budget(clock)
+    b.observe_headers(_headers(remaining=4000, reset=4600), status=200, resource="core")
+    assert b.before_request(resource="core") == 0
+    assert b.snapshot("core").remaining == 3999
+
+
+def test_waits_for_reset_when_budget_exhausted():
+    clock = _Clock()
+    b = _budget(clock, reserve=10)
+    b.observe_headers(_headers(remaining=5, reset=1100), status=200, resource="core")
+    assert b.before_request(resource="core") == 100.0
+
+
+def test_retry_after_pauses_every_resource():
+    clock = _Clock()
+    b = _budget(clock)
+    b.observe_headers(
+        {"Retry-After": "30"}, status=403, resource="core", body="secondary rate limit"
+    )
+    assert b.before_request(resource="graphql") == 30.0
+
+
+def test_plain_403_does_not_pause():
+    clock = _Clock()
+    b = _budget(clock)
+    b.observe_headers({}, status=403, resource="core", body="Resource not accessible")
+    assert b.before_request(resource="core") == 0
+
+
+def test_content_creation_is_spaced():
+    clock = _Clock()
+    b = _budget(clock, creates_per_minute=60)
+    assert b.before_request(resource="core", creates_content=True) == 0
+    assert b.before_request(resource="core", creates_content=True) == 1.0
+
+
+def test_token_pool_spreads_load_and_parks_exhausted_tokens():
+    clock = _Clock()
+    budgets = [_budget(clock, reserve=10, creates_per_minute=60) for _ in range(3)]
+    pool = TokenPool(["a", "b", "c"], budgets=budgets)
+    for b, remaining in zip(budgets, (3000, 4000, 5), strict=True):
+        b.observe_headers(_headers(remaining=remaining, reset=4600), status=200, resource="core")
+
+    picked = [pool.acquire(resource="core")[0] for _ in range(4)]
+    assert picked == [1, 1, 1, 1]  # most headroom first; token 3 is below its reserve
+    assert clock.slept == []
+
+    # creates are paced per token, so a second create goes to another token instead of waiting
+    assert [pool.acquire(resource="core", creates_content=True) for _ in range(2)] == [
+        (1, 0.0), (0, 0.0)
+    ]  # fmt: skip
+
+    budgets[1].observe_headers({"Retry-After": "60"}, status=403, resource="core")
+    assert pool.acquire(resource="core")[0] == 0
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import json
+
+from gh_project_automation import cli
+from gh_project_automation.project_fields import CANONICAL_FIELDS
+
+
+def _values(i: int) -> dict[str, str]:
+    return {canonical: f"{canonical} {i % 3}" for canonical in CANONICAL_FIELDS.values()}
+
+
+def test_reconcile_sends_only_the_values_that_differ(fake_github, tmp_path, capsys):
+    for i in range(40):
+        fake_github.seed_item(f"Issue {i}", _values(i))
+    issues = tmp_path / "issues.jsonl"
+    with issues.open("w", encoding="utf-8") as f:
+        for i in range(41):
+            row = {"title": f"issue  {i}" if i == 7 else f"Issue {i}", "description": ""}
+            row.update({k: f"{canonical} {i % 3}" for k, canonical in CANONICAL_FIELDS.items()})
+            if i in (3, 17, 29):
+                row["status"] = "Status 4"
+            f.write(json.dumps(row) + "\n")
+    argv = [
+        "reconcile",
+        "--issues", str(issues),
+        "--fields", str(tmp_path / "fields.json"),
+        "--execute",
+        "--output", "jsonl",
+    ]  # fmt: skip
+    assert cli.main(argv) == 0
+
+    assert fake_github.calls["BatchUpdateProjectV2ItemFieldValues"] == 1
+    status = fake_github.fields["Status"]
+    changed = [
+        i for i, item in enumerate(fake_github.items.values())
+        if item["fields"][status.id] == status.options["Status 4"]
+    ]  # fmt: skip
+    assert changed == [3, 17, 29]
+    assert len(fake_github.issues) == 40  # reconcile never creates issues
+
+    events = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    done = next(e for e in events if e["event"] == "reconcile_finished")
+    assert (done["matched"], done["unchanged"], done["updates_ok"], done["missing"]) == (
+        40, 37, 3, 1
+    )  # fmt: skip
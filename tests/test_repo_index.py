@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import json
+
+from gh_project_automation import cli
+from gh_project_automation.fake_server import FakeGitHub, synthetic_fields
+from gh_project_automation.graphql_client import GraphQLClient
+from gh_project_automation.project_fields import CANONICAL_FIELDS
+from gh_project_automation.repo_index import RepoIndex, RepoRef
+from gh_project_automation.transport import HttpTransport
+from gh_project_automation.validator import ValidationPlan
+
+
+def _row(i: int, **extra: object) -> dict[str, object]:
+    row: dict[str, object] = {"title": f"Issue {i}", "description": ""}
+    row.update({k: f"{canonical} {i % 3}" for k, canonical in CANONICAL_FIELDS.items()})
+    row.update(extra)
+    return row
+
+
+def test_index_pages_each_connection_and_is_cached_per_repo(tmp_path):
+    labels = tuple(f"label {i}" for i in range(150))
+    path = tmp_path / "repo_index.json"
+    with FakeGitHub(labels=labels) as server, HttpTransport(
+        token="t", api_base=server.url
+    ) as transport:
+        index = RepoIndex(path, owner="octo", repo="demo", gql=GraphQLClient(transport))
+        assert index.try_refresh()
+        assert server.calls["RepoIndex"] == 2  # the second page asks for labels only
+    assert len(index) == 150 + 2 + 2
+
+    cached = RepoIndex(path, owner="octo", repo="demo")
+    assert cached.lookup("labels", " LABEL 149") == RepoRef("LA_149", "label 149")
+    assert cached.lookup("milestones", "v2.0") == RepoRef("MI_2", "v2.0", number=2)
+    assert cached.lookup("assignees", "OctoCat") == RepoRef("U_octocat", "octocat")
+    assert len(RepoIndex(path, owner="octo", repo="other")) == 0
+
+
+def test_plan_resolves_names_only_with_an_index(tmp_path):
+    path = tmp_path / "repo_index.json"
+    saved = {
+        "version": 1,
+        "repo": "octo/demo",
+        "labels": [{"id": "LA_0", "name": "bug"}],
+        "milestones": [{"id": "MI_1", "name": "v1.0", "number": 1}],
+        "assignees": [{"id": "U_octocat", "name": "octocat"}],
+    }
+    path.write_text(json.dumps(saved), encoding="utf-8")
+    index = RepoIndex(path, owner="octo", repo="demo")
+    rows = [
+        _row(0, labels=["Bug", "bug"], milestone="v1.0", assignees="octocat"),
+        _row(1, labels=["nope"], assignees=[1]),
+        _row(2, milestone=["v1.0"]),
+    ]
+    report = ValidationPlan(synthetic_fields(), repo_index=index).validate_all(rows)
+    first = report.issues[0]
+    assert first.labels == (RepoRef("LA_0", "bug"),)
+    assert first.milestone is not None and first.milestone.number == 1
+    assert [a.name for a in first.assignees] == ["octocat"]
+    assert report.errors == [
+        "Unknown label 'nope' in issue #2 (not in octo/demo)",
+        "Issue #2 assignees must be a list of names",
+        "Issue #3 milestone must be a milestone title",
+    ]
+    assert report.unknown_names
+
+    unchecked = ValidationPlan(synthetic_fields()).validate_all(rows[1:])
+    assert unchecked.ok and unchecked.issues[0].labels == ()
+
+
+def test_import_sends_labels_milestone_and_assignees_in_the_create(fake_github, tmp_path):
+    issues = tmp_path / "issues.jsonl"
+    with issues.open("w", encoding="utf-8") as f:
+        for i in range(6):
+            row = _row(i, labels=["bug", "Enhancement"], milestone="v2.0", assignees=["hubot"])
+            f.write(json.dumps(row) + "\n")
+    fields, index = str(tmp_path / "fields.json"), tmp_path / "repo_index.json"
+    for via in ("rest", "graphql"):
+        argv = [
+            "--issues", str(issues),
+            "--fields", fields,
+            "--repo-index", str(index),
+            "--execute",
+            "--create-via", via,
+            "--concurrency", "3",
+            "--max-creates-per-minute", "0",
+            "--output", "jsonl",
+        ]  # fmt: skip
+        assert cli.main(argv) == 0
+
+    assert len(fake_github.issues) == 12
+    for issue in fake_github.issues.values():
+        assert [label["name"] for label in issue["labels"]] == ["bug", "enhancement"]
+        assert issue["milestone"] == {"number": 2, "title": "v2.0"}
+        assert [a["login"] for a in issue["assignees"]] == ["hubot"]
+    # fetched on the first run only, then read from --repo-index; nothing extra per issue
+    assert fake_github.calls["RepoIndex"] == 1
+    assert fake_github.calls["create_issue"] + fake_github.calls["CreateIssue"] == 12
+
+    bad = tmp_path / "bad.jsonl"
+    bad.write_text(json.dumps(_row(0, labels=["wontfix"])) + "\n", encoding="utf-8")
+    offline = ["validate", str(issues), str(bad), "--fields", fields, "--repo-index", str(index)]
+    assert cli.main(offline) == 1
+    assert cli.main(offline[:2] + offline[3:]) == 0
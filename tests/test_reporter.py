@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import io
+import json
+
+from gh_project_automation.reporter import JsonLinesReporter, field_value_counts
+from gh_project_automation.validator import ValidatedIssue
+
+
+def test_jsonl_reporter_flushes_in_batches_and_drops_log_lines():
+    out = io.StringIO()
+    reporter = JsonLinesReporter(out, buffer_size=2)
+    reporter.log("[bold]per-step noise[/bold]")
+    reporter.event("issue_done", index=1)
+    assert out.getvalue() == ""
+    reporter.message("[green]All done.[/green]")
+    lines = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert [e["event"] for e in lines] == ["issue_done", "message"]
+    assert lines[1]["text"] == "All done."
+
+
+def test_field_value_counts_orders_by_frequency():
+    issues = [
+        ValidatedIssue(title=f"t{i}", description="", fields={"area": a})
+        for i, a in enumerate(["api", "ui", "api"])
+    ]
+    assert field_value_counts(issues) == {"area": {"api": 2, "ui": 1}}
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import pytest
+import requests
+from urllib3.exceptions import MaxRetryError, NewConnectionError
+
+from gh_project_automation.github_rest import GitHubREST
+from gh_project_automation.graphql_client import GraphQLClient
+from gh_project_automation.ratelimit import RateBudget
+from gh_project_automation.retry_policy import CircuitBreaker, classify_error
+from gh_project_automation.transport import HttpTransport
+from gh_project_automation.utils import (
+    FATAL,
+    RATE_LIMITED,
+    RETRYABLE,
+    ApiError,
+    CircuitOpenError,
+    GraphQLError,
+)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def test_failures_are_classified_by_what_a_retry_could_change():
+    refused = requests.ConnectionError(
+        MaxRetryError(None, "/", NewConnectionError(None, "refused"))
+    )
+    cases = [
+        (ApiError("x", status=404), FATAL, FATAL),
+        (ApiError("x", status=422), FATAL, FATAL),
+        (ApiError("x", status=502), RETRYABLE, FATAL),
+        (ApiError("x", status=403, rate_limited=True), RATE_LIMITED, RATE_LIMITED),
+        (GraphQLError([{"type": "NOT_FOUND", "message": "no"}]), FATAL, FATAL),
+        (GraphQLError([{"type": "RATE_LIMITED", "message": "slow"}]), RATE_LIMITED, RATE_LIMITED),
+        (GraphQLError([{"message": "Something went wrong while executing your query."}]),
+         RETRYABLE, FATAL),
+        (requests.ConnectTimeout(), RETRYABLE, RETRYABLE),
+        (refused, RETRYABLE, RETRYABLE),
+        (requests.ReadTimeout(), RETRYABLE, FATAL),
+        (CircuitOpenError("down"), FATAL, FATAL),
+    ]  # fmt: skip
+    for error, idempotent, create in cases:
+        assert classify_error(error) == idempotent, error
+        assert classify_error(error, idempotent=False) == create, error
+
+
+def test_create_is_not_repeated_after_a_5xx(monkeypatch):
+    monkeypatch.setattr("gh_project_automation.utils.time.sleep", lambda s: None)
+    transport = HttpTransport(token="t", budget=RateBudget(creates_per_minute=0))
+    sent: list[str] = []
+
+    def _request(method: str, url: str, **kwargs: object) -> requests.Response:
+        sent.append(method)
+        resp = requests.Response()
+        resp.status_code = 502
+        resp._content = b"{}"
+        resp.request = requests.Request(method, url, json={}).prepare()
+        return resp
+
+    transport.session.request = _request  # type: ignore[method-assign]
+    with pytest.raises(ApiError, match="may have been carried out"):
+        GitHubREST(transport).create_issue(owner="o", repo="r", title="t", body="b")
+    assert sent == ["POST"]
+
+    sent.clear()
+    with pytest.raises(ApiError, match="HTTP 502"):
+        list(GitHubREST(transport).list_issues(owner="o", repo="r"))
+    assert sent == ["GET"] * 4
+
+
+def test_graphql_errors_fail_without_backoff(fake_github):
+    transport = HttpTransport(token="t", api_base=fake_github.url)
+    with pytest.raises(GraphQLError, match="Unsupported operation"):
+        GraphQLClient(transport).query("query Nope { viewer { login } }")
+    assert fake_github.calls["Nope"] == 1
+    assert transport.metrics.summary()["operations"]["Nope"]["retries"] == 0
+
+
+def test_circuit_breaker_pauses_probes_and_gives_up():
+    clock = _Clock()
+    breaker = CircuitBreaker(
+        failure_threshold=2, open_s=10, max_trips=3, clock=clock, sleep=clock.sleep
+    )
+    breaker.record(ok=False)
+    breaker.record(ok=True)  # not consecutive
+    breaker.record(ok=False)
+    assert breaker.before_request() is False
+    breaker.record(ok=False)
+    assert breaker.state == "open"
+
+    assert breaker.before_request() is True  # waited out the pause; this request probes
+    assert clock.now == 10
+    breaker.record(ok=False, probe=True)
+    assert breaker.before_request() is True and clock.now == 30  # twice as long
+    breaker.record(ok=True, probe=True)
+    assert breaker.state == "closed"
+    assert breaker.summary() == {"state": "closed", "opened": 2, "paused_s": 30.0}
+
+    for _ in range(2):
+        breaker.record(ok=False)
+    breaker.before_request()
+    breaker.record(ok=False, probe=True)
+    breaker.before_request()
+    breaker.record(ok=False, probe=True)  # third opening in a row
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
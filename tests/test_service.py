@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import io
+import json
+import threading
+
+import requests
+
+from gh_project_automation import cli
+from gh_project_automation.fake_server import synthetic_fields
+from gh_project_automation.github_rest import GitHubREST
+from gh_project_automation.graphql_client import GraphQLClient
+from gh_project_automation.project_fields import CANONICAL_FIELDS, FieldsCache, fields_to_json
+from gh_project_automation.reporter import JsonLinesReporter
+from gh_project_automation.service import IssueService, make_http_server, serve
+from gh_project_automation.transport import HttpTransport
+
+
+def _rows(start: int, n: int) -> list[dict[str, str]]:
+    rows = []
+    for i in range(start, start + n):
+        row = {"title": f"Issue {i}", "description": ""}
+        row.update({k: f"{canonical} {i % 3}" for k, canonical in CANONICAL_FIELDS.items()})
+        rows.append(row)
+    return rows
+
+
+def _events(path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_spool_batches_move_to_done_or_failed(fake_github, tmp_path):
+    spool = tmp_path / "spool"
+    spool.mkdir()
+    (spool / "a.json").write_text(json.dumps(_rows(0, 3)), encoding="utf-8")
+    (spool / "b.jsonl").write_text(
+        "".join(json.dumps(r) + "\n" for r in _rows(3, 2)), encoding="utf-8"
+    )
+    (spool / "b.json").write_text(json.dumps(_rows(5, 1)), encoding="utf-8")  # same stem as b.jsonl
+    (spool / "c.json").write_text(json.dumps([{"title": ""}]), encoding="utf-8")
+    (spool / "d.json.tmp").write_text("[]", encoding="utf-8")  # still being written
+
+    fields = str(tmp_path / "fields.json")
+    argv = ["serve", "--spool", str(spool), "--once", "--execute", "--fields", fields]
+    assert cli.main(argv) == 0
+
+    assert len(fake_github.issues) == 6 and len(fake_github.items) == 6
+    assert fake_github.calls["ProjectFields"] == 1
+    done = spool / "done"
+    assert sorted(p.name for p in done.iterdir()) == [
+        "a.json", "a.json.journal.jsonl", "a.json.results.jsonl",
+        "b.json", "b.json.journal.jsonl", "b.json.results.jsonl",
+        "b.jsonl", "b.jsonl.journal.jsonl", "b.jsonl.results.jsonl",
+    ]  # fmt: skip
+    finished = _events(done / "a.json.results.jsonl")[-1]
+    assert finished["event"] == "run_finished" and finished["counts"] == {"created": 3}
+    assert _events(done / "b.json.results.jsonl")[-1]["counts"] == {"created": 1}
+    assert _events(done / "b.jsonl.results.jsonl")[-1]["counts"] == {"created": 2}
+    events = _events(spool / "failed" / "c.json.results.jsonl")
+    assert {e["event"] for e in events} == {"invalid", "batch_failed"}
+    assert (spool / "d.json.tmp").exists()
+    assert not list((spool / "processing").iterdir())
+
+
+def test_http_batches_share_one_warm_session(fake_github, tmp_path):
+    with HttpTransport(token="t", api_base=fake_github.url) as transport:
+        gql = GraphQLClient(transport)
+        cache = FieldsCache(tmp_path / "fields.json", gql=gql, project_id=fake_github.project_id)
+        service = IssueService(
+            rest=GitHubREST(transport),
+            gql=gql,
+            fields_cache=cache,
+            owner="octo",
+            repo="demo",
+            project_id=fake_github.project_id,
+            execute=True,
+            concurrency=2,
+            metrics=transport.metrics,
+            reporter=JsonLinesReporter(io.StringIO()),
+        )
+        server = make_http_server(service, "127.0.0.1", 0)
+        url = f"http://127.0.0.1:{server.server_address[1]}"
+        stop = threading.Event()
+        thread = threading.Thread(
+            target=serve, args=(service,), kwargs={"server": server, "stop": stop}
+        )
+        thread.start()
+        try:
+            for start in (0, 4):
+                resp = requests.post(f"{url}/batches", json=_rows(start, 4), timeout=30)
+                assert resp.status_code == 200
+                events = [json.loads(line) for line in resp.text.splitlines()]
+                assert events[-1]["event"] == "run_finished"
+                assert events[-1]["counts"] == {"created": 4}
+            assert requests.post(f"{url}/batches", data="{", timeout=30).status_code == 400
+            health = requests.get(f"{url}/health", timeout=30).json()
+            assert health["batches"] == 2 and health["counts"] == {"created": 8}
+            assert "gh_" in requests.get(f"{url}/metrics", timeout=30).text
+        finally:
+            stop.set()
+            thread.join(timeout=30)
+
+    assert len(fake_github.issues) == 8 and len(fake_github.items) == 8
+    assert fake_github.calls["ProjectFields"] == 1
+
+
+def test_failed_refreshes_of_a_hand_written_cache_are_rate_limited(fake_github, tmp_path):
+    # no _meta.fetched_at, and the project cannot be read: the cache never learns a fetch time
+    path = tmp_path / "fields.json"
+    path.write_text(json.dumps(fields_to_json(synthetic_fields())), encoding="utf-8")
+    fake_github.graphql_handlers["ProjectFields"] = lambda variables: (
+        {"node": None},
+        [{"type": "FORBIDDEN", "message": "Resource not accessible by integration"}],
+    )
+    with HttpTransport(token="t", api_base=fake_github.url) as transport:
+        gql = GraphQLClient(transport)
+        service = IssueService(
+            rest=GitHubREST(transport),
+            gql=gql,
+            fields_cache=FieldsCache(path, gql=gql, project_id=fake_github.project_id),
+            owner="octo",
+            repo="demo",
+            project_id=fake_github.project_id,
+            execute=True,
+        )
+        unknown = [{**_rows(0, 1)[0], "status": "Nope"}]
+        for _ in range(3):
+            assert not service.validate(unknown).ok
+    assert fake_github.calls["ProjectFields"] == 1
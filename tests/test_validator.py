@@ -1,10 +1,19 @@
 from __future__ import annotations
 
+import json
+import subprocess
+import sys
+
 import pytest
 
-from gh_project_automation.project_fields import FieldMeta
-from gh_project_automation.validator import validate_issues
+from gh_project_automation.project_fields import CANONICAL_FIELDS, FieldMeta, fields_to_json
 from gh_project_automation.utils import ValidationError
+from gh_project_automation.validator import (
+    ValidationPlan,
+    iter_issues,
+    iter_validated,
+    validate_issues,
+)
 
 
 def _fields_meta() -> dict[str, FieldMeta]:
@@ -64,3 +73,92 @@ def test_invalid_option_fails():
     }]
     with pytest.raises(ValidationError):
         validate_issues(issues, fields_meta=_fields_meta())
+
+
+def _ok_issue(title: str) -> dict:
+    return {
+        "title": title,
+        "description": "Body",
+        "status": "Backlog",
+        "release": "MVP",
+        "phase": "P1 — Scaffolding & DX",
+        "area": "API (FastAPI)",
+        "priority": "P0 — Must Ship",
+        "risk": "Low",
+        "type": "Feature",
+        "effort": "M — 2–3 days",
+    }
+
+
+def test_iter_issues_reads_array_and_json_lines(tmp_path, monkeypatch):
+    import gh_project_automation.validator as validator
+
+    monkeypatch.setattr(validator, "_CHUNK_SIZE", 16)  # force many partial reads
+    rows = [_ok_issue(f"Issue {i}") for i in range(20)]
+    array = tmp_path / "issues.json"
+    array.write_text(json.dumps(rows, indent=2, ensure_ascii=False), encoding="utf-8")
+    lines = tmp_path / "issues.jsonl"
+    lines.write_text("\n".join(json.dumps(r) for r in rows) + "\n", encoding="utf-8")
+
+    assert list(iter_issues(array)) == rows
+    assert list(iter_issues(lines)) == rows
+
+
+def test_iter_validated_is_lazy():
+    rows = [_ok_issue("A"), {"title": "broken"}]
+    it = iter_validated(rows, fields_meta=_fields_meta())
+    assert next(it).title == "A"
+    with pytest.raises(ValidationError):
+        next(it)
+
+
+def test_plan_reports_every_error_with_row_numbers():
+    bad_status = {**_ok_issue("B"), "status": "Nope", "risk": "Huge"}
+    rows = [_ok_issue("A"), bad_status, {"title": ""}, "not an object"]
+    report = ValidationPlan(_fields_meta()).validate_all(rows)
+    assert [i.title for i in report.issues] == ["A"]
+    assert any("'Nope'" in e and "issue #2" in e for e in report.errors)
+    assert any("'Huge'" in e and "issue #2" in e for e in report.errors)
+    assert any(e.startswith("Issue #3 missing required keys") for e in report.errors)
+    assert any(e.startswith("Issue #3 title cannot be empty") for e in report.errors)
+    assert "Issue #4 must be an object" in report.errors
+
+
+def test_plan_resolves_ids_and_loose_matching():
+    row = {**_ok_issue("A"), "status": "  backlog ", "risk": "LOW"}
+    assert not ValidationPlan(_fields_meta()).validate_all([row]).ok
+
+    issue = ValidationPlan(_fields_meta(), loose=True).validate_all([row]).issues[0]
+    by_key = {rf.issue_key: rf for rf in issue.resolved}
+    assert issue.fields["status"] == "Backlog"
+    assert (by_key["status"].field_id, by_key["status"].value) == ("F8", "O8")
+    assert [rf.issue_key for rf in issue.resolved] == list(CANONICAL_FIELDS)
+
+
+def test_validate_command_is_offline_and_reports_pass_fail(tmp_path):
+    fields = tmp_path / "fields.json"
+    fields.write_text(json.dumps(fields_to_json(_fields_meta())))
+    good = {"title": "A", "description": ""}
+    good.update({k: next(iter(_fields_meta()[c].options)) for k, c in CANONICAL_FIELDS.items()})
+    (tmp_path / "good.jsonl").write_text(json.dumps(good) + "\n")
+    (tmp_path / "bad.jsonl").write_text(json.dumps(dict(good, status="Nope")) + "\n")
+
+    script = (
+        "import sys\n"
+        "from gh_project_automation import cli\n"
+        "code = cli.main(sys.argv[1:])\n"
+        "heavy = [m for m in ('requests', 'rich', 'dotenv') if m in sys.modules]\n"
+        "print('heavy:', heavy)\n"
+        "raise SystemExit(code)\n"
+    )
+    argv = [sys.executable, "-c", script, "validate", "--fields", str(fields)]
+    ok = subprocess.run(argv + [str(tmp_path / "good.jsonl")], capture_output=True, text=True)
+    assert ok.returncode == 0, ok.stderr
+    assert "ok   " in ok.stdout and "1 file(s) checked, 0 failed" in ok.stdout
+    assert "heavy: []" in ok.stdout
+
+    both = [str(tmp_path / "good.jsonl"), str(tmp_path / "bad.jsonl")]
+    bad = subprocess.run(argv + both, capture_output=True, text=True)
+    assert bad.returncode == 1
+    assert "FAIL" in bad.stdout and "Invalid value 'Nope'" in bad.stdout
+    assert "2 file(s) checked, 1 failed" in bad.stdout
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import io
+import json
+import subprocess
+import sys
+
+import pytest
+
+from gh_project_automation import cli
+from gh_project_automation.engine import run_pipeline
+from gh_project_automation.github_rest import GitHubREST
+from gh_project_automation.graphql_client import GraphQLClient
+from gh_project_automation.issue_creator import CreatedIssue, IssueCreator
+from gh_project_automation.project_fields import CANONICAL_FIELDS
+from gh_project_automation.project_item_manager import ProjectItemManager
+from gh_project_automation.ratelimit import RateBudget
+from gh_project_automation.reporter import JsonLinesReporter
+from gh_project_automation.transport import HttpTransport
+from gh_project_automation.validator import ResolvedField, ValidatedIssue
+from gh_project_automation.work_queue import LeaseLostError, QueuePipeline, WorkQueue
+
+
+def _issue(i: int) -> ValidatedIssue:
+    rf = ResolvedField("priority", "Priority", "F_1", f"OPT_{i}", f"P{i}")
+    return ValidatedIssue(f"Issue {i}", "same body", {"priority": f"P{i}"}, (rf,))
+
+
+def test_expired_lease_is_reclaimed_and_resumes_at_the_recorded_step(tmp_path):
+    now = [1000.0]
+    db = tmp_path / "queue.db"
+    a = WorkQueue(db, worker_id="a", lease_s=60, clock=lambda: now[0])
+    b = WorkQueue(db, worker_id="b", lease_s=60, clock=lambda: now[0])
+    assert a.load([_issue(0), _issue(1), _issue(0)]) == 3
+    assert a.load([_issue(0), _issue(1)]) == 0  # same keys: nothing new
+
+    (key, issue), *_ = a.claim(2)
+    assert issue == _issue(0)
+    assert [i.title for _, i in b.claim(5)] == ["Issue 0"]  # the repeat; a holds the rest
+    a.record_created(key, CreatedIssue(number=7, node_id="I_7", html_url="u/7"))
+
+    now[0] += 61  # a stops renewing
+    claimed = dict(b.claim(5))
+    assert key in claimed and claimed[key] == _issue(0)
+    entry = b.get(key)
+    assert entry is not None and entry.created.number == 7 and not entry.done
+    with pytest.raises(LeaseLostError):
+        a.record_added(key, "PVTI_7")
+    b.record_added(key, "PVTI_7")
+    b.record_done(key)
+    assert b.stats()["done"] == 1
+
+
+def _worker(queue: WorkQueue, transport: HttpTransport, project_id: str) -> QueuePipeline:
+    pipeline = QueuePipeline(
+        queue=queue,
+        creator=IssueCreator(GitHubREST(transport), owner="octo", repo="demo", quiet=True),
+        pim=ProjectItemManager(GraphQLClient(transport), project_id=project_id, quiet=True),
+        execute=True,
+    )
+    pipeline.attach(transport)
+    return pipeline
+
+
+def test_lease_is_renewed_through_a_pacing_wait_longer_than_the_lease(fake_github, tmp_path):
+    now = [1000.0]
+    db = tmp_path / "queue.db"
+    a = WorkQueue(db, worker_id="a", lease_s=60, clock=lambda: now[0])
+    b = WorkQueue(db, worker_id="b", lease_s=60, clock=lambda: now[0])
+    a.load([ValidatedIssue("Issue 0", "", {}, ())])
+    stolen: list[object] = []
+
+    def stall(seconds: float) -> None:
+        now[0] += seconds
+        stolen.extend(b.claim(5))  # another worker looking for expired leases meanwhile
+
+    budget = RateBudget(creates_per_minute=0, clock=lambda: now[0], sleep=stall)
+    budget.observe_headers({"Retry-After": "200"}, status=429, resource="core")
+    with HttpTransport(token="t", api_base=fake_github.url, budget=budget) as transport:
+        pipeline = _worker(a, transport, fake_github.project_id)
+        results = run_pipeline(
+            pipeline, pipeline.claimed(), reporter=JsonLinesReporter(io.StringIO())
+        )
+
+    assert now[0] >= 1200 and stolen == []
+    assert [r.status for r in results] == ["created"]
+    assert len(fake_github.issues) == 1 and a.stats()["done"] == 1
+
+
+def test_a_failed_issue_is_recorded_and_the_worker_moves_on(fake_github, tmp_path):
+    bad = ResolvedField("priority", "Priority", "F_missing", "OPT_0", "P0")
+    issues = [ValidatedIssue(f"Issue {i}", "", {}, (bad,) if i == 1 else ()) for i in range(3)]
+    with WorkQueue(tmp_path / "queue.db", worker_id="a") as queue:
+        queue.load(issues)
+        with HttpTransport(token="t", api_base=fake_github.url) as transport:
+            pipeline = _worker(queue, transport, fake_github.project_id)
+            results = run_pipeline(
+                pipeline, pipeline.claimed(), reporter=JsonLinesReporter(io.StringIO())
+            )
+        assert [r.title for r in results] == ["Issue 0", "Issue 2"]
+        # claimed again until it runs out of attempts, without holding up the others
+        assert pipeline.counts == {"created": 2, "failed": 3}
+        stats = queue.stats()
+        assert stats["done"] == 2 and stats["failed"] == 1
+        assert [title for title, _ in queue.failures()] == ["Issue 1"]
+    assert len(fake_github.issues) == 3  # the retries resumed after the recorded create
+
+
+def test_a_create_that_may_have_gone_through_is_not_claimed_again(fake_github, tmp_path):
+    handle = fake_github.handle
+
+    def create_then_502(method, target, body, host, if_none_match=None):
+        answer = handle(method, target, body, host, if_none_match)
+        first_create = fake_github.calls["create_issue"] == 1
+        if method == "POST" and target.endswith("/issues") and first_create:
+            return 502, {}, {"message": "Server Error"}  # the issue exists, the client never hears
+        return answer
+
+    fake_github.handle = create_then_502
+    with WorkQueue(tmp_path / "queue.db", worker_id="a") as queue:
+        queue.load([ValidatedIssue(f"Issue {i}", "", {}, ()) for i in range(2)])
+        with HttpTransport(token="t", api_base=fake_github.url) as transport:
+            pipeline = _worker(queue, transport, fake_github.project_id)
+            results = run_pipeline(
+                pipeline, pipeline.claimed(), reporter=JsonLinesReporter(io.StringIO())
+            )
+        assert [r.title for r in results] == ["Issue 1"]
+        assert fake_github.calls["create_issue"] == 2 and len(fake_github.issues) == 2
+        stats = queue.stats()
+        assert stats["needs_check"] == 1 and stats["done"] == 1 and stats["failed"] == 0
+        assert queue.claim(5, max_attempts=10) == []
+        [(title, error)] = queue.failures()
+        assert title == "Issue 0" and "check before rerunning" in error
+
+
+def test_workers_in_separate_processes_create_each_issue_once(fake_github, tmp_path):
+    issues = tmp_path / "issues.jsonl"
+    with issues.open("w", encoding="utf-8") as f:
+        for i in range(30):
+            row = {"title": f"Issue {i}", "description": ""}
+            row.update({k: f"{canonical} {i % 3}" for k, canonical in CANONICAL_FIELDS.items()})
+            f.write(json.dumps(row) + "\n")
+    fields, queue = str(tmp_path / "fields.json"), str(tmp_path / "queue.db")
+    assert cli.main(["load", "--issues", str(issues), "--fields", fields, "--queue", queue]) == 0
+
+    # a worker that died holding a lease: its issues go to the others once the lease runs out
+    with WorkQueue(queue, worker_id="dead", lease_s=0) as dead:
+        assert len(dead.claim(4)) == 4
+
+    argv = [
+        sys.executable, "-m", "gh_project_automation.cli", "work",
+        "--queue", queue,
+        "--fields", fields,
+        "--execute",
+        "--claim-size", "3",
+        "--concurrency", "2",
+        "--max-creates-per-minute", "0",
+        "--output", "jsonl",
+    ]  # fmt: skip
+    workers = [subprocess.Popen(argv, stdout=subprocess.PIPE, text=True) for _ in range(3)]
+    for w in workers:
+        out, _ = w.communicate(timeout=60)
+        assert w.returncode == 0, out
+
+    assert len(fake_github.issues) == 30 and len(fake_github.items) == 30
+    with WorkQueue(queue) as q:
+        assert q.stats()["done"] == 30
+    assert cli.main(["work", "--queue", queue, "--fields", fields, "--execute"]) == 0
+    assert len(fake_github.issues) == 30